@@ -98,14 +98,20 @@ class ChartContainer {
 
     async renderSingleMode(vizContent, options) {
         const filteredData = await dataLoader.loadFiltered();
-        const groupedData = dataLoader.groupByUniversity(filteredData);
+
+        // Standard-Ansicht: Reihen kommen fertig gruppiert und sortiert,
+        // Heatmap-Farbstufen vorberechnet (wenn alle Jahre ausgewählt sind)
+        const kennzahlCode = state.get('selectedKennzahl');
+        const view = await dataLoader.loadViewData(kennzahlCode);
+        const tiles = view ? await dataLoader.loadTiles(kennzahlCode) : null;
+        const groupedData = view ? view.grouped : dataLoader.groupByUniversity(filteredData);
 
         // Neue Visualization erstellen via Factory
         this.currentViz = VizFactory.create(
             this.vizType,
             vizContent,
             groupedData,
-            options
+            { ...options, view, tiles }
         );
 
         this.currentViz.render();
@@ -115,16 +121,22 @@ class ChartContainer {
     async renderDualMode(vizContent, combinationType, options) {
         const dualData = await dataLoader.loadDualFiltered();
 
-        // Gruppierte Daten vorbereiten
+        // Gruppierte Daten vorbereiten (aus den Standard-Ansichten, falls passend)
+        const [primaryView, secondaryView] = await Promise.all([
+            dataLoader.loadViewData(state.get('selectedKennzahl')),
+            dualData.secondary ? dataLoader.loadViewData(state.get('secondaryKennzahl')) : null
+        ]);
         const dualGrouped = {
-            primaryGrouped: dataLoader.groupByUniversity(dualData.primary),
-            secondaryGrouped: dataLoader.groupByUniversity(dualData.secondary),
-            merged: dualData.merged
+            primaryGrouped: primaryView?.grouped || dataLoader.groupByUniversity(dualData.primary),
+            secondaryGrouped: secondaryView?.grouped || dataLoader.groupByUniversity(dualData.secondary),
+            merged: dualData.merged,
+            partners: dualData.partners || []
         };
 
         // Bei Ratio: Verhaeltnis berechnen und gruppieren
         if (combinationType === 'ratio') {
-            const ratioData = dataLoader.calculateRatio(dualData.primary, dualData.secondary);
+            const ratioData = dualData.ratio ||
+                dataLoader.calculateRatio(dualData.primary, dualData.secondary);
             dualGrouped.ratioGrouped = dataLoader.groupByUniversity(ratioData);
         }
 
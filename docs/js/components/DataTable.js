@@ -14,13 +14,14 @@ import { log } from '../core/logger.js';
 import { dataLoader } from '../data/dataLoader.js';
 import { UNI_BY_CODE, KENNZAHL_BY_CODE, formatValue } from '../data/metadata.js';
 import { getUniColor } from '../utils/colorUtils.js';
-import { createSparkline, groupDataByUni } from '../visualizations/SparklineRenderer.js';
+import { createSparkline, createSparklineFromTile, groupDataByUni } from '../visualizations/SparklineRenderer.js';
 import { exportDataAsCsv, exportDataAsExcel, exportDataAsJson } from '../utils/exportUtils.js';
 
 class DataTable {
     constructor(container) {
         this.container = container;
         this.data = [];
+        this.tiles = null;
         this.sortColumn = 'year';
         this.sortDirection = 'desc';
         this.currentPage = 1;
@@ -145,7 +146,10 @@ class DataTable {
 
     async loadData() {
         try {
-            this.data = await dataLoader.loadFiltered();
+            [this.data, this.tiles] = await Promise.all([
+                dataLoader.loadFiltered(),
+                dataLoader.loadTiles(state.get('selectedKennzahl'))
+            ]);
             this.renderTable();
         } catch (error) {
             log.error('DataTable', 'Fehler beim Laden der Daten', error);
@@ -158,8 +162,9 @@ class DataTable {
         const paginated = this.getPaginatedData(sorted);
         const kennzahl = KENNZAHL_BY_CODE[state.get('selectedKennzahl')];
 
-        // Gruppiere alle Daten für Sparklines
-        const groupedData = groupDataByUni(this.data);
+        // Sparklines: vorberechnete Stufen, sonst alle Daten gruppieren
+        const tiles = this.tiles;
+        const groupedData = tiles ? null : groupDataByUni(this.data);
 
         // Table Body
         const tbody = this.container.querySelector('#tableBody');
@@ -185,8 +190,11 @@ class DataTable {
             // Sparklines rendern
             tbody.querySelectorAll('.sparkline-cell').forEach(cell => {
                 const uniCode = cell.dataset.uni;
-                const uniData = groupedData.get(uniCode);
-                if (uniData) {
+                const tile = tiles?.sparkline(uniCode);
+                const uniData = groupedData?.get(uniCode);
+                if (tile) {
+                    createSparklineFromTile(cell, tile, tiles.maxLevel, uniCode);
+                } else if (uniData) {
                     createSparkline(cell, uniData, uniCode);
                 }
             });
@@ -14,6 +14,14 @@ import { log } from '../core/logger.js';
 import { dataLoader } from '../data/dataLoader.js';
 import { UNI_BY_CODE, KENNZAHL_BY_CODE, UNIVERSITIES, formatValue } from '../data/metadata.js';
 
+// Bezeichnungen der Pipeline-Prüfungen (scripts/anomalies.py)
+const ANOMALY_CHECKS = {
+    yoy: 'Ungewöhnliche Veränderung zum Vorjahr',
+    mad: 'Ausreißer gegenüber den anderen Universitäten',
+    consistency: 'Widerspruch zu verwandter Kennzahl',
+    ratio: 'Ungewöhnliches Verhältnis zu verwandter Kennzahl'
+};
+
 // Report-Templates (R3)
 const REPORT_TEMPLATES = {
     summary: {
@@ -87,6 +95,9 @@ Identifiziere auffällige Werte in den folgenden Wissensbilanz-Daten.
 **Alle Datenpunkte:**
 ${context.dataPoints}
 
+**Automatisch markierte Punkte (Plausibilitätsprüfung):**
+${context.flaggedPoints}
+
 Finde und erkläre:
 1. Werte, die mehr als 1,5 Standardabweichungen vom Durchschnitt entfernt sind
 2. Unerwartete Sprünge zwischen Jahren
@@ -234,7 +245,9 @@ class ReportPanel {
         try {
             // Daten laden
             const filteredData = await dataLoader.loadFiltered();
-            const context = this.buildContext(filteredData);
+            const filterState = state.getFilterState();
+            const anomalies = await dataLoader.getAnomalies(filterState.kennzahl, filterState);
+            const context = this.buildContext(filteredData, anomalies);
 
             // Source Block aktualisieren
             this.updateSourceBlock(context);
@@ -265,7 +278,7 @@ class ReportPanel {
         }
     }
 
-    buildContext(data) {
+    buildContext(data, anomalies = []) {
         const filterState = state.getFilterState();
         const kennzahl = KENNZAHL_BY_CODE[filterState.kennzahl];
         const stats = state.get('dataStats');
@@ -296,6 +309,16 @@ class ReportPanel {
         const mean = values.reduce((a, b) => a + b, 0) / values.length;
         const stdDev = Math.sqrt(values.reduce((sum, v) => sum + Math.pow(v - mean, 2), 0) / values.length);
 
+        // Vorberechnete Auffälligkeiten aus der Pipeline (scripts/anomalies.py)
+        const flaggedPoints = anomalies.map(flag => {
+            const uni = UNI_BY_CODE[flag.uniCode];
+            const check = ANOMALY_CHECKS[flag.check.split(':')[0]] || flag.check;
+            // Konsistenz-Prüfungen haben keinen Score (null)
+            const score = flag.score !== null ? `, Score ${flag.score}` : '';
+            return `${uni?.shortName || flag.uniCode} (${flag.year}): ${check}${score} ` +
+                `(Wert ${formatValue(flag.value, kennzahl?.unit)}, Referenz ${formatValue(flag.reference, kennzahl?.unit)})`;
+        }).join('\n');
+
         return {
             kennzahl,
             yearRange: filterState.yearRange,
@@ -307,6 +330,7 @@ class ReportPanel {
             average: formatValue(stats.average, kennzahl?.unit),
             trend: stats.trend,
             stdDev: formatValue(stdDev, kennzahl?.unit),
+            flaggedPoints: flaggedPoints || 'Keine',
             sourceInfo: {
                 kennzahl: kennzahl?.code,
                 universities: universities.map(u => u.code),
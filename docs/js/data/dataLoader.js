@@ -3,9 +3,24 @@
  *
  * Lädt JSON-Daten bei Bedarf und cached sie im Memory.
  * Unterstützt Filterung und Aggregation.
+ *
+ * Reihenfolge beim Laden einer Kennzahl (alle von scripts/convert.py erzeugt):
+ *   1. Bundle aller Kennzahlen (data/json/bundle/, ein Request für alles)
+ *   2. Kompaktes Spalten-Format (data/json/columnar/)
+ *   3. Array-Format (data/json/*.json)
+ *
+ * Vorberechnete Aggregate (Cube: Jahr x Uni-Typ) liefern Statistiken,
+ * wenn die Auswahl ganzen Uni-Typen entspricht. Für die Standard-Ansichten
+ * (alle Unis, ein Uni-Typ, VetMed) kommen die Chart-Reihen fertig gruppiert
+ * und sortiert aus data/json/views/, Sparklines und Heatmap-Farbstufen
+ * quantisiert aus data/json/tiles/ (Binärdatei mit JSON-Index).
+ * Die Join-Tabelle verbindet zwei Kennzahlen im Dual-Mode per Index
+ * statt per Map-Lookup.
+ * Der Plausibilitäts-Report (data/json/anomalies/) enthält die in der
+ * Pipeline markierten Auffälligkeiten und wird erst bei Bedarf geladen.
  */
 
-import { KENNZAHL_BY_CODE, UNI_BY_CODE } from './metadata.js';
+import { KENNZAHL_BY_CODE, UNI_BY_CODE, UNIVERSITIES_BY_TYPE } from './metadata.js';
 import { eventBus, EVENTS } from '../core/eventBus.js';
 import { state } from '../core/state.js';
 import { log } from '../core/logger.js';
@@ -14,6 +29,16 @@ class DataLoader {
     constructor() {
         this.cache = new Map();
         this.basePath = './data/json/';
+        this.columnarPath = 'columnar/';
+        this.cubePath = 'cube/';
+        this.viewsPath = 'views/';
+        this.tilesPath = 'tiles/';
+        this.joinPath = 'join/kennzahlen.json';
+        this.preferColumnar = true;
+        this.bundlePath = 'bundle/kennzahlen.ndjson';
+        this.useBundle = true;
+        this.bundlePromise = null;
+        this.anomalyPath = 'anomalies/report.json';
     }
 
     /**
@@ -35,12 +60,7 @@ class DataLoader {
         eventBus.emit(EVENTS.DATA_LOADING, { kennzahl: kennzahlCode });
 
         try {
-            const response = await fetch(`${this.basePath}${kennzahl.filename}`);
-            if (!response.ok) {
-                throw new Error(`HTTP ${response.status}`);
-            }
-
-            const data = await response.json();
+            const data = await this.fetchKennzahlData(kennzahl);
             this.cache.set(kennzahlCode, data);
 
             eventBus.emit(EVENTS.DATA_LOADED, { kennzahl: kennzahlCode, count: data.length });
@@ -60,6 +80,138 @@ class DataLoader {
         }
     }
 
+    /**
+     * Holt die Datenpunkte einer Kennzahl vom Server
+     * Versucht zuerst das Spalten-Format, dann das Array-Format
+     * @param {Object} kennzahl - Kennzahl aus metadata.js
+     * @returns {Promise<Array>} Datenpunkte
+     */
+    async fetchKennzahlData(kennzahl) {
+        if (this.useBundle) {
+            const bundle = await this.loadBundle();
+            const data = bundle ? this.readFromBundle(bundle, kennzahl.code) : null;
+            if (data) {
+                return data;
+            }
+        }
+
+        if (this.preferColumnar) {
+            try {
+                const response = await fetch(`${this.basePath}${this.columnarPath}${kennzahl.filename}`);
+                if (response.ok) {
+                    return this.expandColumnar(await response.json());
+                }
+            } catch (error) {
+                // Kein Spalten-Format verfügbar, Array-Format versuchen
+            }
+        }
+
+        const response = await fetch(`${this.basePath}${kennzahl.filename}`);
+        if (!response.ok) {
+            throw new Error(`HTTP ${response.status}`);
+        }
+        return response.json();
+    }
+
+    /**
+     * Lädt das Bundle aller Kennzahlen (nur einmal, auch bei parallelen Aufrufen)
+     * @returns {Promise<Object|null>} { header, bytes, bodyStart } oder null
+     */
+    loadBundle() {
+        if (!this.bundlePromise) {
+            this.bundlePromise = this.fetchBundle().catch(error => {
+                log.warn('DataLoader', `Bundle not available (${error.message}), loading single files`);
+                return null;
+            });
+        }
+        return this.bundlePromise;
+    }
+
+    /**
+     * Holt das Bundle, bevorzugt die gzip-Variante (DecompressionStream)
+     * Header-Zeile: { format, version, dataVersion, index: { code: { offset, length } } }
+     * @returns {Promise<Object>} { header, bytes, bodyStart }
+     */
+    async fetchBundle() {
+        const url = `${this.basePath}${this.bundlePath}`;
+        let bytes = null;
+
+        if (typeof DecompressionStream !== 'undefined') {
+            try {
+                const response = await fetch(`${url}.gz`);
+                if (response.ok) {
+                    const stream = response.body.pipeThrough(new DecompressionStream('gzip'));
+                    bytes = new Uint8Array(await new Response(stream).arrayBuffer());
+                }
+            } catch (error) {
+                // z.B. Server dekomprimiert bereits selbst - unkomprimiert versuchen
+                bytes = null;
+            }
+        }
+
+        if (!bytes) {
+            const response = await fetch(url);
+            if (!response.ok) {
+                throw new Error(`HTTP ${response.status}`);
+            }
+            bytes = new Uint8Array(await response.arrayBuffer());
+        }
+
+        const headerEnd = bytes.indexOf(10); // '\n'
+        const header = JSON.parse(new TextDecoder().decode(bytes.subarray(0, headerEnd)));
+        if (header.format !== 'bundle') {
+            throw new Error('Ungültiges Bundle-Format');
+        }
+
+        log.info('DataLoader', `Bundle ${header.dataVersion} loaded: ${Object.keys(header.index).length} kennzahlen`);
+        return { header, bytes, bodyStart: headerEnd + 1 };
+    }
+
+    /**
+     * Parst nur den Abschnitt einer Kennzahl aus dem Bundle
+     * @param {Object} bundle - Ergebnis von loadBundle()
+     * @param {string} kennzahlCode - Kennzahl-Code
+     * @returns {Array|null} Datenpunkte oder null wenn nicht enthalten
+     */
+    readFromBundle(bundle, kennzahlCode) {
+        const entry = bundle.header.index[kennzahlCode];
+        if (!entry) {
+            return null;
+        }
+
+        const start = bundle.bodyStart + entry.offset;
+        const slice = bundle.bytes.subarray(start, start + entry.length);
+        return this.expandColumnar(JSON.parse(new TextDecoder().decode(slice)));
+    }
+
+    /**
+     * Expandiert das Spalten-Format in Datenpunkte
+     * mask: '1' = Wert, '0' = null, '.' = kein Datenpunkt
+     * @param {Object} payload - { kennzahl, unis, years, values, mask }
+     * @returns {Array} Datenpunkte { uniCode, year, value, kennzahl }
+     */
+    expandColumnar(payload) {
+        const { kennzahl, unis, years, values, mask } = payload;
+        const data = [];
+
+        unis.forEach((uniCode, u) => {
+            years.forEach((year, y) => {
+                const idx = u * years.length + y;
+                const flag = mask[idx];
+                if (flag === '.') return;
+
+                data.push({
+                    uniCode,
+                    year,
+                    value: flag === '1' ? values[idx] : null,
+                    kennzahl
+                });
+            });
+        });
+
+        return data;
+    }
+
     /**
      * Lädt und filtert Daten basierend auf aktuellem State
      * @returns {Promise<Array>} Gefilterte Datenpunkte
@@ -68,7 +220,203 @@ class DataLoader {
         const filterState = state.getFilterState();
         const data = await this.loadKennzahl(filterState.kennzahl);
 
-        const filtered = data.filter(point => {
+        const filtered = data.filter(this.createFilterFn(filterState));
+
+        // Statistiken berechnen (aus dem Cube, falls die Auswahl passt)
+        await this.updateStats(filterState, filtered);
+        state.set('filteredData', filtered);
+
+        return filtered;
+    }
+
+    // ========================================
+    // AGGREGAT-CUBE
+    // ========================================
+
+    /**
+     * Lädt den vorberechneten Aggregat-Cube einer Kennzahl
+     * Format: { years, types: { typ: { sum, mean, count, min, max } }, deltas }
+     * @param {string} kennzahlCode - Kennzahl-Code
+     * @returns {Promise<Object|null>} Cube oder null wenn nicht verfügbar
+     */
+    async loadCube(kennzahlCode) {
+        return this.loadDerived(kennzahlCode, 'cube', this.cubePath);
+    }
+
+    /**
+     * Lädt eine abgeleitete Datei einer Kennzahl (Bundle-Abschnitt oder Einzeldatei)
+     * @param {string} kennzahlCode - Kennzahl-Code
+     * @param {string} key - Schlüssel im Bundle-Index ('cube' | 'views')
+     * @param {string} path - Unterverzeichnis der Einzeldateien
+     * @returns {Promise<Object|null>} Inhalt oder null wenn nicht verfügbar
+     */
+    async loadDerived(kennzahlCode, key, path) {
+        const cacheKey = `_${key}_${kennzahlCode}`;
+        if (this.cache.has(cacheKey)) {
+            return this.cache.get(cacheKey);
+        }
+
+        const kennzahl = KENNZAHL_BY_CODE[kennzahlCode];
+        let payload = null;
+
+        if (this.useBundle) {
+            const bundle = await this.loadBundle();
+            const entry = bundle?.header.index[kennzahlCode]?.[key];
+            if (entry) {
+                const start = bundle.bodyStart + entry.offset;
+                payload = JSON.parse(new TextDecoder().decode(bundle.bytes.subarray(start, start + entry.length)));
+            }
+        }
+
+        if (!payload && kennzahl) {
+            try {
+                const response = await fetch(`${this.basePath}${path}${kennzahl.filename}`);
+                if (response.ok) {
+                    payload = await response.json();
+                }
+            } catch (error) {
+                payload = null;
+            }
+        }
+
+        this.cache.set(cacheKey, payload);
+        return payload;
+    }
+
+    /**
+     * Prüft, ob ein Filter exakt ganzen Uni-Typen entspricht
+     * @param {Object} filterState - Filter-State
+     * @returns {Array|null} Typ-IDs (oder ['all']), null wenn nicht abbildbar
+     */
+    findCubeTypes(filterState) {
+        const { universities, uniTypes } = filterState;
+
+        if (universities.length === 0) {
+            return uniTypes.length > 0 ? [...uniTypes] : ['all'];
+        }
+        if (uniTypes.length > 0) {
+            return null;
+        }
+
+        const selected = new Set(universities);
+        const types = Object.entries(UNIVERSITIES_BY_TYPE)
+            .filter(([, unis]) => unis.length > 0 && unis.every(u => selected.has(u.code)))
+            .map(([typeId]) => typeId);
+
+        const covered = types.reduce((sum, typeId) => sum + UNIVERSITIES_BY_TYPE[typeId].length, 0);
+        return covered === selected.size ? types : null;
+    }
+
+    /**
+     * Berechnet dataStats aus dem Cube (gleiche Semantik wie state.calculateStats)
+     * @param {Object} cube - Aggregat-Cube
+     * @param {Array} typeIds - Uni-Typen (oder ['all'])
+     * @param {Object} yearRange - { start, end }
+     * @returns {Object} { totalPoints, average, trend }
+     */
+    cubeStats(cube, typeIds, yearRange) {
+        const byYear = this.cubeAggregateByYear(cube, typeIds, 'average', yearRange)
+            .filter(d => d.count > 0);
+
+        const totalPoints = byYear.reduce((sum, d) => sum + d.count, 0);
+        if (totalPoints === 0) {
+            return { totalPoints: 0, average: 0, trend: 0 };
+        }
+
+        const average = byYear.reduce((sum, d) => sum + d.sum, 0) / totalPoints;
+
+        let trend = 0;
+        if (byYear.length >= 2) {
+            const firstAvg = byYear[0].value;
+            const lastAvg = byYear[byYear.length - 1].value;
+            if (firstAvg !== 0) {
+                trend = ((lastAvg - firstAvg) / firstAvg) * 100;
+            } else if (lastAvg > 0) {
+                trend = 100;
+            } else if (lastAvg < 0) {
+                trend = -100;
+            }
+        }
+
+        return {
+            totalPoints,
+            average: Math.round(average * 10) / 10,
+            trend: Math.round(trend * 10) / 10
+        };
+    }
+
+    /**
+     * Aggregiert nach Jahr aus dem Cube (Gegenstück zu aggregateByYear)
+     * @param {Object} cube - Aggregat-Cube
+     * @param {Array} typeIds - Uni-Typen (oder ['all'])
+     * @param {string} aggregation - 'sum' | 'average' | 'count' | 'min' | 'max'
+     * @param {Object} yearRange - { start, end } (optional)
+     * @returns {Array} [{ year, value, sum, count }] aufsteigend nach Jahr
+     */
+    cubeAggregateByYear(cube, typeIds, aggregation = 'sum', yearRange = null) {
+        const result = [];
+
+        cube.years.forEach((year, i) => {
+            if (yearRange && (year < yearRange.start || year > yearRange.end)) {
+                return;
+            }
+
+            const cells = typeIds.map(typeId => cube.types[typeId]).filter(Boolean);
+            const sum = cells.reduce((acc, t) => acc + t.sum[i], 0);
+            const count = cells.reduce((acc, t) => acc + t.count[i], 0);
+            const mins = cells.map(t => t.min[i]).filter(v => v !== null);
+            const maxs = cells.map(t => t.max[i]).filter(v => v !== null);
+
+            let value;
+            switch (aggregation) {
+                case 'sum':
+                    value = sum;
+                    break;
+                case 'average':
+                    value = count > 0 ? sum / count : null;
+                    break;
+                case 'count':
+                    value = count;
+                    break;
+                case 'min':
+                    value = mins.length > 0 ? Math.min(...mins) : null;
+                    break;
+                case 'max':
+                    value = maxs.length > 0 ? Math.max(...maxs) : null;
+                    break;
+                default:
+                    value = null;
+            }
+
+            result.push({ year, value, sum, count });
+        });
+
+        return result;
+    }
+
+    /**
+     * Aktualisiert dataStats: aus dem Cube wenn möglich, sonst aus den Punkten
+     * @param {Object} filterState - Filter-State
+     * @param {Array} filtered - Gefilterte Datenpunkte (Fallback)
+     */
+    async updateStats(filterState, filtered) {
+        const typeIds = this.findCubeTypes(filterState);
+        const cube = typeIds ? await this.loadCube(filterState.kennzahl) : null;
+
+        if (cube) {
+            state.set('dataStats', this.cubeStats(cube, typeIds, filterState.yearRange));
+        } else {
+            state.calculateStats(filtered);
+        }
+    }
+
+    /**
+     * Erstellt die Filterfunktion für einen Filter-State
+     * @param {Object} filterState - { universities, uniTypes, yearRange }
+     * @returns {Function} (point) => boolean
+     */
+    createFilterFn(filterState) {
+        return (point) => {
             // Universitäten filtern
             if (filterState.universities.length > 0) {
                 if (!filterState.universities.includes(point.uniCode)) {
@@ -91,13 +439,7 @@ class DataLoader {
             }
 
             return true;
-        });
-
-        // Statistiken berechnen
-        state.calculateStats(filtered);
-        state.set('filteredData', filtered);
-
-        return filtered;
+        };
     }
 
     /**
@@ -201,6 +543,171 @@ class DataLoader {
         return data;
     }
 
+    // ========================================
+    // CHART-ANSICHTEN
+    // ========================================
+
+    /**
+     * Lädt die vorbereiteten Chart-Reihen einer Kennzahl
+     * Format: { years, unis, values, mask, views: { ansicht: { rows, mean, min, max, ranking } } }
+     * @param {string} kennzahlCode - Kennzahl-Code
+     * @returns {Promise<Object|null>} Ansichten oder null wenn nicht verfügbar
+     */
+    async loadViews(kennzahlCode) {
+        return this.loadDerived(kennzahlCode, 'views', this.viewsPath);
+    }
+
+    /**
+     * Ordnet einen Filter einer Standard-Ansicht zu
+     * @param {Object} filterState - Filter-State
+     * @returns {string|null} 'all', Uni-Typ oder 'vetmed'; null wenn nicht abbildbar
+     */
+    findView(filterState) {
+        const { universities, uniTypes } = filterState;
+
+        if (universities.length === 0) {
+            if (uniTypes.length === 0) return 'all';
+            return uniTypes.length === 1 ? uniTypes[0] : null;
+        }
+        if (uniTypes.length > 0) {
+            return null;
+        }
+        if (universities.length === 1 && universities[0] === 'UI') {
+            return 'vetmed';
+        }
+
+        const types = this.findCubeTypes(filterState);
+        if (types?.length === Object.keys(UNIVERSITIES_BY_TYPE).length) return 'all';
+        return types?.length === 1 ? types[0] : null;
+    }
+
+    /**
+     * Liefert die Chart-Daten einer Standard-Ansicht für einen Jahresbereich
+     * @param {Object} views - Ergebnis von loadViews()
+     * @param {string} viewId - Ansicht (siehe findView)
+     * @param {Object} yearRange - { start, end }
+     * @returns {Object|null} { id, grouped, years, valueRange, rankings, mean, peerMean }
+     *   grouped hat dieselbe Form wie groupByUniversity(), in Heatmap-Reihenfolge
+     */
+    viewData(views, viewId, yearRange) {
+        const view = views.views[viewId];
+        if (!view) {
+            return null;
+        }
+
+        const positions = views.years
+            .map((year, y) => ({ year, y }))
+            .filter(({ year }) => year >= yearRange.start && year <= yearRange.end);
+
+        const grouped = {};
+        view.rows.forEach(row => {
+            const uniCode = views.unis[row];
+            const data = positions
+                .filter(({ y }) => views.mask[row * views.years.length + y] !== '.')
+                .map(({ year, y }) => ({ year, value: views.values[row][y] }));
+            if (data.length > 0) {
+                grouped[uniCode] = { university: UNI_BY_CODE[uniCode], data };
+            }
+        });
+
+        const mins = positions.map(({ y }) => view.min[y]).filter(v => v !== null);
+        const maxs = positions.map(({ y }) => view.max[y]).filter(v => v !== null);
+        const rankings = {};
+        positions.forEach(({ year, y }) => {
+            rankings[year] = view.ranking[y].map(row => views.unis[row]);
+        });
+
+        return {
+            id: viewId,
+            grouped,
+            years: positions.map(({ year }) => year),
+            valueRange: { min: Math.min(...mins), max: Math.max(...maxs) },
+            rankings,
+            mean: positions.map(({ year, y }) => ({ year, value: view.mean[y] })),
+            peerMean: view.peerMean
+                ? positions.map(({ year, y }) => ({ year, value: view.peerMean[y] }))
+                : null
+        };
+    }
+
+    /**
+     * Chart-Daten für Kennzahl und Filter, wenn eine Standard-Ansicht passt
+     * @param {string} kennzahlCode - Kennzahl-Code
+     * @param {Object} filterState - Filter-State
+     * @returns {Promise<Object|null>} Siehe viewData(), null wenn nicht abbildbar
+     */
+    async loadViewData(kennzahlCode, filterState = state.getFilterState()) {
+        const viewId = this.findView(filterState);
+        const views = viewId ? await this.loadViews(kennzahlCode) : null;
+        return views ? this.viewData(views, viewId, filterState.yearRange) : null;
+    }
+
+    /**
+     * Lädt Index und Binärdatei der Sparklines/Heatmap-Farbstufen (einmalig)
+     * @returns {Promise<Object|null>} { index, buffer } oder null
+     */
+    async loadTileSet() {
+        if (this.cache.has('_tiles')) {
+            return this.cache.get('_tiles');
+        }
+
+        let tiles = null;
+        try {
+            const [indexResponse, blobResponse] = await Promise.all([
+                fetch(`${this.basePath}${this.tilesPath}index.json`),
+                fetch(`${this.basePath}${this.tilesPath}tiles.bin`)
+            ]);
+            if (indexResponse.ok && blobResponse.ok) {
+                tiles = { index: await indexResponse.json(), buffer: await blobResponse.arrayBuffer() };
+            }
+        } catch (error) {
+            tiles = null;
+        }
+
+        this.cache.set('_tiles', tiles);
+        return tiles;
+    }
+
+    /**
+     * Vorberechnete Sparklines und Heatmap-Farbstufen einer Kennzahl
+     * Nur verfügbar, wenn der Jahresbereich alle Jahre der Kennzahl umfasst
+     * (die Stufen sind auf Min/Max über alle Jahre normiert).
+     * @param {string} kennzahlCode - Kennzahl-Code
+     * @param {Object} yearRange - { start, end }
+     * @returns {Promise<Object|null>} { years, maxLevel, bins, sparkline(uniCode), heatmap(viewId) }
+     */
+    async loadTiles(kennzahlCode, yearRange = state.get('yearRange')) {
+        const tiles = await this.loadTileSet();
+        const entry = tiles?.index.kennzahlen[kennzahlCode];
+        if (!entry || entry.years.some(year => year < yearRange.start || year > yearRange.end)) {
+            return null;
+        }
+
+        const { buffer, index } = tiles;
+        const LevelArray = index.sparklineBits === 16 ? Uint16Array : Uint8Array;
+        const sparklines = new LevelArray(buffer, entry.sparklines.offset, entry.sparklines.length);
+        const trend = new Int8Array(buffer, entry.trend.offset, entry.trend.length);
+        const rows = new Map(entry.unis.map((uniCode, row) => [uniCode, row]));
+        const n = entry.years.length;
+
+        return {
+            years: entry.years,
+            maxLevel: 2 ** index.sparklineBits - 1,
+            bins: index.heatmapBins,
+            sparkline: (uniCode) => {
+                const row = rows.get(uniCode);
+                return row === undefined ? null : {
+                    levels: sparklines.subarray(row * n, (row + 1) * n),
+                    trend: trend[row]
+                };
+            },
+            heatmap: (viewId) => {
+                const section = entry.heatmap[viewId];
+                return section ? new Uint8Array(buffer, section.offset, section.length) : null;
+            }
+        };
+    }
+
     // ========================================
     // DUAL-MODE METHODEN
     // ========================================
@@ -227,36 +734,174 @@ class DataLoader {
         ]);
 
         // Filter anwenden
-        const filterFn = (point) => {
-            if (filterState.universities.length > 0) {
-                if (!filterState.universities.includes(point.uniCode)) {
-                    return false;
-                }
+        const filterFn = this.createFilterFn(filterState);
+        const primary = primaryRaw.filter(filterFn);
+        const secondary = secondaryRaw.filter(filterFn);
+
+        // Merge für Korrelation (Scatter) und Verhältnis (Ratio):
+        // per Index über die Join-Tabelle, sonst per Map-Lookup
+        const join = await this.loadJoinTable();
+        const joined = join ? this.joinByIndex(join, primaryCode, secondaryCode, filterFn) : null;
+        const merged = joined ? joined.merged : this.mergeDataForCorrelation(primary, secondary);
+        const ratio = joined ? joined.ratio : null;
+        const partners = join ? this.getCorrelationPartners(join, primaryCode) : [];
+
+        // Stats berechnen (nur für Primary)
+        await this.updateStats(filterState, primary);
+        state.set('filteredData', primary);
+
+        return { primary, secondary, merged, ratio, partners };
+    }
+
+    /**
+     * Lädt die Join-Tabelle aller Kennzahlen (Bundle oder Einzeldatei)
+     * Format: { uniCodes, years, columns: { code: [Werte] }, correlations }
+     * @returns {Promise<Object|null>} Join-Tabelle oder null
+     */
+    async loadJoinTable() {
+        if (this.cache.has('_join')) {
+            return this.cache.get('_join');
+        }
+
+        let join = null;
+
+        if (this.useBundle) {
+            const bundle = await this.loadBundle();
+            const entry = bundle?.header.join;
+            if (entry) {
+                const start = bundle.bodyStart + entry.offset;
+                join = JSON.parse(new TextDecoder().decode(bundle.bytes.subarray(start, start + entry.length)));
             }
-            if (filterState.uniTypes.length > 0) {
-                const uni = UNI_BY_CODE[point.uniCode];
-                if (!uni || !filterState.uniTypes.includes(uni.type)) {
-                    return false;
+        }
+
+        if (!join) {
+            try {
+                const response = await fetch(`${this.basePath}${this.joinPath}`);
+                if (response.ok) {
+                    join = await response.json();
                 }
+            } catch (error) {
+                join = null;
             }
-            if (point.year < filterState.yearRange.start ||
-                point.year > filterState.yearRange.end) {
-                return false;
+        }
+
+        this.cache.set('_join', join);
+        return join;
+    }
+
+    /**
+     * Verbindet zwei Kennzahlen per Index auf der gemeinsamen Schlüssel-Achse
+     * Liefert dieselben Strukturen wie mergeDataForCorrelation/calculateRatio
+     * @param {Object} join - Join-Tabelle
+     * @param {string} primaryCode - Primäre Kennzahl (x / Zähler)
+     * @param {string} secondaryCode - Sekundäre Kennzahl (y / Nenner)
+     * @param {Function} filterFn - Filterfunktion aus createFilterFn
+     * @returns {Object|null} { merged, ratio } oder null wenn Spalten fehlen
+     */
+    joinByIndex(join, primaryCode, secondaryCode, filterFn) {
+        const xs = join.columns[primaryCode];
+        const ys = join.columns[secondaryCode];
+        if (!xs || !ys) {
+            return null;
+        }
+
+        const merged = [];
+        const ratio = [];
+
+        for (let i = 0; i < join.years.length; i++) {
+            const x = xs[i];
+            const y = ys[i];
+            if (x === null) continue;
+
+            const point = { uniCode: join.uniCodes[i], year: join.years[i] };
+            if (y === null || !filterFn(point)) continue;
+
+            merged.push({
+                x,
+                y,
+                uniCode: point.uniCode,
+                year: point.year,
+                university: UNI_BY_CODE[point.uniCode]
+            });
+
+            if (y !== 0) {
+                ratio.push({
+                    uniCode: point.uniCode,
+                    year: point.year,
+                    value: x / y,
+                    primaryValue: x,
+                    secondaryValue: y
+                });
             }
-            return true;
-        };
+        }
 
-        const primary = primaryRaw.filter(filterFn);
-        const secondary = secondaryRaw.filter(filterFn);
+        return { merged, ratio };
+    }
 
-        // Merge für Korrelation (Scatter)
-        const merged = this.mergeDataForCorrelation(primary, secondary);
+    /**
+     * Rangiert alle anderen Kennzahlen nach Stärke der Korrelation
+     * @param {Object} join - Join-Tabelle
+     * @param {string} kennzahlCode - Bezugs-Kennzahl
+     * @param {string} method - 'pearson' | 'spearman'
+     * @param {number} limit - Maximale Anzahl
+     * @returns {Array} [{ code, r, n }] nach |r| absteigend
+     */
+    getCorrelationPartners(join, kennzahlCode, method = 'pearson', limit = 5) {
+        const { kennzahlen, n } = join.correlations;
+        const matrix = join.correlations[method];
+        const row = kennzahlen.indexOf(kennzahlCode);
+        if (row < 0 || !matrix) {
+            return [];
+        }
 
-        // Stats berechnen (nur für Primary)
-        state.calculateStats(primary);
-        state.set('filteredData', primary);
+        return kennzahlen
+            .map((code, col) => ({ code, r: matrix[row][col], n: n[row][col] }))
+            .filter(p => p.code !== kennzahlCode && p.r !== null)
+            .sort((a, b) => Math.abs(b.r) - Math.abs(a.r))
+            .slice(0, limit);
+    }
+
+    /**
+     * Lädt den Plausibilitäts-Report der Pipeline (scripts/anomalies.py)
+     * Format: { fields, flags: { code: [[uniCode, year, check, score, value, reference]] }, counts }
+     * @returns {Promise<Object|null>} Report oder null
+     */
+    async loadAnomalies() {
+        if (this.cache.has('_anomalies')) {
+            return this.cache.get('_anomalies');
+        }
+
+        let report = null;
+        try {
+            const response = await fetch(`${this.basePath}${this.anomalyPath}`);
+            if (response.ok) {
+                report = await response.json();
+            }
+        } catch (error) {
+            report = null;
+        }
+
+        this.cache.set('_anomalies', report);
+        return report;
+    }
+
+    /**
+     * Markierte Punkte einer Kennzahl für die aktuelle Filterauswahl
+     * @param {string} kennzahlCode - Kennzahl-Code
+     * @param {Object} filterState - Filter-State (Unis, Uni-Typen, Zeitraum)
+     * @returns {Promise<Array>} [{ uniCode, year, check, score, value, reference }]
+     */
+    async getAnomalies(kennzahlCode, filterState = state.getFilterState()) {
+        const report = await this.loadAnomalies();
+        const entries = report?.flags[kennzahlCode];
+        if (!entries) {
+            return [];
+        }
 
-        return { primary, secondary, merged };
+        const filterFn = this.createFilterFn(filterState);
+        return entries
+            .map(entry => Object.fromEntries(report.fields.map((field, i) => [field, entry[i]])))
+            .filter(flag => filterFn(flag));
     }
 
     /**
@@ -334,6 +979,7 @@ class DataLoader {
      */
     clearCache() {
         this.cache.clear();
+        this.bundlePromise = null;
     }
 
     /**
@@ -124,7 +124,7 @@ export const KENNZAHL_CATEGORIES = {
 
 /**
  * Kennzahlen - Abgestimmt auf die generierten JSON-Dateien
- * Dateinamen entsprechen dem Output von convert_excel_to_json.py
+ * Dateinamen entsprechen dem Output von convert.py
  */
 export const KENNZAHLEN = [
     // Personal (5)
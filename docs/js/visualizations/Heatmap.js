@@ -21,12 +21,20 @@ export class Heatmap {
         this.options = options;
         this.tooltip = null;
         this.cells = [];
+        this.binOpacity = null;
     }
 
     render() {
         const kennzahl = KENNZAHL_BY_CODE[state.get('selectedKennzahl')];
         const { rows, years, valueRange } = this.prepareData();
 
+        // Vorberechnete Farbstufen (data/json/tiles/), passend zur Zeilen-Reihenfolge der Ansicht
+        const tiles = this.options.tiles;
+        const bins = tiles && this.options.view ? tiles.heatmap(this.options.view.id) : null;
+        if (bins) {
+            this.binOpacity = Array.from({ length: tiles.bins }, (_, i) => 0.2 + (i / (tiles.bins - 1)) * 0.8);
+        }
+
         this.container.innerHTML = `
             <div class="heatmap-container" id="heatmapExportArea">
                 <div class="heatmap-header-row">
@@ -56,10 +64,11 @@ export class Heatmap {
                             `).join('')}
                         </div>
                         <div class="heatmap-body" id="heatmapBody">
-                            ${rows.map(row => `
+                            ${rows.map((row, r) => `
                                 <div class="heatmap-row" data-uni="${row.uniCode}">
-                                    ${years.map(year => {
-                                        const cell = this.getCellData(row, year, valueRange, kennzahl);
+                                    ${years.map((year, y) => {
+                                        const bin = bins ? bins[r * years.length + y] : undefined;
+                                        const cell = this.getCellData(row, year, valueRange, kennzahl, bin);
                                         return `
                                             <div class="heatmap-cell ${cell.isNull ? 'heatmap-cell--null' : ''}"
                                                  style="background: ${cell.color}"
@@ -91,6 +100,14 @@ export class Heatmap {
     }
 
     prepareData() {
+        // Standard-Ansicht: Jahre, Wertebereich und Zeilen-Reihenfolge vorberechnet
+        const view = this.options.view;
+        if (view) {
+            const rows = Object.entries(this.data)
+                .map(([uniCode, group]) => ({ uniCode, university: group.university, data: group.data }));
+            return { rows, years: view.years, valueRange: view.valueRange };
+        }
+
         // Alle Jahre sammeln
         const years = [...new Set(
             Object.values(this.data)
@@ -125,7 +142,7 @@ export class Heatmap {
         return { rows, years, valueRange };
     }
 
-    getCellData(row, year, valueRange, kennzahl) {
+    getCellData(row, year, valueRange, kennzahl, bin) {
         const dataPoint = row.data.find(d => d.year === year);
         const value = dataPoint?.value;
 
@@ -138,11 +155,15 @@ export class Heatmap {
             };
         }
 
-        // Normalisieren auf 0-1
-        const normalized = (value - valueRange.min) / (valueRange.max - valueRange.min);
-
-        // Farbe basierend auf Uni-Typ mit Opacity (20-100%)
-        const opacity = 0.2 + normalized * 0.8;
+        // Farbe basierend auf Uni-Typ mit Opacity (20-100%), aus der Farbstufe falls vorberechnet
+        let opacity;
+        if (bin !== undefined) {
+            opacity = this.binOpacity[bin];
+        } else {
+            // Normalisieren auf 0-1
+            const normalized = (value - valueRange.min) / (valueRange.max - valueRange.min);
+            opacity = 0.2 + normalized * 0.8;
+        }
 
         return {
             value,
@@ -206,6 +227,7 @@ export class Heatmap {
 
     update(newData) {
         this.data = newData;
+        this.options.view = null; // Vorberechnete Ansicht gilt nur für die Ausgangsdaten
         this.render();
     }
 
@@ -17,7 +17,7 @@ export class LineChart {
     /**
      * @param {HTMLElement} container - Container-Element
      * @param {Object} data - Gruppierte Daten { uniCode: { university, data: [...] } }
-     * @param {Object} options - Optionen { showAverage: boolean }
+     * @param {Object} options - Optionen { showAverage: boolean, view: dataLoader.viewData() }
      */
     constructor(container, data, options = {}) {
         this.container = container;
@@ -102,8 +102,8 @@ export class LineChart {
             };
         });
 
-        // Alle Jahre sammeln für X-Achse
-        const allYears = [...new Set(
+        // Alle Jahre sammeln für X-Achse (aus der Standard-Ansicht, falls vorhanden)
+        const allYears = this.options.view?.years || [...new Set(
             Object.values(this.data)
                 .flatMap(g => g.data.map(d => d.year))
         )].sort();
@@ -274,6 +274,7 @@ export class LineChart {
      */
     update(newData) {
         this.data = newData;
+        this.options.view = null; // Vorberechnete Ansicht gilt nur für die Ausgangsdaten
         this.destroy();
         this.render();
     }
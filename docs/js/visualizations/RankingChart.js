@@ -58,6 +58,9 @@ export class RankingChart {
     }
 
     getAvailableYears() {
+        if (this.options.view) {
+            return this.options.view.years;
+        }
         return [...new Set(
             Object.values(this.data)
                 .flatMap(g => g.data.map(d => d.year))
@@ -68,7 +71,12 @@ export class RankingChart {
         const year = this.options.rankingYear;
 
         // Daten für das ausgewählte Jahr sammeln und sortieren
-        const rankings = Object.entries(this.data)
+        // (Standard-Ansicht: Reihenfolge vorberechnet)
+        const ranked = this.options.view?.rankings[year];
+        const entries = ranked
+            ? ranked.filter(uniCode => this.data[uniCode]).map(uniCode => [uniCode, this.data[uniCode]])
+            : Object.entries(this.data);
+        const rankings = entries
             .map(([uniCode, group]) => {
                 const dataPoint = group.data.find(d => d.year === year);
                 return {
@@ -80,8 +88,10 @@ export class RankingChart {
                         : 'Keine Daten'
                 };
             })
-            .filter(item => item.value !== null && item.value !== undefined)
-            .sort((a, b) => b.value - a.value);
+            .filter(item => item.value !== null && item.value !== undefined);
+        if (!ranked) {
+            rankings.sort((a, b) => b.value - a.value);
+        }
 
         if (rankings.length === 0) {
             return `
@@ -142,6 +152,7 @@ export class RankingChart {
 
     update(newData) {
         this.data = newData;
+        this.options.view = null; // Vorberechnete Ansicht gilt nur für die Ausgangsdaten
         this.render();
     }
 
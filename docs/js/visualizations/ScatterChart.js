@@ -6,9 +6,11 @@
  * - Y-Achse: Sekundaere Kennzahl
  * - Punkte nach Uni-Typ gefaerbt
  * - Korrelationskoeffizient berechnet und angezeigt
+ * - Stärkste Korrelations-Partner (vorberechnet in der Join-Tabelle)
  */
 
 import { state } from '../core/state.js';
+import { eventBus, EVENTS } from '../core/eventBus.js';
 import { UNI_TYPES, KENNZAHL_BY_CODE, formatValue } from '../data/metadata.js';
 import { getUniColor, getUniColorWithAlpha } from '../utils/colorUtils.js';
 import { exportChartAsPng } from '../utils/exportUtils.js';
@@ -17,7 +19,7 @@ export class ScatterChart {
     /**
      * @param {HTMLElement} container - Container-Element
      * @param {Array} mergedData - Gematchte Daten { x, y, uniCode, year, university }
-     * @param {Object} options - Optionen
+     * @param {Object} options - Optionen (partners: [{ code, r, n }])
      */
     constructor(container, mergedData, options = {}) {
         this.container = container;
@@ -55,6 +57,7 @@ export class ScatterChart {
                 <canvas id="scatterCanvas"></canvas>
             </div>
             <div class="scatter-legend" id="scatterLegend"></div>
+            ${this.renderPartners()}
         `;
 
         this.attachEventListeners();
@@ -62,7 +65,32 @@ export class ScatterChart {
         this.renderLegend();
     }
 
+    renderPartners() {
+        const partners = this.options.partners || [];
+        if (partners.length === 0) return '';
+
+        const secondaryCode = state.get('secondaryKennzahl');
+        return `
+            <div class="scatter-partners" title="Pearson-Korrelation über alle Universitäten und Jahre">
+                <span class="scatter-partners__label">Stärkste Zusammenhänge:</span>
+                ${partners.map(p => `
+                    <button class="scatter-partners__item ${p.code === secondaryCode ? 'is-active' : ''}"
+                            data-code="${p.code}">
+                        ${p.code} <small>r = ${p.r.toFixed(2)}, n = ${p.n}</small>
+                    </button>
+                `).join('')}
+            </div>
+        `;
+    }
+
     attachEventListeners() {
+        this.container.querySelectorAll('.scatter-partners__item').forEach(item => {
+            item.addEventListener('click', () => {
+                state.set('secondaryKennzahl', item.dataset.code);
+                eventBus.emit(EVENTS.FILTER_CHANGE, state.getFilterState());
+            });
+        });
+
         this.container.querySelector('#exportPng')?.addEventListener('click', () => {
             this.exportAsPng();
         });
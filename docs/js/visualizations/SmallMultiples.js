@@ -84,19 +84,27 @@ export class SmallMultiples {
     }
 
     renderCharts(byType, kennzahl) {
-        // Alle Jahre für konsistente X-Achse
-        const allYears = [...new Set(
-            Object.values(this.data)
-                .flatMap(g => g.data.map(d => d.year))
-        )].sort();
-
-        // Alle Werte für konsistente Y-Achse
-        const allValues = Object.values(this.data)
-            .flatMap(g => g.data.map(d => d.value))
-            .filter(v => v !== null);
-
-        const yMin = Math.min(...allValues);
-        const yMax = Math.max(...allValues);
+        // Konsistente Achsen (aus der Standard-Ansicht, falls vorhanden)
+        const view = this.options.view;
+        let allYears, yMin, yMax;
+        if (view) {
+            allYears = view.years;
+            ({ min: yMin, max: yMax } = view.valueRange);
+        } else {
+            // Alle Jahre für konsistente X-Achse
+            allYears = [...new Set(
+                Object.values(this.data)
+                    .flatMap(g => g.data.map(d => d.year))
+            )].sort();
+
+            // Alle Werte für konsistente Y-Achse
+            const allValues = Object.values(this.data)
+                .flatMap(g => g.data.map(d => d.value))
+                .filter(v => v !== null);
+
+            yMin = Math.min(...allValues);
+            yMax = Math.max(...allValues);
+        }
 
         Object.entries(UNI_TYPES).forEach(([typeId, typeMeta]) => {
             const canvas = this.container.querySelector(`#chart-${typeId}`);
@@ -199,6 +207,7 @@ export class SmallMultiples {
 
     update(newData) {
         this.data = newData;
+        this.options.view = null; // Vorberechnete Ansicht gilt nur für die Ausgangsdaten
         this.destroy();
         this.render();
     }
@@ -2,7 +2,8 @@
  * SparklineRenderer - Mini-Charts für Tabellenzellen
  *
  * Rendert kompakte Trend-Visualisierungen (100×30px Canvas).
- * Verwendet für die DataTable "Trend"-Spalte.
+ * Verwendet für die DataTable "Trend"-Spalte. Die Stufen kommen entweder
+ * aus den Datenpunkten oder vorberechnet aus data/json/tiles/.
  */
 
 import { UNI_BY_CODE, UNI_TYPES } from '../data/metadata.js';
@@ -15,25 +16,12 @@ import { UNI_BY_CODE, UNI_TYPES } from '../data/metadata.js';
  * @returns {HTMLCanvasElement}
  */
 export function createSparkline(cell, data, uniCode) {
-    const canvas = document.createElement('canvas');
-    canvas.width = 100;
-    canvas.height = 30;
-    canvas.className = 'sparkline';
-    canvas.style.cssText = 'display: block;';
-
-    const ctx = canvas.getContext('2d');
-    if (!ctx || !data || data.length < 2) {
-        cell.appendChild(canvas);
-        return canvas;
-    }
-
     // Sortiere nach Jahr
-    const sorted = [...data].sort((a, b) => a.year - b.year);
+    const sorted = [...(data || [])].sort((a, b) => a.year - b.year);
     const values = sorted.map(d => d.value).filter(v => v !== null && v !== undefined);
 
     if (values.length < 2) {
-        cell.appendChild(canvas);
-        return canvas;
+        return renderSparkline(cell, [], 1, 0, uniCode);
     }
 
     // Berechne Min/Max für Skalierung
@@ -41,6 +29,48 @@ export function createSparkline(cell, data, uniCode) {
     const max = Math.max(...values);
     const range = max - min || 1;
 
+    const firstValue = values[0];
+    const lastValue = values[values.length - 1];
+    const trend = lastValue > firstValue ? 1 : lastValue < firstValue ? -1 : 0;
+
+    return renderSparkline(cell, values.map(v => (v - min) / range), 1, trend, uniCode);
+}
+
+/**
+ * Erstellt ein Sparkline-Canvas aus vorberechneten Stufen (data/json/tiles/)
+ * @param {HTMLElement} cell - Tabellenzelle
+ * @param {Object} tile - { levels: Uint8Array|Uint16Array, trend: -1|0|1 } aus dataLoader.loadTiles()
+ * @param {number} maxLevel - Markierung fehlender Werte (255 bzw. 65535)
+ * @param {string} uniCode - Uni-Code für Farbgebung
+ * @returns {HTMLCanvasElement}
+ */
+export function createSparklineFromTile(cell, tile, maxLevel, uniCode) {
+    const levels = tile.levels.filter(level => level !== maxLevel);
+    return renderSparkline(cell, levels, maxLevel - 1, tile.trend, uniCode);
+}
+
+/**
+ * Zeichnet normierte Stufen als Sparkline
+ * @param {HTMLElement} cell - Tabellenzelle
+ * @param {ArrayLike<number>} levels - Stufen 0..scale (Minimum..Maximum der Reihe)
+ * @param {number} scale - Höchste Stufe
+ * @param {number} trend - -1 | 0 | 1 (letzter gegen ersten Wert)
+ * @param {string} uniCode - Uni-Code für Farbgebung
+ * @returns {HTMLCanvasElement}
+ */
+function renderSparkline(cell, levels, scale, trend, uniCode) {
+    const canvas = document.createElement('canvas');
+    canvas.width = 100;
+    canvas.height = 30;
+    canvas.className = 'sparkline';
+    canvas.style.cssText = 'display: block;';
+
+    const ctx = canvas.getContext('2d');
+    if (!ctx || levels.length < 2) {
+        cell.appendChild(canvas);
+        return canvas;
+    }
+
     // Farbe basierend auf Uni-Typ
     const uni = UNI_BY_CODE[uniCode];
     const uniType = uni ? UNI_TYPES[uni.type] : null;
@@ -52,9 +82,9 @@ export function createSparkline(cell, data, uniCode) {
     const chartHeight = canvas.height - padding.top - padding.bottom;
 
     // Punkte berechnen
-    const points = values.map((v, i) => ({
-        x: padding.left + (i / (values.length - 1)) * chartWidth,
-        y: padding.top + chartHeight - ((v - min) / range) * chartHeight
+    const points = Array.from(levels, (level, i) => ({
+        x: padding.left + (i / (levels.length - 1)) * chartWidth,
+        y: padding.top + chartHeight - (level / scale) * chartHeight
     }));
 
     // Linie zeichnen
@@ -81,10 +111,8 @@ export function createSparkline(cell, data, uniCode) {
     ctx.fill();
 
     // Trend-Indikator (Pfeil)
-    const firstValue = values[0];
-    const lastValue = values[values.length - 1];
-    const trend = lastValue > firstValue ? '^' : lastValue < firstValue ? 'v' : '-';
-    const trendColor = lastValue > firstValue ? '#28a745' : lastValue < firstValue ? '#dc3545' : '#6c757d';
+    const trendSymbol = trend > 0 ? '^' : trend < 0 ? 'v' : '-';
+    const trendColor = trend > 0 ? '#28a745' : trend < 0 ? '#dc3545' : '#6c757d';
 
     // Trend als Text neben Canvas
     const wrapper = document.createElement('div');
@@ -92,7 +120,7 @@ export function createSparkline(cell, data, uniCode) {
     wrapper.appendChild(canvas);
 
     const trendSpan = document.createElement('span');
-    trendSpan.textContent = trend;
+    trendSpan.textContent = trendSymbol;
     trendSpan.style.cssText = `color: ${trendColor}; font-size: 14px; font-weight: bold;`;
     wrapper.appendChild(trendSpan);
 
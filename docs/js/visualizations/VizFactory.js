@@ -56,7 +56,10 @@ export class VizFactory {
                     options
                 );
             case 'scatter':
-                return new ScatterChart(container, dualData.merged, options);
+                return new ScatterChart(container, dualData.merged, {
+                    ...options,
+                    partners: dualData.partners
+                });
             case 'ratio':
                 // Ratio nutzt LineChart mit berechneten Verhaeltnisdaten
                 return new LineChart(container, dualData.ratioGrouped, {
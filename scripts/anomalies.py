@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Anomalien - Statistische Plausibilitaetspruefung ueber alle Kennzahlen (H4).
+
+Laeuft als Batch-Stage nach der Konvertierung ueber alle Kennzahlen auf
+einmal und schreibt nur die markierten Punkte in einen kompakten Report,
+den das Dashboard bei Bedarf laedt (keine Berechnung beim Seitenaufruf).
+
+Pruefungen:
+- yoy:         Vorjahres-Veraenderung einer Uni als z-Score gegenueber der
+               Veraenderung aller Unis im selben Jahr
+- mad:         robuster Ausreisser-Test (Median/MAD, modifizierter z-Score)
+               ueber alle Unis eines Jahres; bei rein positiven Werten auf
+               Log-Skala, damit Groessenunterschiede nicht dominieren
+- consistency: Beziehungen zwischen Kennzahlen derselben Uni und desselben
+               Jahres (z.B. Koepfe >= VZAe)
+- ratio:       MAD-Ausreisser im Verhaeltnis der beiden Kennzahlen einer
+               Konsistenz-Regel (z.B. VZAe pro Kopf)
+"""
+
+import math
+import statistics
+from typing import Dict, List, Optional, Tuple
+
+
+# ============================================================
+# KONFIGURATION
+# ============================================================
+
+# |z| ab dem eine Vorjahres-Veraenderung markiert wird
+YOY_Z_THRESHOLD = 3.0
+
+# |modifizierter z-Score| nach Iglewicz/Hoaglin
+MAD_THRESHOLD = 3.5
+MAD_SCALE = 0.6745
+
+# Mindestanzahl Unis pro Jahr fuer Querschnitts-Statistiken
+MIN_GROUP_SIZE = 5
+
+# Beziehungen zwischen Kennzahlen: kennzahl <relation> reference
+CONSISTENCY_RULES = [
+    {"id": "koepfe-vza", "kennzahl": "1-A-1", "relation": ">=", "reference": "1-A-1-VZA",
+     "description": "Personal nach Koepfen >= Vollzeitaequivalente"},
+    {"id": "studierende-pruefungsaktive", "kennzahl": "2-A-5", "relation": ">=", "reference": "2-A-6",
+     "description": "Studierende >= Pruefungsaktive"},
+    {"id": "studierende-doktorat", "kennzahl": "2-A-5", "relation": ">=", "reference": "2-B-1",
+     "description": "Studierende >= Doktoratsstudierende mit Betreuungsverhaeltnis"},
+]
+
+# Spalten eines Eintrags in report["flags"][kennzahl]
+FLAG_FIELDS = ["uniCode", "year", "check", "score", "value", "reference"]
+
+REPORT_VERSION = 1
+
+
+# ============================================================
+# HILFSFUNKTIONEN
+# ============================================================
+
+Series = Dict[Tuple[str, int], float]
+
+
+def to_series(points: List[dict]) -> Series:
+    """Datenpunkte als {(uniCode, year): value}, ohne null-Werte."""
+    return {(p["uniCode"], p["year"]): p["value"] for p in points if p.get("value") is not None}
+
+
+def by_year(series: Series) -> Dict[int, Dict[str, float]]:
+    """{year: {uniCode: value}}"""
+    years: Dict[int, Dict[str, float]] = {}
+    for (uni_code, year), value in series.items():
+        years.setdefault(year, {})[uni_code] = value
+    return years
+
+
+def round_score(value: float) -> float:
+    return round(value, 2)
+
+
+def round_value(value: float) -> float:
+    """Werte im Report auf 4 Nachkommastellen (kompakt, ohne Float-Rauschen)."""
+    return round(value, 4)
+
+
+def mad_scores(values: Dict[str, float]) -> Dict[str, float]:
+    """
+    Modifizierte z-Scores (MAD_SCALE * (x - Median) / MAD).
+    Leer bei zu kleiner Gruppe oder MAD = 0.
+    """
+    if len(values) < MIN_GROUP_SIZE:
+        return {}
+    median = statistics.median(values.values())
+    mad = statistics.median(abs(v - median) for v in values.values())
+    if mad == 0:
+        return {}
+    return {key: MAD_SCALE * (v - median) / mad for key, v in values.items()}
+
+
+# ============================================================
+# PRUEFUNGEN
+# ============================================================
+
+def check_yoy(series: Series) -> List[list]:
+    """Vorjahres-Veraenderung je Uni als z-Score im Querschnitt des Jahres."""
+    flags = []
+    years = by_year(series)
+    for year in sorted(years):
+        previous = years.get(year - 1)
+        if not previous:
+            continue
+
+        changes = {}
+        for uni_code, value in years[year].items():
+            prev = previous.get(uni_code)
+            if prev:
+                changes[uni_code] = (value - prev) / abs(prev)
+        if len(changes) < MIN_GROUP_SIZE:
+            continue
+
+        mean = statistics.fmean(changes.values())
+        std = statistics.pstdev(changes.values())
+        if std == 0:
+            continue
+
+        for uni_code, change in changes.items():
+            z = (change - mean) / std
+            if abs(z) >= YOY_Z_THRESHOLD:
+                flags.append([uni_code, year, "yoy", round_score(z),
+                              round_value(years[year][uni_code]), round_value(previous[uni_code])])
+    return flags
+
+
+def check_mad(series: Series) -> List[list]:
+    """Robuste Ausreisser ueber alle Unis eines Jahres (Referenz: Median)."""
+    flags = []
+    for year, values in sorted(by_year(series).items()):
+        log_scale = all(v > 0 for v in values.values())
+        scaled = {u: math.log(v) for u, v in values.items()} if log_scale else values
+        scores = mad_scores(scaled)
+        if not scores:
+            continue
+        median = statistics.median(values.values())
+        for uni_code, score in scores.items():
+            if abs(score) > MAD_THRESHOLD:
+                flags.append([uni_code, year, "mad", round_score(score),
+                              round_value(values[uni_code]), round_value(median)])
+    return flags
+
+
+def check_consistency(rule: dict, series: Series, reference: Series) -> List[list]:
+    """Regel-Verletzungen und Ausreisser im Verhaeltnis kennzahl/reference."""
+    flags = []
+    check = f"consistency:{rule['id']}"
+    ratios: Dict[int, Dict[str, float]] = {}
+
+    for key in sorted(series.keys() & reference.keys()):
+        value, ref = series[key], reference[key]
+        ok = value >= ref if rule["relation"] == ">=" else value <= ref
+        ratio = value / ref if ref else None
+        if not ok:
+            flags.append([key[0], key[1], check,
+                          round_score(ratio) if ratio is not None else None,
+                          round_value(value), round_value(ref)])
+        if ratio is not None:
+            ratios.setdefault(key[1], {})[key[0]] = ratio
+
+    check = f"ratio:{rule['id']}"
+    for year, year_ratios in sorted(ratios.items()):
+        for uni_code, score in mad_scores(year_ratios).items():
+            if abs(score) > MAD_THRESHOLD:
+                flags.append([uni_code, year, check, round_score(score),
+                              round_value(series[(uni_code, year)]),
+                              round_value(reference[(uni_code, year)])])
+    return flags
+
+
+# ============================================================
+# REPORT
+# ============================================================
+
+def build_anomaly_report(converted: Dict[str, List[dict]],
+                         data_version: Optional[str] = None) -> dict:
+    """
+    Prueft alle Kennzahlen und fasst markierte Punkte zusammen.
+
+    Returns: {
+        format, version, dataVersion, thresholds, rules, fields,
+        flags: {kennzahl: [[uniCode, year, check, score, value, reference], ...]},
+        counts: {check: anzahl}
+    }
+    Bei yoy ist reference der Vorjahreswert, bei mad der Median des Jahres,
+    bei consistency/ratio der Wert der Referenz-Kennzahl.
+    """
+    series = {code: to_series(points) for code, points in converted.items()}
+    flags: Dict[str, List[list]] = {}
+
+    for code in sorted(series):
+        flags[code] = check_yoy(series[code]) + check_mad(series[code])
+
+    rules = []
+    for rule in CONSISTENCY_RULES:
+        if rule["kennzahl"] not in series or rule["reference"] not in series:
+            continue
+        rules.append(rule)
+        flags[rule["kennzahl"]] += check_consistency(
+            rule, series[rule["kennzahl"]], series[rule["reference"]])
+
+    flags = {code: sorted(entries, key=lambda f: (f[1], f[0], f[2]))
+             for code, entries in flags.items() if entries}
+
+    counts: Dict[str, int] = {}
+    for entries in flags.values():
+        for entry in entries:
+            check = entry[2].split(":")[0]
+            counts[check] = counts.get(check, 0) + 1
+
+    return {
+        "format": "anomalies",
+        "version": REPORT_VERSION,
+        "dataVersion": data_version,
+        "thresholds": {"yoyZ": YOY_Z_THRESHOLD, "mad": MAD_THRESHOLD, "minGroup": MIN_GROUP_SIZE},
+        "rules": rules,
+        "fields": FLAG_FIELDS,
+        "flags": flags,
+        "counts": counts
+    }
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Batch-Berichte - Alle Templates ueber eine Matrix Uni x Kennzahl (H2).
+
+Erzeugt die Berichte aus reports.py fuer jede Uni und Kennzahl ohne
+Browser, z.B. fuer den jaehrlichen Bericht je Universitaet:
+
+- Jobs:        Uni x Kennzahl x Template; Filter je Job ist die Uni selbst,
+               beim Vergleich die Unis ihres Uni-Typs
+- Planung:     jeder Prompt wird einmal gebaut; Jobs mit gleichem Prompt
+               (z.B. Vergleich aller Med-Unis) teilen sich eine Anfrage;
+               Jobs ohne Datenpunkte im Filter werden uebersprungen
+- Ausfuehrung: asyncio mit begrenzter Parallelitaet (--concurrency) und
+               Rate-Limit (--rpm); die blockierenden HTTP-Aufrufe laufen
+               in Threads (asyncio.to_thread)
+- Fehler:      429, 5xx und Verbindungsfehler werden mit exponentiellem
+               Backoff wiederholt (--retries)
+- Checkpoint:  jede fertige Anfrage wird sofort in checkpoint.jsonl
+               protokolliert; ein erneuter Lauf ueberspringt sie
+               (--fresh: von vorn)
+
+Ergebnisse: <out>/<Uni>/<Kennzahl>-<Template>.json, am Ende summary.json.
+
+Ohne API-Key gegen den Mock testen:
+    python scripts/mock_messages_api.py --port 8765 --latency 0.3 --error-rate 0.1
+    python scripts/batch_reports.py --endpoint http://127.0.0.1:8765/v1/messages
+
+Verwendung:
+    python scripts/batch_reports.py --templates summary,trend --years 2022-2024
+    python scripts/batch_reports.py --unis UI --kennzahlen 2-A-5,1-A-1 --out /tmp/berichte
+    python scripts/batch_reports.py --budget 400 --concurrency 8 --rpm 50
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+import convert
+from json_writer import write_json
+from prompt_budget import BudgetedReportService
+from query import make_filter_state, parse_codes, parse_year_range
+from reports import (API_URL, DEFAULT_OUTPUT_DIR, MODEL, PROJECT_ROOT, TEMPLATES,
+                     MessagesClient, ReportError, ReportService)
+
+
+# ============================================================
+# KONFIGURATION
+# ============================================================
+
+DEFAULT_OUT_DIR = PROJECT_ROOT / "reports"
+DEFAULT_TEMPLATES = ["summary", "trend", "anomaly"]
+
+DEFAULT_CONCURRENCY = 4
+# Anfragen pro Minute (0 = unbegrenzt)
+DEFAULT_RPM = 50
+DEFAULT_RETRIES = 4
+
+# Backoff: BACKOFF_BASE * 2^Versuch (+ bis zu 50 % Zufall), hoechstens BACKOFF_MAX
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 30.0
+
+# Wiederholbare HTTP-Status (None = Verbindungsfehler)
+RETRY_STATUSES = {None, 408, 429, 500, 502, 503, 504, 529}
+
+CHECKPOINT_FILE = "checkpoint.jsonl"
+SUMMARY_FILE = "summary.json"
+
+# Fortschritt alle n Anfragen ausgeben
+PROGRESS_EVERY = 25
+
+
+class Job(NamedTuple):
+    uni: str
+    kennzahl: str
+    template: str
+
+
+# ============================================================
+# PLANUNG
+# ============================================================
+
+def expand_jobs(unis: List[str], kennzahlen: List[str], templates: List[str]) -> List[Job]:
+    return [Job(uni, code, template) for uni in unis for code in kennzahlen for template in templates]
+
+
+def job_filter_state(job: Job, year_range: Optional[Tuple[int, int]]) -> dict:
+    """Die Uni selbst; beim Vergleich alle Unis ihres Uni-Typs."""
+    if job.template == "comparison":
+        uni_type = convert.UNI_TYPE_BY_CODE.get(job.uni)
+        peers = sorted(code for code, t in convert.UNI_TYPE_BY_CODE.items() if t == uni_type)
+        return make_filter_state(peers or [job.uni], (), year_range)
+    return make_filter_state([job.uni], (), year_range)
+
+
+def job_path(out_dir: Path, job: Job) -> Path:
+    return out_dir / job.uni / f"{job.kennzahl}-{job.template}.json"
+
+
+def plan_requests(service: ReportService, jobs: List[Job],
+                  year_range: Optional[Tuple[int, int]]) -> Tuple[Dict[str, dict], List[Job]]:
+    """
+    Baut jeden Prompt genau einmal. Returns: ({Cache-Schluessel: {prompt,
+    filterState, jobs}}, leere Jobs); Jobs mit identischer Anfrage teilen sich
+    einen Eintrag, Jobs ohne Datenpunkte (Uni meldet die Kennzahl nicht)
+    werden nicht angefragt.
+    """
+    requests: Dict[str, dict] = {}
+    empty: List[Job] = []
+    for job in jobs:
+        filter_state = job_filter_state(job, year_range)
+        if not service.index(job.kennzahl).select(filter_state):
+            empty.append(job)
+            continue
+        key = service.cache_key(job.kennzahl, job.template, filter_state)
+        if key not in requests:
+            requests[key] = {"prompt": service.prompt(job.kennzahl, job.template, filter_state),
+                             "filterState": filter_state, "jobs": []}
+        requests[key]["jobs"].append(job)
+    return requests, empty
+
+
+# ============================================================
+# CHECKPOINT
+# ============================================================
+
+class Checkpoint:
+    """
+    Protokoll fertiger Anfragen (eine JSON-Zeile je Anfrage, sofort auf
+    die Platte). Nur erfolgreiche Eintraege gelten beim Fortsetzen als
+    erledigt; eine abgeschnittene letzte Zeile wird ignoriert.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._file = None
+
+    def load(self) -> Set[str]:
+        done = set()
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if entry.get("status") == "ok":
+                        done.add(entry["key"])
+        except OSError:
+            pass
+        return done
+
+    def reset(self):
+        self.path.unlink(missing_ok=True)
+
+    def record(self, entry: dict):
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, 'a', encoding='utf-8')
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+# ============================================================
+# AUSFUEHRUNG
+# ============================================================
+
+class RateLimiter:
+    """Gleichmaessiger Abstand zwischen den Anfragen (per_minute; 0 = aus)."""
+
+    def __init__(self, per_minute: float):
+        self.interval = 60.0 / per_minute if per_minute else 0.0
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        if not self.interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+def backoff(attempt: int) -> float:
+    delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt)
+    return delay * (1 + random.random() / 2)
+
+
+async def submit(client: MessagesClient, prompt: str, limiter: RateLimiter,
+                 retries: int) -> Tuple[dict, int]:
+    """Sendet einen Prompt mit Wiederholungen. Returns: (Antwort, Versuche)"""
+    for attempt in range(retries + 1):
+        await limiter.wait()
+        try:
+            return await asyncio.to_thread(client.create, prompt), attempt + 1
+        except ReportError as e:
+            if e.status not in RETRY_STATUSES or attempt == retries:
+                raise
+            await asyncio.sleep(backoff(attempt))
+
+
+def write_results(out_dir: Path, request: dict, response: dict, meta: dict):
+    for job in request["jobs"]:
+        path = job_path(out_dir, job)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_json(path, {
+            "uniCode": job.uni,
+            "kennzahl": job.kennzahl,
+            "template": job.template,
+            "filterState": request["filterState"],
+            **meta,
+            "text": response["text"],
+            "usage": response.get("usage", {})
+        })
+
+
+async def run_batch(service: ReportService, requests: Dict[str, dict], out_dir: Path,
+                    checkpoint: Checkpoint, concurrency: int = DEFAULT_CONCURRENCY,
+                    rpm: float = DEFAULT_RPM, retries: int = DEFAULT_RETRIES) -> dict:
+    """Fuehrt alle Anfragen aus, die noch nicht im Checkpoint stehen."""
+    done = checkpoint.load()
+    pending = [(key, request) for key, request in requests.items() if key not in done]
+    limiter = RateLimiter(rpm)
+    semaphore = asyncio.Semaphore(concurrency)
+    meta = {"dataVersion": service.version, "model": service.client.model}
+    stats = {"requests": len(requests), "skipped": len(requests) - len(pending), "ok": 0,
+             "failed": 0, "attempts": 0, "inputTokens": 0, "outputTokens": 0}
+    start = time.perf_counter()
+
+    async def worker(key: str, request: dict):
+        async with semaphore:
+            try:
+                response, attempts = await submit(service.client, request["prompt"], limiter, retries)
+            except ReportError as e:
+                stats["failed"] += 1
+                checkpoint.record({"key": key, "status": "failed", "error": str(e), "httpStatus": e.status})
+                print(f"[Batch] Fehler {request['jobs'][0].kennzahl}/{request['jobs'][0].template}: {e}",
+                      file=sys.stderr)
+                return
+        write_results(out_dir, request, response, {**meta, "generatedAt": datetime.now().isoformat()})
+        usage = response.get("usage", {})
+        stats["ok"] += 1
+        stats["attempts"] += attempts
+        stats["inputTokens"] += usage.get("input_tokens", 0)
+        stats["outputTokens"] += usage.get("output_tokens", 0)
+        checkpoint.record({"key": key, "status": "ok", "attempts": attempts,
+                           "files": [str(job_path(out_dir, job).relative_to(out_dir)) for job in request["jobs"]]})
+        finished = stats["ok"] + stats["failed"]
+        if finished % PROGRESS_EVERY == 0:
+            print(f"[Batch] {finished}/{len(pending)} Anfragen, {stats['failed']} Fehler")
+
+    try:
+        await asyncio.gather(*(worker(key, request) for key, request in pending))
+    finally:
+        checkpoint.close()
+    stats["seconds"] = round(time.perf_counter() - start, 2)
+    return stats
+
+
+# ============================================================
+# HAUPTFUNKTION
+# ============================================================
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Berichte fuer alle Unis und Kennzahlen im Batch",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Beispiele:
+    python batch_reports.py --templates summary,trend --years 2022-2024
+    python batch_reports.py --unis UI --kennzahlen 2-A-5,1-A-1
+    python batch_reports.py --endpoint http://127.0.0.1:8765/v1/messages
+
+Der API-Key wird aus ANTHROPIC_API_KEY gelesen. Ein abgebrochener Lauf
+wird mit denselben Argumenten fortgesetzt.
+        """
+    )
+    parser.add_argument("--unis", help="Uni-Codes, kommagetrennt (Standard: alle)")
+    parser.add_argument("--kennzahlen", help="Kennzahl-Codes, kommagetrennt (Standard: alle konvertierten)")
+    parser.add_argument("--templates", default=",".join(DEFAULT_TEMPLATES),
+                        help=f"Templates, kommagetrennt ({', '.join(TEMPLATES)})")
+    parser.add_argument("--years", type=parse_year_range, help="Jahresbereich (z.B. 2022-2024)")
+    parser.add_argument("--budget", type=int, help="Token-Budget je Prompt (siehe prompt_budget.py)")
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT_DIR, help="Ausgabe-Verzeichnis")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="Parallele Anfragen")
+    parser.add_argument("--rpm", type=float, default=DEFAULT_RPM, help="Anfragen pro Minute (0 = unbegrenzt)")
+    parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES, help="Wiederholungen je Anfrage")
+    parser.add_argument("--fresh", action="store_true", help="Checkpoint verwerfen und von vorn beginnen")
+    parser.add_argument("--endpoint", default=API_URL, help="Messages-Endpoint (z.B. der Mock-Server)")
+    parser.add_argument("--model", default=MODEL, help="Modell")
+    parser.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR,
+                        help="Output-Verzeichnis von convert.py")
+    args = parser.parse_args()
+
+    templates = parse_codes(args.templates)
+    unknown = [t for t in templates if t not in TEMPLATES]
+    if unknown:
+        parser.error(f"Unbekannte Templates: {', '.join(unknown)}")
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    if not api_key and args.endpoint == API_URL:
+        parser.error("ANTHROPIC_API_KEY ist nicht gesetzt")
+
+    unis = parse_codes(args.unis) or sorted(convert.VALID_UNI_CODES)
+    kennzahlen = parse_codes(args.kennzahlen) or sorted(
+        path.stem for path in (args.output_dir / convert.COLUMNAR_DIRNAME).glob("*.json"))
+
+    client = MessagesClient(args.endpoint, api_key, args.model)
+    if args.budget:
+        service = BudgetedReportService(args.output_dir, client, budget=args.budget)
+    else:
+        service = ReportService(args.output_dir, client)
+
+    jobs = expand_jobs(unis, kennzahlen, templates)
+    try:
+        requests, empty = plan_requests(service, jobs, args.years)
+    except FileNotFoundError as e:
+        print(f"[Batch] Fehler: Kennzahl nicht konvertiert ({Path(e.filename).name})", file=sys.stderr)
+        sys.exit(1)
+
+    checkpoint = Checkpoint(args.out / CHECKPOINT_FILE)
+    if args.fresh:
+        checkpoint.reset()
+    print(f"[Batch] {len(jobs)} Berichte ({len(unis)} Unis x {len(kennzahlen)} Kennzahlen x "
+          f"{len(templates)} Templates), {len(requests)} verschiedene Anfragen, "
+          f"{len(empty)} ohne Daten uebersprungen")
+
+    stats = asyncio.run(run_batch(service, requests, args.out, checkpoint,
+                                  args.concurrency, args.rpm, args.retries))
+
+    summary = {"jobs": len(jobs), "empty": len(empty), **stats, "unis": unis, "kennzahlen": kennzahlen,
+               "templates": templates, "budget": args.budget,
+               "dataVersion": service.version, "model": args.model}
+    write_json(args.out / SUMMARY_FILE, summary)
+    print(f"[Batch] {stats['ok']} erzeugt, {stats['skipped']} aus dem Checkpoint, {stats['failed']} Fehler "
+          f"in {stats['seconds']}s ({stats['attempts']} Versuche erfolgreicher Anfragen, "
+          f"Tokens {stats['inputTokens']} ein / {stats['outputTokens']} aus)")
+    if stats["failed"]:
+        print("[Batch] Erneut starten, um die fehlgeschlagenen Anfragen zu wiederholen", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Benchmark-Suite fuer die Konvertierungs-Pipeline (convert.py).
+
+Misst convert_file (Standard-, 3-A-1- und 3-A-3-Layout), validate_output
+und analyze_excel auf synthetischen Arbeitsmappen (siehe synthetic.py),
+skaliert von 22 bis 22.000 Universitaeten und 3 bis 50 Jahren.
+
+Pro Fall werden die Stages load, header, extract, write, validate und
+analyze einzeln gemessen (beste Zeit aus --repeat Durchlaeufen) sowie in
+einem zusaetzlichen Durchlauf mit tracemalloc der Speicher-Peak je Stage.
+
+Die Ergebnisse werden als JSON-Baseline gespeichert; spaetere Laeufe
+vergleichen dagegen und markieren Regressionen ueber --threshold.
+
+Verwendung:
+    python scripts/benchmarks/bench_pipeline.py                  # volles Raster
+    python scripts/benchmarks/bench_pipeline.py --quick          # kleines Raster
+    python scripts/benchmarks/bench_pipeline.py --unis 22,2200 --years 3,50
+    python scripts/benchmarks/bench_pipeline.py --save-baseline  # Baseline schreiben
+    python scripts/benchmarks/bench_pipeline.py --fail-on-regression
+"""
+
+import os
+import sys
+import json
+import shutil
+import platform
+import argparse
+import tempfile
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import convert
+from synthetic import (synthetic_registry, synthetic_uni_codes, synthetic_years,
+                       write_standard, write_3a1, write_3a3)
+
+
+# ============================================================
+# KONFIGURATION
+# ============================================================
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+DEFAULT_BASELINE = BENCHMARK_DIR / "baseline.json"
+DEFAULT_WORKDIR = Path(tempfile.gettempdir()) / "wissensbilanz-bench"
+
+# Raster (Universitaeten x Jahre)
+FULL_UNIS = [22, 220, 2200, 22000]
+FULL_YEARS = [3, 11, 50]
+QUICK_UNIS = [22, 2200]
+QUICK_YEARS = [3, 11]
+
+STAGES = ["load", "header", "extract", "write", "validate", "analyze"]
+
+# Stages unter dieser Dauer werden nicht verglichen (Messrauschen)
+MIN_COMPARE_SECONDS = 0.01
+
+BASELINE_VERSION = 1
+
+
+# ============================================================
+# FAELLE
+# ============================================================
+
+def build_cases(unis: List[int], years: List[int]) -> List[dict]:
+    """Standard-Faelle fuer das Raster plus die Spezial-Layouts."""
+    cases = [{"name": f"standard-u{n}-y{m}", "kind": "standard", "unis": n, "years": m}
+             for n in unis for m in years]
+    cases.append({"name": "3-A-1", "kind": "3a1", "unis": 1, "years": 3})
+    cases.append({"name": "3-A-3", "kind": "3a3", "unis": 22, "years": 3})
+    return cases
+
+
+def prepare_workbook(case: dict, workdir: Path, regenerate: bool) -> Path:
+    """Erzeugt die Arbeitsmappe eines Falls (bzw. verwendet die vorhandene)."""
+    path = workdir / f"{case['name']}.xlsx"
+    if path.exists() and not regenerate:
+        return path
+
+    years = synthetic_years(case["years"])
+    if case["kind"] == "standard":
+        write_standard(path, synthetic_uni_codes(case["unis"]), years)
+    elif case["kind"] == "3a1":
+        write_3a1(path, years)
+    else:
+        write_3a3(path, years)
+    return path
+
+
+def convert_case(case: dict, path: Path, output_dir: Path) -> dict:
+    """
+    Konvertiert eine Arbeitsmappe ueber die Konverter-Registry: "3-A-1" und
+    "3-A-3" haben eigene Spezifikationen, die Standard-Faelle STANDARD_SPEC.
+    """
+    return convert.convert_file(path, output_dir, case["name"])
+
+
+def run_once(case: dict, path: Path, output_dir: Path) -> Tuple[dict, List[dict]]:
+    """Ein kompletter Durchlauf (Konvertierung, Validierung, Analyse) mit Stage-Messung."""
+    if output_dir.exists():
+        shutil.rmtree(output_dir)
+    output_dir.mkdir(parents=True)
+
+    # Ohne Layout-Cache: Header-Erkennung wird jedes Mal voll gemessen
+    convert._layout_caches.clear()
+
+    convert.start_stage_recording()
+    try:
+        result = convert_case(case, path, output_dir)
+        with convert.stage("validate"):
+            convert.validate_output(output_dir)
+        convert._layout_caches.clear()
+        with convert.stage("analyze"):
+            convert.analyze_excel(path)
+    finally:
+        records = convert.stop_stage_recording()
+
+    return result, records
+
+
+def summarize(records: List[dict]) -> Dict[str, dict]:
+    """Fasst Stage-Messungen zusammen: {stage: {seconds, peak_bytes}}."""
+    summary: Dict[str, dict] = {}
+    for record in records:
+        entry = summary.setdefault(record["stage"], {"seconds": 0.0})
+        entry["seconds"] += record["seconds"]
+        if "peak_bytes" in record:
+            entry["peak_bytes"] = max(entry.get("peak_bytes", 0), record["peak_bytes"])
+    return summary
+
+
+def run_case(case: dict, path: Path, workdir: Path, repeat: int) -> dict:
+    """Misst einen Fall: beste Zeit je Stage, danach ein Durchlauf mit tracemalloc."""
+    output_dir = workdir / f"out-{case['name']}"
+    years = synthetic_years(case["years"])
+    codes = synthetic_uni_codes(case["unis"])
+
+    best: Dict[str, float] = {}
+    best_total = float('inf')
+    with synthetic_registry(codes, years):
+        for _ in range(repeat):
+            result, records = run_once(case, path, output_dir)
+            summary = summarize(records)
+            for name, entry in summary.items():
+                best[name] = min(best.get(name, float('inf')), entry["seconds"])
+            best_total = min(best_total, sum(entry["seconds"] for entry in summary.values()))
+
+        tracemalloc.start()
+        try:
+            _, records = run_once(case, path, output_dir)
+        finally:
+            tracemalloc.stop()
+        peaks = summarize(records)
+
+    shutil.rmtree(output_dir, ignore_errors=True)
+
+    if "error" in result:
+        raise RuntimeError(f"{case['name']}: {result['error']}")
+
+    stages = {name: {"seconds": round(best[name], 6),
+                     "peak_bytes": peaks.get(name, {}).get("peak_bytes", 0)}
+              for name in STAGES if name in best}
+    return {
+        "kind": case["kind"],
+        "unis": case["unis"],
+        "years": case["years"],
+        "data_points": result["data_points"],
+        "file_bytes": path.stat().st_size,
+        "stages": stages,
+        "total_seconds": round(best_total, 6),
+        "peak_bytes": max((s["peak_bytes"] for s in stages.values()), default=0)
+    }
+
+
+# ============================================================
+# BASELINE
+# ============================================================
+
+def environment() -> dict:
+    """Messumgebung (fuer die Einordnung von Vergleichen)."""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "openpyxl": convert.openpyxl.__version__,
+        "converter": convert.CONVERTER_VERSION
+    }
+
+
+def load_baseline(path: Path) -> Optional[dict]:
+    """Laedt eine gespeicherte Baseline (None wenn nicht vorhanden/ungueltig)."""
+    if not path.exists():
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if baseline.get("version") != BASELINE_VERSION:
+        return None
+    return baseline
+
+
+def save_baseline(path: Path, results: dict):
+    """Speichert Ergebnisse als Baseline."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> List[dict]:
+    """
+    Vergleicht Ergebnisse mit der Baseline.
+    Returns: Liste von {case, stage, metric, base, now, ratio, regression}
+    """
+    rows = []
+    for name, case in results["cases"].items():
+        base_case = baseline["cases"].get(name)
+        if not base_case:
+            continue
+        for stage_name, now in case["stages"].items():
+            base = base_case["stages"].get(stage_name)
+            if not base:
+                continue
+            if base["seconds"] >= MIN_COMPARE_SECONDS:
+                ratio = now["seconds"] / base["seconds"]
+                rows.append({"case": name, "stage": stage_name, "metric": "seconds",
+                             "base": base["seconds"], "now": now["seconds"],
+                             "ratio": ratio, "regression": ratio > threshold})
+            if base.get("peak_bytes") and now.get("peak_bytes"):
+                ratio = now["peak_bytes"] / base["peak_bytes"]
+                rows.append({"case": name, "stage": stage_name, "metric": "peak_bytes",
+                             "base": base["peak_bytes"], "now": now["peak_bytes"],
+                             "ratio": ratio, "regression": ratio > threshold})
+    return rows
+
+
+# ============================================================
+# AUSGABE
+# ============================================================
+
+def format_bytes(num: float) -> str:
+    """Bytes lesbar (KB/MB)."""
+    if num >= 1024 * 1024:
+        return f"{num / 1024 / 1024:.1f}MB"
+    return f"{num / 1024:.0f}KB"
+
+
+def print_case(name: str, case: dict):
+    """Eine Tabellenzeile pro Fall: Zeit (ms) und Peak je Stage."""
+    cells = []
+    for stage_name in STAGES:
+        entry = case["stages"].get(stage_name)
+        if entry:
+            cells.append(f"{entry['seconds'] * 1000:>9.1f} {format_bytes(entry['peak_bytes']):>7}")
+        else:
+            cells.append(f"{'-':>9} {'':>7}")
+    print(f"{name:<22} {case['data_points']:>8} " + " ".join(cells)
+          + f" {case['total_seconds'] * 1000:>9.1f}")
+
+
+def print_header():
+    columns = " ".join(f"{name + ' ms':>9} {'peak':>7}" for name in STAGES)
+    print(f"{'Fall':<22} {'Punkte':>8} {columns} {'total ms':>9}")
+
+
+def print_comparison(rows: List[dict], threshold: float):
+    regressions = [row for row in rows if row["regression"]]
+    improvements = [row for row in rows if row["ratio"] < 1 / threshold]
+    print(f"\n[Benchmark] Vergleich mit Baseline: {len(rows)} Messwerte, "
+          f"{len(regressions)} Regressionen, {len(improvements)} Verbesserungen (Schwelle {threshold:.2f}x)")
+    for row in regressions + improvements:
+        marker = "REGRESSION" if row["regression"] else "besser"
+        if row["metric"] == "seconds":
+            values = f"{row['base'] * 1000:.1f}ms -> {row['now'] * 1000:.1f}ms"
+        else:
+            values = f"{format_bytes(row['base'])} -> {format_bytes(row['now'])}"
+        print(f"  {marker:<10} {row['case']:<22} {row['stage']:<9} {values} ({row['ratio']:.2f}x)")
+
+
+# ============================================================
+# HAUPTFUNKTION
+# ============================================================
+
+def parse_sizes(text: Optional[str], default: List[int]) -> List[int]:
+    """'22,2200' -> [22, 2200]"""
+    if not text:
+        return default
+    return [int(part) for part in text.split(",") if part.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark-Suite Konvertierungs-Pipeline')
+    parser.add_argument('--quick', action='store_true',
+                        help=f'Kleines Raster ({QUICK_UNIS} x {QUICK_YEARS})')
+    parser.add_argument('--unis', help='Anzahl Universitaeten, kommagetrennt')
+    parser.add_argument('--years', help='Anzahl Jahre, kommagetrennt')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Zeitmessungen pro Fall, gewertet wird die beste (Standard: 3)')
+    parser.add_argument('--workdir', type=Path, default=DEFAULT_WORKDIR,
+                        help='Verzeichnis fuer synthetische Arbeitsmappen')
+    parser.add_argument('--regenerate', action='store_true',
+                        help='Arbeitsmappen neu erzeugen')
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE,
+                        help='Baseline-Datei (Standard: scripts/benchmarks/baseline.json)')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='Ergebnisse als neue Baseline speichern')
+    parser.add_argument('--output', type=Path, help='Ergebnisse zusaetzlich als JSON speichern')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='Regressions-Schwelle als Faktor (Standard: 1.25)')
+    parser.add_argument('--fail-on-regression', action='store_true',
+                        help='Exit-Code 1 bei Regressionen')
+    args = parser.parse_args()
+
+    unis = parse_sizes(args.unis, QUICK_UNIS if args.quick else FULL_UNIS)
+    years = parse_sizes(args.years, QUICK_YEARS if args.quick else FULL_YEARS)
+    args.workdir.mkdir(parents=True, exist_ok=True)
+
+    results = {
+        "format": "benchmark",
+        "version": BASELINE_VERSION,
+        "created": datetime.now().isoformat(timespec='seconds'),
+        "environment": environment(),
+        "repeat": args.repeat,
+        "cases": {}
+    }
+
+    print(f"[Benchmark] Arbeitsverzeichnis: {args.workdir}")
+    print_header()
+    for case in build_cases(unis, years):
+        path = prepare_workbook(case, args.workdir, args.regenerate)
+        results["cases"][case["name"]] = run_case(case, path, args.workdir, args.repeat)
+        print_case(case["name"], results["cases"][case["name"]])
+
+    if args.output:
+        save_baseline(args.output, results)
+        print(f"\n[Benchmark] Ergebnisse: {args.output}")
+
+    exit_code = 0
+    baseline = load_baseline(args.baseline)
+    if baseline:
+        if baseline.get("environment") != results["environment"]:
+            print("\n[Benchmark] Hinweis: Baseline stammt aus anderer Umgebung "
+                  f"({baseline.get('environment', {}).get('platform')})")
+        rows = compare(results, baseline, args.threshold)
+        print_comparison(rows, args.threshold)
+        if args.fail_on_regression and any(row["regression"] for row in rows):
+            exit_code = 1
+    elif not args.save_baseline:
+        print(f"\n[Benchmark] Keine Baseline unter {args.baseline} (anlegen mit --save-baseline)")
+
+    if args.save_baseline:
+        save_baseline(args.baseline, results)
+        print(f"[Benchmark] Baseline gespeichert: {args.baseline}")
+
+    sys.exit(exit_code)
+
+
+if __name__ == '__main__':
+    main()
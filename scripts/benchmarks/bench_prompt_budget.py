@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark der Prompt-Verdichtung (prompt_budget.py).
+
+Rechnet fuer jede Kombination aus Kennzahl x Template x Filter-State
+(Standard-Ansichten wie in bench_reports.py) und jedes Budget aus:
+
+- Tokens des Prompts wie in ReportPanel.js (Panel), ohne Verdichtung
+  (Kompakt) und im Budget (Budget)
+- Anteil der Prompts, die ins Budget passen, und die gewaehlten Stufen
+  (zuletzt "P": Prompt wie im Panel, weil kuerzer als jede Verdichtung)
+- Zeit fuer fit_prompt je Anfrage
+
+Verwendung:
+    python scripts/benchmarks/bench_prompt_budget.py
+    python scripts/benchmarks/bench_prompt_budget.py --budgets 250,400,600 --json
+"""
+
+import sys
+import json
+import time
+import argparse
+from collections import Counter
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import convert
+from bench_reports import FILTER_STATES
+from prompt_budget import LEVELS, PANEL_LEVEL, BudgetedReportService, token_savings
+from reports import DEFAULT_OUTPUT_DIR, TEMPLATES, MessagesClient
+
+
+# ============================================================
+# KONFIGURATION
+# ============================================================
+
+DEFAULT_BUDGETS = [250, 400, 600]
+
+
+# ============================================================
+# MESSUNG
+# ============================================================
+
+def run_budget(output_dir: Path, kennzahlen: List[str], budget: int) -> List[dict]:
+    """Je Template: Summen der Tokens, Anteil im Budget, Stufen, Zeit je Prompt."""
+    service = BudgetedReportService(output_dir, MessagesClient(), budget=budget)
+    totals = {template: {"baseline": 0, "compact": 0, "fitted": 0, "within": 0, "count": 0,
+                         "levels": Counter(), "seconds": 0.0} for template in TEMPLATES}
+    for code in kennzahlen:
+        for _, filter_state in FILTER_STATES:
+            for template in TEMPLATES:
+                start = time.perf_counter()
+                service.fit(code, template, filter_state)
+                seconds = time.perf_counter() - start
+                saving, = token_savings(service, code, filter_state, [template])
+                total = totals[template]
+                total["baseline"] += saving["baseline"]
+                total["compact"] += saving["compact"]
+                total["fitted"] += saving["fitted"]
+                total["within"] += saving["withinBudget"]
+                total["count"] += 1
+                strategies = tuple(saving["strategies"])
+                total["levels"]["P" if strategies == PANEL_LEVEL else len(strategies)] += 1
+                total["seconds"] += seconds
+
+    results = []
+    for template, total in totals.items():
+        results.append({
+            "budget": budget,
+            "template": template,
+            "prompts": total["count"],
+            "baseline": total["baseline"],
+            "compact": total["compact"],
+            "fitted": total["fitted"],
+            "savedPct": round((total["baseline"] - total["fitted"]) / total["baseline"] * 100, 1),
+            "withinPct": round(total["within"] / total["count"] * 100, 1),
+            "levels": [total["levels"][n] for n in range(len(LEVELS))] + [total["levels"]["P"]],
+            "msPerFit": round(total["seconds"] / total["count"] * 1000, 3)
+        })
+    return results
+
+
+def print_results(results: List[dict]):
+    print(f"{'Budget':>6} {'Template':<11} {'Prompts':>7} {'Panel':>8} {'Kompakt':>8} {'Budget':>8} "
+          f"{'Gespart%':>8} {'Im Budget%':>10} {'ms/Fit':>7}  Stufen 0-{len(LEVELS) - 1}/P")
+    for r in results:
+        print(f"{r['budget']:>6} {r['template']:<11} {r['prompts']:>7} {r['baseline']:>8} "
+              f"{r['compact']:>8} {r['fitted']:>8} {r['savedPct']:>8} {r['withinPct']:>10} "
+              f"{r['msPerFit']:>7}  {'/'.join(map(str, r['levels']))}")
+
+
+# ============================================================
+# HAUPTFUNKTION
+# ============================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark der Prompt-Verdichtung")
+    parser.add_argument("--budgets", default=",".join(map(str, DEFAULT_BUDGETS)),
+                        help="Token-Budgets, kommagetrennt")
+    parser.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR,
+                        help="Output-Verzeichnis von convert.py")
+    parser.add_argument("--json", action="store_true", help="Ergebnisse als JSON ausgeben")
+    args = parser.parse_args()
+
+    kennzahlen = sorted(path.stem for path in (args.output_dir / convert.COLUMNAR_DIRNAME).glob("*.json"))
+    if not kennzahlen:
+        print(f"[Benchmark] Keine konvertierten Kennzahlen in {args.output_dir}", file=sys.stderr)
+        sys.exit(1)
+    budgets = [int(b) for b in args.budgets.split(",") if b.strip()]
+
+    results = [r for budget in budgets for r in run_budget(args.output_dir, kennzahlen, budget)]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"[Benchmark] {len(kennzahlen)} Kennzahlen x {len(TEMPLATES)} Templates x "
+          f"{len(FILTER_STATES)} Filter, Budgets {', '.join(map(str, budgets))}")
+    print_results(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Lasttest fuer den Berichts-Service (reports.py) gegen den Mock-Endpoint.
+
+Startet mock_messages_api.py im Prozess und schickt alle Kombinationen
+aus Template x Kennzahl x Filter-State parallel an den Service:
+
+- context: Kontext bauen und Prompt rendern, ohne HTTP (je Anfrage)
+- cold:    leerer Antwort-Cache, jede Anfrage geht an den Mock
+- warm:    dieselben Anfragen erneut, alle aus dem Cache
+
+Pro Phase werden Durchsatz (Anfragen/s) und Latenz (p50/p95/p99)
+ausgegeben, fuer cold zusaetzlich Fehler (z.B. 429 bei --error-rate)
+und die Tokens laut Mock.
+
+Verwendung:
+    python scripts/benchmarks/bench_reports.py
+    python scripts/benchmarks/bench_reports.py --concurrency 32 --latency 0.5
+    python scripts/benchmarks/bench_reports.py --error-rate 0.05 --json
+"""
+
+import sys
+import json
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import convert
+from mock_messages_api import start_server
+from query import make_filter_state
+from reports import (DEFAULT_OUTPUT_DIR, TEMPLATES, MessagesClient, ReportError,
+                     ReportService, ResponseCache)
+
+
+# ============================================================
+# KONFIGURATION
+# ============================================================
+
+DEFAULT_CONCURRENCY = 16
+DEFAULT_LATENCY = 0.2
+DEFAULT_JITTER = 0.05
+
+# Standard-Ansichten des Dashboards: alle Unis, je Uni-Typ, VetMed
+FILTER_STATES = ([("alle", make_filter_state())]
+                 + [(uni_type, make_filter_state(uni_types=[uni_type])) for uni_type in convert.UNI_TYPES]
+                 + [("UI", make_filter_state(["UI"]))])
+
+
+# ============================================================
+# MESSUNG
+# ============================================================
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def summarize(name: str, latencies: List[float], seconds: float, errors: int = 0) -> dict:
+    return {
+        "phase": name,
+        "requests": len(latencies) + errors,
+        "errors": errors,
+        "seconds": round(seconds, 3),
+        "throughput": round((len(latencies) + errors) / seconds, 1) if seconds else None,
+        "p50": round(percentile(latencies, 50) * 1000, 2) if latencies else None,
+        "p95": round(percentile(latencies, 95) * 1000, 2) if latencies else None,
+        "p99": round(percentile(latencies, 99) * 1000, 2) if latencies else None
+    }
+
+
+def run_phase(name: str, task, jobs: List[tuple], concurrency: int) -> dict:
+    """Fuehrt task(*job) fuer alle Jobs parallel aus und misst jede Anfrage."""
+    def timed(job) -> Tuple[float, bool]:
+        start = time.perf_counter()
+        try:
+            task(*job)
+            return time.perf_counter() - start, True
+        except ReportError:
+            return time.perf_counter() - start, False
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(timed, jobs))
+    seconds = time.perf_counter() - start
+    return summarize(name, [t for t, ok in results if ok], seconds,
+                     errors=sum(1 for _, ok in results if not ok))
+
+
+def print_results(results: List[dict]):
+    columns = ["phase", "requests", "errors", "seconds", "throughput", "p50", "p95", "p99"]
+    print(f"{'Phase':<8} {'Anfragen':>8} {'Fehler':>6} {'Zeit s':>8} {'Anfr./s':>9} "
+          f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for result in results:
+        row = [result[c] if result[c] is not None else "–" for c in columns]
+        print(f"{row[0]:<8} {row[1]:>8} {row[2]:>6} {row[3]:>8} {row[4]:>9} "
+              f"{row[5]:>8} {row[6]:>8} {row[7]:>8}")
+
+
+# ============================================================
+# HAUPTFUNKTION
+# ============================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Lasttest des Berichts-Service gegen den Mock-Endpoint")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="Parallele Anfragen")
+    parser.add_argument("--latency", type=float, default=DEFAULT_LATENCY, help="Antwortzeit des Mocks (s)")
+    parser.add_argument("--jitter", type=float, default=DEFAULT_JITTER, help="Streuung der Antwortzeit (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Anteil abgelehnter Anfragen (429)")
+    parser.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR,
+                        help="Output-Verzeichnis von convert.py")
+    parser.add_argument("--json", action="store_true", help="Ergebnisse als JSON ausgeben")
+    args = parser.parse_args()
+
+    kennzahlen = sorted(path.stem for path in (args.output_dir / convert.COLUMNAR_DIRNAME).glob("*.json"))
+    if not kennzahlen:
+        print(f"[Benchmark] Keine konvertierten Kennzahlen in {args.output_dir}", file=sys.stderr)
+        sys.exit(1)
+    jobs = [(code, template, state) for code in kennzahlen for template in TEMPLATES
+            for _, state in FILTER_STATES]
+
+    server = start_server(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate, seed=0)
+    try:
+        service = ReportService(args.output_dir, MessagesClient(server.url),
+                                ResponseCache(path=None, capacity=len(jobs)))
+        if not args.json:
+            print(f"[Benchmark] {len(jobs)} Anfragen ({len(kennzahlen)} Kennzahlen x "
+                  f"{len(TEMPLATES)} Templates x {len(FILTER_STATES)} Filter), "
+                  f"{args.concurrency} parallel, Mock-Latenz {args.latency}s")
+        results = [
+            run_phase("context", service.prompt, jobs, 1),
+            run_phase("cold", service.generate, jobs, args.concurrency),
+            run_phase("warm", service.generate, jobs, args.concurrency)
+        ]
+        with server.lock:
+            stats = dict(server.stats)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    if args.json:
+        print(json.dumps({"results": results, "mock": stats}, indent=2))
+        return
+    print_results(results)
+    print(f"[Benchmark] Mock: {stats['requests']} Anfragen, {stats['rejected']} abgelehnt, "
+          f"Tokens {stats['inputTokens']} ein / {stats['outputTokens']} aus")
+
+
+if __name__ == "__main__":
+    main()
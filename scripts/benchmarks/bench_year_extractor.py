@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Micro-Benchmark: Jahres-Erkennung in Header-Zellen.
+
+Vergleicht die bisherige Implementierung (drei re.search-Aufrufe pro Zelle)
+mit dem vorkompilierten Single-Pass-Extractor aus header_parsing.py:
+ohne Memo-Cache, mit leerem Cache (kalt) und mit gefuelltem Cache (warm).
+
+Der Zell-Korpus bildet die Header-Suche eines XLCubed-Exports nach:
+die obersten 30 Zeilen x 20 Spalten, grossteils Titel-, Codex- und
+leere Zellen, dazu Jahres-Header in allen drei Formaten.
+
+Verwendung:
+    python scripts/benchmarks/bench_year_extractor.py
+    python scripts/benchmarks/bench_year_extractor.py --files 50 --repeat 5
+"""
+
+import re
+import sys
+import time
+import argparse
+from pathlib import Path
+from typing import Callable, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import header_parsing
+from header_parsing import extract_year_from_header
+
+
+# ============================================================
+# REFERENZ (bisherige Implementierung aus convert.py)
+# ============================================================
+
+def legacy_extract_year(header_text) -> Optional[int]:
+    """Extrahiert Jahr aus verschiedenen Header-Formaten (drei Suchlaeufe)."""
+    if not header_text:
+        return None
+
+    text = str(header_text)
+
+    match = re.search(r'WS(\d{4})', text)
+    if match:
+        return int(match.group(1))
+
+    match = re.search(r'(?:Wintersemester|Studienjahr)\s*(\d{4})', text)
+    if match:
+        return int(match.group(1))
+
+    match = re.search(r'\b(20\d{2})\b', text)
+    if match:
+        return int(match.group(1))
+
+    return None
+
+
+# ============================================================
+# KORPUS
+# ============================================================
+
+def header_cells(years: range) -> List:
+    """Zellen einer typischen Header-Suche (30 Zeilen x 20 Spalten)."""
+    cells = [
+        "Wissensbilanz-Kennzahl 1.A.1 Personal",
+        "Quelle: BMBWF, unidata",
+        "Stichtag: 31.12.2024",
+        "Universität (Codex)",
+        "Universitaet Wien (UA)",
+        "Frauen", "Männer", "Gesamt",
+        "Abfragedatum: 2025-01-15",
+        None, None, None, None, 0, 12.5, 317,
+    ]
+    for year in years:
+        cells.append(f"WS{year}")
+        cells.append(f"Wintersemester {year} (Stichtag: 30.11.{year})")
+        cells.append(f"Studienjahr {year}/{str(year + 1)[2:]}")
+        cells.append(year)
+
+    # auf 30 x 20 Zellen auffuellen
+    corpus = []
+    while len(corpus) < 600:
+        corpus.extend(cells)
+    return corpus[:600]
+
+
+# ============================================================
+# MESSUNG
+# ============================================================
+
+def measure(fn: Callable, corpus: List, repeat: int, before: Optional[Callable] = None) -> float:
+    """Beste Laufzeit (Sekunden) ueber repeat Durchlaeufe."""
+    best = float('inf')
+    for _ in range(repeat):
+        if before:
+            before()
+        start = time.perf_counter()
+        for cell in corpus:
+            fn(cell)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Micro-Benchmark Jahres-Erkennung')
+    parser.add_argument('--files', type=int, default=40,
+                        help='Anzahl simulierter Excel-Dateien (Standard: 40)')
+    parser.add_argument('--repeat', type=int, default=7,
+                        help='Wiederholungen, gemessen wird die beste (Standard: 7)')
+    args = parser.parse_args()
+
+    corpus = header_cells(range(2019, 2025)) * args.files
+
+    # Gleiche Ergebnisse sind Voraussetzung fuer den Vergleich
+    header_parsing._year_from_text.cache_clear()
+    mismatches = [c for c in corpus if legacy_extract_year(c) != extract_year_from_header(c)]
+    if mismatches:
+        print(f"[Benchmark] Fehler: {len(mismatches)} abweichende Ergebnisse, z.B. {mismatches[0]!r}")
+        sys.exit(1)
+
+    clear = header_parsing._year_from_text.cache_clear
+    uncached = header_parsing._year_from_text.__wrapped__
+    results = [
+        ("bisher (3x re.search)", measure(legacy_extract_year, corpus, args.repeat)),
+        ("single-pass, ohne Cache", measure(lambda c: uncached(str(c)) if c else None, corpus, args.repeat)),
+        ("single-pass, kalt", measure(extract_year_from_header, corpus, args.repeat, before=clear)),
+        ("single-pass, warm", measure(extract_year_from_header, corpus, args.repeat)),
+    ]
+
+    baseline = results[0][1]
+    print(f"[Benchmark] {len(corpus)} Zellen ({args.files} Dateien), beste von {args.repeat}")
+    print(f"{'Variante':<24} {'Zeit (ms)':>10} {'Zellen/s':>12} {'Faktor':>8}")
+    for name, seconds in results:
+        rate = len(corpus) / seconds if seconds else float('inf')
+        print(f"{name:<24} {seconds * 1000:>10.2f} {rate:>12,.0f} {baseline / seconds:>7.1f}x")
+
+    info = header_parsing._year_from_text.cache_info()
+    print(f"[Benchmark] Memo-Cache: {info.currsize} Eintraege, {info.hits} Treffer")
+
+
+if __name__ == '__main__':
+    main()
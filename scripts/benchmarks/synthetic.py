@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Synthetische Wissensbilanz-Arbeitsmappen fuer Benchmarks.
+
+Erzeugt Excel-Dateien in den Layouts, die convert.py erwartet:
+
+- Standard (XLCubed-Export): Sheet "Tab", Titel-Bereich, Header-Zeile 21
+  mit "Universität (Codex)" und Jahres-Spalten "Wintersemester JJJJ
+  (Stichtag: ...)", pro Uni eine Codex-Zeile plus zwei Unterzeilen
+- 3-A-1: Studienjahr in Spalte A, Uni-Code in C, Wert in E (ab Zeile 17)
+- 3-A-3: Studienjahre in Zeile 11, Uni-Buchstabe in B, "Insgesamt"-Zeilen
+
+Mehr als 22 Universitaeten bzw. Jahre ausserhalb von VALID_YEARS gibt es
+real nicht; synthetic_registry() erweitert die Konfiguration von
+convert.py fuer die Dauer eines Benchmarks entsprechend.
+
+Verwendung:
+    python scripts/benchmarks/synthetic.py OUTPUT_DIR --unis 2200 --years 11
+"""
+
+import sys
+import random
+import argparse
+from contextlib import contextmanager
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import convert
+
+try:
+    import openpyxl
+except ImportError:
+    print("[Benchmark] Fehler: openpyxl nicht installiert")
+    sys.exit(1)
+
+
+# ============================================================
+# KONFIGURATION
+# ============================================================
+
+# Letztes Jahr der synthetischen Zeitreihen (Header absteigend wie im Export)
+LAST_YEAR = 2024
+
+# Header-Zeile der Standard-Dateien (wie in den XLCubed-Exporten)
+HEADER_ROW = 21
+
+# Unterzeilen je Uni ohne Codex (werden vom Konverter uebersprungen)
+SUB_ROWS = ("Wissenschaftliches Personal", "Allgemeines Personal")
+
+
+# ============================================================
+# ACHSEN
+# ============================================================
+
+def synthetic_uni_codes(count: int) -> List[str]:
+    """Echte Uni-Codes, darueber hinaus synthetische Codes (S00023, ...)."""
+    real = list(convert.VALID_UNI_CODES)
+    if count <= len(real):
+        return real[:count]
+    return real + [f"S{i:05d}" for i in range(len(real), count)]
+
+
+def synthetic_years(count: int) -> List[int]:
+    """Jahre absteigend bis LAST_YEAR (Reihenfolge wie im Export)."""
+    return list(range(LAST_YEAR, LAST_YEAR - count, -1))
+
+
+@contextmanager
+def synthetic_registry(uni_codes: List[str], years: List[int]):
+    """Erweitert VALID_UNI_CODES und VALID_YEARS in convert.py voruebergehend."""
+    saved_codes, saved_years = convert.VALID_UNI_CODES, convert.VALID_YEARS
+    codes = dict(saved_codes)
+    codes.update({code: f"Synthetische Universitaet {code}" for code in uni_codes if code not in codes})
+    convert.VALID_UNI_CODES = codes
+    convert.VALID_YEARS = range(min(min(years), saved_years.start), max(max(years) + 1, saved_years.stop))
+    try:
+        yield
+    finally:
+        convert.VALID_UNI_CODES, convert.VALID_YEARS = saved_codes, saved_years
+
+
+# ============================================================
+# GENERATOREN
+# ============================================================
+
+def write_standard(path: Path, uni_codes: List[str], years: List[int], seed: int = 0) -> Path:
+    """Standard-Layout (1-A-1, 2-A-5, ...) im Write-Only-Modus."""
+    rng = random.Random(seed)
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("Tab")
+
+    # Titel-Bereich (Zeilen 1-20)
+    preamble = {
+        1: ["Wissensbilanz-Kennzahl (synthetisch)"],
+        3: ["Quelle: BMBWF, unidata"],
+        5: [f"Stichtag: 31.12.{years[0]}"],
+    }
+    for row_idx in range(1, HEADER_ROW):
+        ws.append(preamble.get(row_idx, []))
+
+    ws.append(["Universität", "Universität (Codex)", "Universität (Langtext)", "Verwendung"]
+              + [f"Wintersemester {year} (Stichtag: 31.12.{year})" for year in years])
+
+    for code in uni_codes:
+        ws.append([f"Uni {code}", code, f"Universitaet {code}", None]
+                  + [float(rng.randint(100, 9000)) for _ in years])
+        for sub in SUB_ROWS:
+            ws.append([None, None, None, sub] + [rng.randint(10, 900) for _ in years])
+
+    wb.save(path)
+    return path
+
+
+def write_3a1(path: Path, years: List[int]) -> Path:
+    """3-A-1-Layout: nur Donau-Uni Krems (UM), max. Zeile 99."""
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("Tab")
+    for _ in range(16):
+        ws.append([])
+    for year in years[:40]:
+        ws.append([f"Studienjahr {year}/{str(year + 1)[2:]}", None, "UM", None, 100 + year % 100])
+        ws.append([None, None, "UA", None, 5])
+    wb.save(path)
+    return path
+
+
+def write_3a3(path: Path, years: List[int]) -> Path:
+    """3-A-3-Layout: 4 Spalten je Studienjahr, Jahres-Header nur bis Spalte 19."""
+    letters = list(convert.LETTER_TO_UNI_CODE)
+    years = years[:4]
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("Tab")
+    for _ in range(10):
+        ws.append([])
+
+    header, labels = [None] * 3, [None] * 3
+    for year in years:
+        header += [f"Studienjahr {year}/{str(year + 1)[2:]}", None, None, None]
+        labels += ["Frauen", "Männer", "Gesamt", None]
+    ws.append(header)
+    ws.append(labels)
+
+    for i, letter in enumerate(letters):
+        ws.append([f"Uni {letter}", letter, "mit Auslandsaufenthalt"])
+        row = [None, None, "Insgesamt"]
+        for j, _ in enumerate(years):
+            row += [1, 2, 10 + i + j, None]
+        ws.append(row)
+    wb.save(path)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Synthetische Wissensbilanz-Arbeitsmappen')
+    parser.add_argument('output', type=Path, help='Zielverzeichnis')
+    parser.add_argument('--unis', type=int, default=22, help='Anzahl Universitaeten (Standard: 22)')
+    parser.add_argument('--years', type=int, default=3, help='Anzahl Jahre (Standard: 3)')
+    args = parser.parse_args()
+
+    args.output.mkdir(parents=True, exist_ok=True)
+    years = synthetic_years(args.years)
+    path = write_standard(args.output / f"synthetic-u{args.unis}-y{args.years}.xlsx",
+                          synthetic_uni_codes(args.unis), years)
+    write_3a1(args.output / "3-A-1 synthetic.xlsx", years)
+    write_3a3(args.output / "3-A-3 synthetic.xlsx", years)
+    print(f"[Benchmark] Erzeugt: {path}")
+
+
+if __name__ == '__main__':
+    main()
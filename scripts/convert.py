@@ -3,33 +3,59 @@
 Wissensbilanz Konverter - Unified Excel zu JSON Konverter.
 
 Konsolidiert alle Konvertierungslogik fuer Wissensbilanz-Daten.
-Ersetzt: convert_excel_to_json.py, convert_3a1.py, convert_3a3.py
+Ersetzt: convert_excel_to_json.py, convert_3a1.py, convert_3a3.py (rufen nur noch
+convert.py auf). Die Layouts aller Kennzahlen sind in KENNZAHL_SPECS beschrieben.
 
 Verwendung:
     python scripts/convert.py                    # Alle Dateien konvertieren
     python scripts/convert.py --file "1-A-1"     # Spezifische Kennzahl
     python scripts/convert.py --analyze          # Struktur analysieren
     python scripts/convert.py --validate         # Output validieren
+    python scripts/convert.py --jobs 4           # Parallel mit 4 Prozessen
+    python scripts/convert.py --force            # Auch unveraenderte Dateien neu konvertieren
+    python scripts/convert.py --compact          # Kennzahl-Dateien ohne Einrueckung schreiben
+    python scripts/convert.py --watch            # data/ beobachten, Aenderungen sofort konvertieren
+    python scripts/convert.py --store            # Zusaetzlich SQLite-Speicher (store/) schreiben
 
 Autor: VetMed AI Initiative
-Version: 2.0.0
+Version: 2.4.0
 """
 
 import os
 import sys
 import json
-import re
+import gzip
+import hashlib
+import time
 import argparse
+import array
+import tracemalloc
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from itertools import chain, islice
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Set
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 try:
-    import openpyxl
+    import openpyxl  # nur zum Lesen der Arbeitsmappen (Konstanten/Ausgabe gehen ohne)
 except ImportError:
-    print("[Converter] Fehler: openpyxl nicht installiert")
-    print("[Converter] Installation: pip install openpyxl")
-    sys.exit(1)
+    openpyxl = None
+
+try:
+    import brotli  # optional: vorkomprimiertes Bundle (.br)
+except ImportError:
+    brotli = None
+
+import header_parsing
+import json_writer
+from header_parsing import extract_year_from_header
+from json_writer import (JsonArrayWriter, atomic_write, compact_number,
+                         write_bytes, write_json)
+from validation import validate_points, summarize_violations
+from anomalies import build_anomaly_report
+from store import build_store
 
 
 # ============================================================
@@ -62,6 +88,31 @@ VALID_UNI_CODES = {
     "UW": "Universitaet fuer kuenstlerische und industrielle Gestaltung Linz",
 }
 
+# Universitaets-Typen (wie UNIVERSITIES in docs/js/data/metadata.js)
+UNI_TYPE_BY_CODE = {
+    "UA": "voll", "UB": "voll", "UC": "voll", "UD": "voll", "UK": "voll", "UL": "voll",
+    "UH": "voll", "UJ": "voll",
+    "UE": "tech", "UF": "tech", "UG": "tech",
+    "UN": "med", "UO": "med", "UQ": "med", "UI": "med",
+    "UR": "kunst", "US": "kunst", "UT": "kunst", "UU": "kunst", "UV": "kunst", "UW": "kunst",
+    "UM": "weiterb",
+}
+UNI_TYPES = ["voll", "tech", "med", "kunst", "weiterb"]
+
+# Kurznamen (wie shortName in docs/js/data/metadata.js), bestimmen die Zeilen-Reihenfolge der Ansichten
+UNI_SHORT_NAMES = {
+    "UA": "Uni Wien", "UB": "Uni Graz", "UC": "Uni Innsbruck", "UD": "Uni Salzburg",
+    "UK": "JKU Linz", "UL": "AAU Klagenfurt", "UH": "BOKU", "UJ": "WU Wien",
+    "UE": "TU Wien", "UF": "TU Graz", "UG": "MU Leoben",
+    "UN": "Med Uni Wien", "UO": "Med Uni Graz", "UQ": "Med Uni IBK", "UI": "VetMed",
+    "UR": "Akademie Wien", "US": "Angewandte", "UT": "MDW", "UU": "Mozarteum", "UV": "KUG",
+    "UW": "Kunst Uni Linz",
+    "UM": "Donau-Uni",
+}
+
+# Fokus-Uni der Ansicht "vetmed" (Vergleich mit den Unis desselben Typs)
+FOCUS_UNI = "UI"
+
 # Gueltiger Jahresbereich
 VALID_YEARS = range(2019, 2030)
 
@@ -91,63 +142,238 @@ FILE_TO_KENNZAHL = {
     "3-A-3 Studienabschluesse mit studienbezogenem Auslandsaufenthalt.xlsx": "3-A-3",
 }
 
-# Spezial-Kennzahlen mit eigener Konvertierungslogik
-SPECIAL_KENNZAHLEN = {"3-A-1", "3-A-3"}
+# Umlaute in Dateinamen (Original-Exporte, z.B. "Koepfe" als "Köpfe")
+FILENAME_TRANSLITERATION = str.maketrans({
+    "ä": "ae", "ö": "oe", "ü": "ue", "Ä": "Ae", "Ö": "Oe", "Ü": "Ue", "ß": "ss",
+})
+
+# Konverter-Registry: wie eine Kennzahl aus ihrer Arbeitsmappe gelesen wird.
+# Kennzahlen ohne Eintrag verwenden STANDARD_SPEC. Neue Quellen brauchen nur
+# einen Eintrag in FILE_TO_KENNZAHL und, bei abweichendem Layout, hier.
+#
+#   sheet:  Sheet-Name (None = "Tab", sonst das erste Sheet)
+#   rows:   erste/letzte Datenzeile (1-basiert, last = None bis Sheet-Ende)
+#   header: Jahres-Erkennung
+#           - detect:    Header-Zeile mit Jahres-Spalten suchen (Layout-Cache)
+#           - fixed-row: Jahres-Header in Zeile "row", Spalten "columns",
+#                        Wert-Spalte = Jahres-Spalte + "offset"
+#           - row-years: Jahr steht in jeder Datenzeile in Spalte "column"
+#   codes:  Uni-Code einer Zeile
+#           - codex:  Uni-Code in der Codex-Spalte des Headers
+#           - letter: Buchstabe in "column" (LETTER_TO_UNI_CODE), gilt bis zur
+#                     naechsten Zeile mit Uni-Name in "name_column"
+#           - match:  fester Code "code", wenn "column" den Text "contains" enthaelt
+#   values: Wert-Spalte ("column" bei row-years, sonst die Jahres-Spalten) und
+#           optional "filter": nur Zeilen, deren "column" "contains" enthaelt
+#   dimensions: optional, Aufschluesselung im selben Durchlauf (dimensions/):
+#           alle Wert-Spalten des Jahres-Headers (Geschlecht aus der
+#           Beschriftungszeile direkt unter/ueber dem Header, GENDER_LABELS)
+#           und alle Zeilen einer Uni ("category": Kategorie-Spalte "column")
+STANDARD_SPEC = {
+    "sheet": None,
+    "rows": {"first": 1, "last": None},
+    "header": {"strategy": "detect"},
+    "codes": {"strategy": "codex"},
+    "values": {},
+    "dimensions": {"category": {"column": 4}},
+}
+
+KENNZAHL_SPECS = {
+    # Ausserordentliche Studienabschluesse: nur Donau-Uni Krems (UM),
+    # ein Studienjahr pro Zeile
+    "3-A-1": {
+        "sheet": "Tab",
+        "rows": {"first": 17, "last": 99},
+        "header": {"strategy": "row-years", "column": 1},
+        "codes": {"strategy": "match", "column": 3, "contains": "UM", "code": "UM"},
+        "values": {"column": 5},
+    },
+    # Studienabschluesse mit Auslandsaufenthalt: Buchstaben-Codes, 4 Spalten
+    # je Studienjahr (Gesamt = 2 weiter), nur "Insgesamt"-Zeilen
+    "3-A-3": {
+        "sheet": "Tab",
+        "rows": {"first": 13, "last": 299},
+        "header": {"strategy": "fixed-row", "row": 11, "columns": [1, 19], "offset": 2},
+        "codes": {"strategy": "letter", "column": 2, "name_column": 1},
+        "values": {"filter": {"column": 3, "contains": "Insgesamt"}},
+        "dimensions": {"category": {"column": 3}},
+    },
+}
+
+# Beschriftungen der Geschlechts-Spalten unter bzw. ueber dem Jahres-Header
+GENDER_LABELS = ("Frauen", "Männer", "Gesamt")
+
+# Kategorie von Zeilen ohne Eintrag in der Kategorie-Spalte (Uni-Summenzeile)
+TOTAL_CATEGORY = "Insgesamt"
+
+# Konverter-Version (bei Aenderungen am Output-Format erhoehen)
+CONVERTER_VERSION = "2.4.0"
+
+# Unterverzeichnis fuer das kompakte Spalten-Format
+COLUMNAR_DIRNAME = "columnar"
+
+# Unterverzeichnis fuer vorberechnete Aggregate (Jahr x Uni-Typ)
+CUBE_DIRNAME = "cube"
+
+# Vorbereitete Chart-Reihen je Standard-Ansicht (alle, je Uni-Typ, VetMed)
+VIEWS_DIRNAME = "views"
+
+# Sparklines und Heatmap-Farbstufen als Binaerdatei mit JSON-Index
+TILES_DIRNAME = "tiles"
+TILES_INDEX_FILENAME = "index.json"
+TILES_BLOB_FILENAME = "tiles.bin"
+
+# Aufloesung der Sparkline-Vektoren (8 oder 16 Bit) und Anzahl der Heatmap-Farbstufen
+SPARKLINE_BITS = 8
+HEATMAP_BINS = 32
+
+# Mehrdimensionale Datenpunkte (Geschlecht, Kategorie) je Kennzahl
+DIMENSIONS_DIRNAME = "dimensions"
+
+# Join-Tabelle aller Kennzahlen auf gemeinsamer (uniCode, year)-Achse
+JOIN_DIRNAME = "join"
+JOIN_FILENAME = "kennzahlen.json"
+
+# Unterverzeichnis und Dateiname des Daten-Bundles (alle Kennzahlen)
+BUNDLE_DIRNAME = "bundle"
+BUNDLE_FILENAME = "kennzahlen.ndjson"
+
+# Plausibilitaets-Report (markierte Punkte aller Kennzahlen)
+ANOMALY_DIRNAME = "anomalies"
+ANOMALY_FILENAME = "report.json"
+
+# Analytischer Speicher aller Kennzahlen (optional, --store)
+STORE_DIRNAME = "store"
+STORE_FILENAME = "kennzahlen.sqlite"
+
+# Manifest fuer inkrementelle Konvertierung (liegt im Output-Verzeichnis, nicht eingecheckt)
+MANIFEST_FILENAME = "_manifest.json"
+
+# Layout-Cache (Header-Zeile, Jahres-Spalten, Codex-Spalte je Struktur),
+# relativ zum data-Verzeichnis
+LAYOUT_CACHE_FILE = Path(".cache") / "layouts.json"
+
+# Anzahl Zeilen fuer Header-Suche und Struktur-Fingerprint
+LAYOUT_SCAN_ROWS = 30
+
+# Watch-Modus: Abfrage-Intervall des data-Verzeichnisses und Wartezeit, bis
+# eine geaenderte Datei als fertig geschrieben gilt (Sekunden)
+WATCH_INTERVAL = 0.2
+WATCH_DEBOUNCE = 0.4
+
+# Quelldateien, deren Inhalt in den Konverter-Fingerprint eingeht
+CONVERTER_SOURCES = [
+    Path(__file__).resolve(),
+    Path(header_parsing.__file__).resolve(),
+    Path(json_writer.__file__).resolve(),
+]
 
 
 # ============================================================
-# HILFSFUNKTIONEN
+# STAGE-MESSUNG
 # ============================================================
 
-def extract_year_from_header(header_text: str) -> Optional[int]:
-    """Extrahiert Jahr aus verschiedenen Header-Formaten."""
-    if not header_text:
-        return None
+# Gesammelte Stage-Messungen dieses Prozesses (None = Messung aus)
+_stage_records: Optional[List[dict]] = None
 
-    text = str(header_text)
 
-    # WS2024 Format
-    match = re.search(r'WS(\d{4})', text)
-    if match:
-        return int(match.group(1))
+def start_stage_recording():
+    """Aktiviert die Stage-Messung (Benchmarks, Profiling)."""
+    global _stage_records
+    _stage_records = []
 
-    # Wintersemester 2024 oder Studienjahr 2024 Format
-    match = re.search(r'(?:Wintersemester|Studienjahr)\s*(\d{4})', text)
-    if match:
-        return int(match.group(1))
 
-    # Nur Jahr
-    match = re.search(r'\b(20\d{2})\b', text)
-    if match:
-        return int(match.group(1))
+def stop_stage_recording() -> List[dict]:
+    """Beendet die Stage-Messung und gibt die Messungen zurueck."""
+    global _stage_records
+    records, _stage_records = _stage_records or [], None
+    return records
 
-    return None
 
+@contextmanager
+def stage(name: str, **meta):
+    """
+    Misst einen Verarbeitungsschritt (load, header, extract, write, ...).
 
-def find_header_row(ws, max_rows: int = 30) -> Tuple[Optional[int], Dict[int, int]]:
+    Ohne aktive Messung ein No-Op. Laeuft tracemalloc, werden zusaetzlich
+    der Speicher-Peak des Schritts und der Speicherstand danach erfasst.
+    Stages werden nicht verschachtelt.
     """
-    Findet die Header-Zeile mit Jahreszahlen.
-    Returns: (header_row_idx, {year: col_idx})
+    if _stage_records is None:
+        yield
+        return
+
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.reset_peak()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record = {"stage": name, "start": start,
+                  "seconds": time.perf_counter() - start, "pid": os.getpid(), **meta}
+        if tracing:
+            record["current_bytes"], record["peak_bytes"] = tracemalloc.get_traced_memory()
+        _stage_records.append(record)
+
+
+# ============================================================
+# HILFSFUNKTIONEN
+# ============================================================
+
+def open_workbook(filepath: Path):
     """
-    for row_idx, row in enumerate(ws.iter_rows(max_row=max_rows, values_only=True), start=1):
-        year_columns = {}
-        for col_idx, cell in enumerate(row):
-            if cell is not None:
-                year = extract_year_from_header(cell)
-                if year and year in VALID_YEARS:
-                    year_columns[year] = col_idx
+    Oeffnet eine Arbeitsmappe im Read-Only-Modus.
+    Zeilen werden beim Iterieren gestreamt, das Sheet wird nie komplett
+    als Zell-Objekte im Speicher aufgebaut.
+    """
+    if openpyxl is None:
+        raise ImportError("openpyxl nicht installiert (pip install openpyxl)")
+    return openpyxl.load_workbook(filepath, read_only=True, data_only=True)
 
-        if len(year_columns) >= 2:
-            return row_idx, year_columns
 
-    return None, {}
+def stream_rows(ws, max_row: Optional[int] = None) -> Iterator[Tuple[int, tuple]]:
+    """Liefert (Zeilennummer, Werte) in einem Durchlauf, 1-basiert wie in Excel."""
+    return enumerate(ws.iter_rows(max_row=max_row, values_only=True), start=1)
+
 
+def row_value(row: tuple, column: int):
+    """Liest eine Zelle aus einem Zeilen-Tupel (Spalte 1-basiert wie ws.cell)."""
+    return row[column - 1] if 0 < column <= len(row) else None
 
-def find_codex_column(ws, header_row: int) -> int:
-    """Findet die Spalte mit dem Uni-Code (Codex)."""
-    row = list(ws.iter_rows(min_row=header_row, max_row=header_row, values_only=True))[0]
 
+def header_year_columns(row: tuple) -> Dict[int, int]:
+    """Findet Jahres-Spalten in einer Zeile. Returns: {year: col_idx}"""
+    year_columns = {}
     for col_idx, cell in enumerate(row):
+        if cell is not None:
+            year = extract_year_from_header(cell)
+            if year and year in VALID_YEARS:
+                year_columns[year] = col_idx
+    return year_columns
+
+
+def find_header_row(rows: Iterator[Tuple[int, tuple]],
+                    max_rows: int = 30) -> Tuple[Optional[int], Dict[int, int], tuple]:
+    """
+    Findet die Header-Zeile mit Jahreszahlen im Zeilen-Stream.
+    Der Stream wird nur bis zur Header-Zeile konsumiert, danach
+    koennen die Datenzeilen direkt weitergelesen werden.
+    Returns: (header_row_idx, {year: col_idx}, header_row)
+    """
+    for row_idx, row in rows:
+        if row_idx > max_rows:
+            break
+        year_columns = header_year_columns(row)
+        if len(year_columns) >= 2:
+            return row_idx, year_columns, row
+
+    return None, {}, ()
+
+
+def find_codex_column(header: tuple) -> int:
+    """Findet die Spalte mit dem Uni-Code (Codex) in der Header-Zeile."""
+    for col_idx, cell in enumerate(header):
         if cell and 'Codex' in str(cell):
             return col_idx
 
@@ -155,6 +381,143 @@ def find_codex_column(ws, header_row: int) -> int:
     return 1
 
 
+# ============================================================
+# LAYOUT-CACHE
+# ============================================================
+
+# Geladene Layout-Caches je data-Verzeichnis (pro Prozess)
+_layout_caches: Dict[Path, dict] = {}
+
+
+def structure_fingerprint(sheet_name: str, rows: List[tuple]) -> str:
+    """
+    Fingerprint der Struktur der obersten Zeilen eines Sheets.
+    Texte (Titel, Spaltenueberschriften) gehen woertlich ein, Zahlen nur
+    als Platzhalter - neue Messwerte aendern den Fingerprint also nicht.
+    Jahreszahlen als Zahl-Zellen ebenfalls nicht; die prueft
+    layout_from_rows bei einem Treffer an der Header-Zeile nach.
+    """
+    signature = [sheet_name]
+    for row in rows:
+        cells = []
+        for cell in row:
+            if cell is None:
+                cells.append("")
+            elif isinstance(cell, str):
+                cells.append(cell.strip())
+            else:
+                cells.append("#")
+        while cells and cells[-1] == "":
+            cells.pop()
+        signature.append("\t".join(cells))
+    return hashlib.sha256("\n".join(signature).encode('utf-8')).hexdigest()[:16]
+
+
+def load_layout_cache(data_dir: Path) -> dict:
+    """
+    Laedt den Layout-Cache eines data-Verzeichnisses (einmal pro Prozess).
+    Aendert sich die Konverter-Logik, wird der Cache verworfen.
+    """
+    data_dir = data_dir.resolve()
+    if data_dir in _layout_caches:
+        return _layout_caches[data_dir]
+
+    cache = {"converter_hash": converter_fingerprint(), "layouts": {}, "files": {}}
+    cache_file = data_dir / LAYOUT_CACHE_FILE
+    if cache_file.exists():
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            if stored.get("converter_hash") == cache["converter_hash"]:
+                cache["layouts"] = stored.get("layouts", {})
+                cache["files"] = stored.get("files", {})
+        except (json.JSONDecodeError, OSError):
+            pass
+
+    _layout_caches[data_dir] = cache
+    return cache
+
+
+def save_layout_cache(data_dir: Path):
+    """Speichert den Layout-Cache (falls in diesem Prozess geladen)."""
+    cache = _layout_caches.get(data_dir.resolve())
+    if cache is None:
+        return
+    cache_file = data_dir / LAYOUT_CACHE_FILE
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    write_json(cache_file, cache)
+
+
+def layout_from_rows(sheet_name: str, top: List[Tuple[int, tuple]],
+                     data_dir: Path) -> Tuple[dict, bool]:
+    """
+    Layout fuer die obersten Zeilen eines Sheets: Cache-Treffer ueber den
+    Struktur-Fingerprint, sonst Header-Erkennung (und Eintrag in den Cache).
+    Returns: (layout, cache_hit)
+    """
+    fingerprint = structure_fingerprint(sheet_name, [row for _, row in top])
+
+    cache = load_layout_cache(data_dir)
+    layout = cache["layouts"].get(fingerprint)
+    if layout is not None and layout["header_row"] is not None:
+        # Jahreszahlen im Header sind Zahlen und stecken nicht im Fingerprint:
+        # Header-Zeile nachpruefen, sonst landen Werte im falschen Jahr
+        header = next((row for idx, row in top if idx == layout["header_row"]), ())
+        years = {str(year): col for year, col in header_year_columns(header).items()}
+        if years != layout["year_columns"]:
+            layout = None
+    cache_hit = layout is not None
+
+    if not cache_hit:
+        header_row, year_columns, header = find_header_row(iter(top), LAYOUT_SCAN_ROWS)
+        layout = {
+            "sheet": sheet_name,
+            "header_row": header_row,
+            "year_columns": {str(year): col for year, col in year_columns.items()},
+            "codex_col": find_codex_column(header) if header_row else None
+        }
+        cache["layouts"][fingerprint] = layout
+
+    return {"fingerprint": fingerprint, **layout}, cache_hit
+
+
+def detect_layout(ws, sheet_name: str, data_dir: Path):
+    """
+    Ermittelt das Layout eines Sheets, bei bekannter Struktur aus dem Cache.
+
+    Liest nur die obersten LAYOUT_SCAN_ROWS Zeilen aus dem Stream. Die
+    Datenzeilen danach (inkl. bereits gelesener Zeilen nach dem Header)
+    werden als Iterator zurueckgegeben, das Sheet wird nur einmal gelesen.
+
+    Returns: (layout, data_rows, cache_hit, top)
+      layout = {fingerprint, sheet, header_row, year_columns, codex_col}
+      top    = die gelesenen obersten Zeilen als [(Zeilennummer, Werte)]
+    """
+    rows = stream_rows(ws)
+    top = list(islice(rows, LAYOUT_SCAN_ROWS))
+    layout, cache_hit = layout_from_rows(sheet_name, top, data_dir)
+
+    header_row = layout["header_row"]
+    if header_row is None:
+        return layout, iter(()), cache_hit, top
+
+    data_rows = chain(((idx, row) for idx, row in top if idx > header_row), rows)
+    return layout, data_rows, cache_hit, top
+
+
+def layout_year_columns(layout: dict) -> Dict[int, int]:
+    """Jahres-Spalten eines Layouts als {year: col_idx} (JSON-Keys sind Strings)."""
+    return {int(year): col for year, col in layout["year_columns"].items()}
+
+
+def merge_layout(data_dir: Path, filename: str, kennzahl_code: Optional[str], layout: dict):
+    """Uebernimmt ein (evtl. in einem Worker-Prozess) ermitteltes Layout in den Cache."""
+    cache = load_layout_cache(data_dir)
+    entry = {k: v for k, v in layout.items() if k != "fingerprint"}
+    cache["layouts"][layout["fingerprint"]] = entry
+    cache["files"][filename] = {"fingerprint": layout["fingerprint"], "kennzahl": kennzahl_code}
+
+
 def normalize_value(value) -> Optional[float]:
     """Normalisiert einen Wert zu float oder None."""
     if value is None:
@@ -175,192 +538,911 @@ def validate_data_point(point: dict) -> bool:
 
 
 # ============================================================
-# STANDARD-KONVERTER
+# OUTPUT
 # ============================================================
 
-def convert_standard(filepath: Path, output_dir: Path, kennzahl_code: str) -> dict:
-    """
-    Standard-Konvertierung fuer die meisten Wissensbilanz-Dateien.
+# Datenpunkt als (uniCode, year, value) fuer Spalten-Format und Cube
+PointRow = Tuple[str, int, Optional[float]]
+
+
+def to_columnar(rows: List[PointRow], kennzahl_code: str) -> dict:
     """
-    wb = openpyxl.load_workbook(filepath, data_only=True)
+    Wandelt Datenpunkte (als PointRow) in das kompakte Spalten-Format um.
 
-    # Sheet auswaehlen
-    ws = wb['Tab'] if 'Tab' in wb.sheetnames else wb.active
+    - unis/years: Achsen in Reihenfolge des ersten Auftretens
+    - values: dichte Matrix (unis x years, zeilenweise flach), 0 als Platzhalter
+    - mask: ein Zeichen pro Zelle: "1" = Wert, "0" = null, "." = kein Datenpunkt
 
-    # Header-Zeile finden
-    header_row, year_columns = find_header_row(ws)
-    if not year_columns:
-        wb.close()
-        return {"error": "Keine Jahreszahlen im Header gefunden", "file": filepath.name}
+    Die Expansion (Uni fuer Uni, Jahr fuer Jahr, "." auslassen) ergibt
+    wieder die urspruengliche Punktliste.
+    """
+    unis: Dict[str, int] = {}
+    years: Dict[int, int] = {}
+    for uni_code, year, _ in rows:
+        unis.setdefault(uni_code, len(unis))
+        years.setdefault(year, len(years))
+
+    size = len(unis) * len(years)
+    values = [0] * size
+    mask = ["."] * size
+    for uni_code, year, value in rows:
+        idx = unis[uni_code] * len(years) + years[year]
+        if value is None:
+            mask[idx] = "0"
+        else:
+            mask[idx] = "1"
+            values[idx] = compact_number(value)
+
+    return {
+        "format": "columnar",
+        "version": 1,
+        "kennzahl": kennzahl_code,
+        "unis": list(unis),
+        "years": list(years),
+        "values": values,
+        "mask": "".join(mask)
+    }
 
-    # Codex-Spalte finden
-    codex_col = find_codex_column(ws, header_row)
 
+def from_columnar(payload: dict) -> List[dict]:
+    """Expandiert das Spalten-Format zurueck in Datenpunkte."""
     data_points = []
-    unis_found: Set[str] = set()
-    years_found = set(year_columns.keys())
-    invalid_count = 0
+    n_years = len(payload["years"])
+    mask = payload["mask"]
+    for u, uni_code in enumerate(payload["unis"]):
+        for y, year in enumerate(payload["years"]):
+            idx = u * n_years + y
+            if mask[idx] == ".":
+                continue
+            data_points.append({
+                "uniCode": uni_code,
+                "year": year,
+                "value": float(payload["values"][idx]) if mask[idx] == "1" else None,
+                "kennzahl": payload["kennzahl"]
+            })
+    return data_points
 
-    # Daten extrahieren
-    for row in ws.iter_rows(min_row=header_row + 1, values_only=True):
-        if codex_col >= len(row):
-            continue
 
-        codex = row[codex_col]
-        if codex is None:
+def build_cube(rows: List[PointRow], kennzahl_code: str) -> dict:
+    """
+    Berechnet den Aggregat-Cube einer Kennzahl (Datenpunkte als PointRow).
+
+    - types[typ][stat][i]: sum/mean/count/min/max je Jahr (years aufsteigend)
+      fuer jeden Uni-Typ sowie "all" (null-Werte werden ignoriert wie im Dashboard)
+    - deltas[uni]: abs/pct Veraenderung zum Vorjahr, am ersten Jahr null
+    """
+    years = sorted({year for _, year, _ in rows})
+    year_pos = {year: i for i, year in enumerate(years)}
+
+    groups: Dict[str, List[List[float]]] = {
+        type_id: [[] for _ in years] for type_id in ["all"] + UNI_TYPES
+    }
+    series: Dict[str, List[Optional[float]]] = {}
+
+    for uni_code, year, value in rows:
+        series.setdefault(uni_code, [None] * len(years))[year_pos[year]] = value
+        if value is None:
             continue
+        groups["all"][year_pos[year]].append(value)
+        type_id = UNI_TYPE_BY_CODE.get(uni_code)
+        if type_id:
+            groups[type_id][year_pos[year]].append(value)
+
+    types = {}
+    for type_id, by_year in groups.items():
+        types[type_id] = {
+            "sum": [compact_number(round(sum(v), 4)) for v in by_year],
+            "mean": [compact_number(round(sum(v) / len(v), 4)) if v else None for v in by_year],
+            "count": [len(v) for v in by_year],
+            "min": [compact_number(min(v)) if v else None for v in by_year],
+            "max": [compact_number(max(v)) if v else None for v in by_year]
+        }
+
+    deltas = {}
+    for uni_code, values in series.items():
+        delta_abs: List[Optional[float]] = [None]
+        delta_pct: List[Optional[float]] = [None]
+        for prev, curr in zip(values, values[1:]):
+            if prev is None or curr is None:
+                delta_abs.append(None)
+                delta_pct.append(None)
+                continue
+            delta_abs.append(compact_number(round(curr - prev, 4)))
+            delta_pct.append(round((curr - prev) / prev * 100, 2) if prev != 0 else None)
+        deltas[uni_code] = {"abs": delta_abs, "pct": delta_pct}
+
+    return {
+        "format": "cube",
+        "version": 1,
+        "kennzahl": kennzahl_code,
+        "years": years,
+        "types": types,
+        "deltas": deltas
+    }
+
+
+def view_order(uni_code: str) -> Tuple[int, str, str]:
+    """Sortierschluessel wie in Heatmap.js: Uni-Typ, dann Kurzname."""
+    type_id = UNI_TYPE_BY_CODE.get(uni_code)
+    type_pos = UNI_TYPES.index(type_id) if type_id in UNI_TYPES else len(UNI_TYPES)
+    return type_pos, UNI_SHORT_NAMES.get(uni_code, uni_code).casefold(), uni_code
+
+
+def view_series(values: List[List[Optional[float]]], members: List[int]) -> dict:
+    """
+    Reihen einer Ansicht (Zeilen-Indizes members): mean/min/max je Jahr und
+    ranking je Jahr (Zeilen absteigend nach Wert, null-Werte ausgelassen).
+    """
+    view = {"rows": members, "mean": [], "min": [], "max": [], "ranking": []}
+    for y in range(len(values[0]) if values else 0):
+        present = [(values[m][y], m) for m in members if values[m][y] is not None]
+        column = [value for value, _ in present]
+        view["mean"].append(compact_number(round(sum(column) / len(column), 4)) if column else None)
+        view["min"].append(compact_number(min(column)) if column else None)
+        view["max"].append(compact_number(max(column)) if column else None)
+        view["ranking"].append([m for _, m in sorted(present, key=lambda item: -item[0])])
+    return view
+
+
+def build_views(rows: List[PointRow], kennzahl_code: str) -> dict:
+    """
+    Bereitet die Chart-Reihen einer Kennzahl fuer die Standard-Ansichten vor
+    (Datenpunkte als PointRow), so dass der Client nicht gruppieren und
+    sortieren muss.
+
+    - unis: Zeilen in Heatmap-Reihenfolge (Uni-Typ, dann Kurzname)
+    - values[zeile][i]: Wert je Jahr (years aufsteigend), null ohne Wert
+    - mask: wie im Spalten-Format ("1" = Wert, "0" = null, "." = kein Datenpunkt)
+    - views[ansicht]: rows (Zeilen in Anzeige-Reihenfolge), mean/min/max und
+      ranking je Jahr; Ansichten "all", je Uni-Typ und "vetmed" (nur FOCUS_UNI,
+      dazu peers und peerMean der Unis desselben Typs)
+    """
+    years = sorted({year for _, year, _ in rows})
+    year_pos = {year: i for i, year in enumerate(years)}
+    unis = sorted({uni_code for uni_code, _, _ in rows}, key=view_order)
+    uni_pos = {uni_code: i for i, uni_code in enumerate(unis)}
+
+    values: List[List[Optional[float]]] = [[None] * len(years) for _ in unis]
+    mask = ["."] * (len(unis) * len(years))
+    for uni_code, year, value in rows:
+        u, y = uni_pos[uni_code], year_pos[year]
+        mask[u * len(years) + y] = "0" if value is None else "1"
+        if value is not None:
+            values[u][y] = compact_number(value)
+
+    views = {"all": view_series(values, list(range(len(unis))))}
+    for type_id in UNI_TYPES:
+        members = [i for i, uni_code in enumerate(unis) if UNI_TYPE_BY_CODE.get(uni_code) == type_id]
+        if members:
+            views[type_id] = view_series(values, members)
+    if FOCUS_UNI in uni_pos:
+        focus_type = UNI_TYPE_BY_CODE.get(FOCUS_UNI)
+        peers = [i for i, uni_code in enumerate(unis)
+                 if uni_code != FOCUS_UNI and UNI_TYPE_BY_CODE.get(uni_code) == focus_type]
+        views["vetmed"] = view_series(values, [uni_pos[FOCUS_UNI]])
+        views["vetmed"]["peers"] = peers
+        views["vetmed"]["peerMean"] = view_series(values, peers)["mean"] if peers else [None] * len(years)
+
+    return {
+        "format": "views",
+        "version": 1,
+        "kennzahl": kennzahl_code,
+        "years": years,
+        "unis": unis,
+        "values": values,
+        "mask": "".join(mask),
+        "views": views
+    }
+
+
+def quantize(value: float, low: float, high: float, levels: int) -> int:
+    """Wert auf 0..levels-1 zwischen low und high (bei low == high: 0)."""
+    if high <= low:
+        return 0
+    return round((value - low) / (high - low) * (levels - 1))
+
+
+def build_tiles(views: dict, bits: int = SPARKLINE_BITS) -> Tuple[dict, List[Tuple[str, array.array]]]:
+    """
+    Berechnet Sparklines und Heatmap-Farbstufen einer Kennzahl aus ihren
+    Ansichten (build_views) ueber alle Jahre der Kennzahl.
+
+    - sparklines: je Uni (Reihenfolge wie views.unis) ein Wert pro Jahr,
+      auf Min/Max der Uni normiert und auf 2^bits - 1 Stufen quantisiert;
+      der Hoechstwert (255 bzw. 65535) markiert fehlende Werte
+    - trend: je Uni -1/0/1 (letzter gegen ersten Wert wie SparklineRenderer.js)
+    - heatmap[ansicht]: je Zeile der Ansicht und Jahr die Farbstufe
+      0..HEATMAP_BINS-1 auf Min/Max der Ansicht, 255 ohne Wert
+
+    Gibt den Index-Eintrag und die Abschnitte als (Name, Array) zurueck.
+    """
+    typecode = {8: "B", 16: "H"}[bits]
+    missing = (1 << bits) - 1
+    sections: List[Tuple[str, array.array]] = []
+
+    sparklines = array.array(typecode)
+    trend = array.array("b")
+    for row in views["values"]:
+        present = [value for value in row if value is not None]
+        low, high = (min(present), max(present)) if present else (0, 0)
+        sparklines.extend(missing if value is None else quantize(value, low, high, missing)
+                          for value in row)
+        first, last = (present[0], present[-1]) if present else (0, 0)
+        trend.append((last > first) - (last < first))
+    sections += [("sparklines", sparklines), ("trend", trend)]
+
+    for view_id, view in views["views"].items():
+        present = [value for value in view["min"] + view["max"] if value is not None]
+        low, high = (min(present), max(present)) if present else (0, 0)
+        bins = array.array("B")
+        for row in view["rows"]:
+            bins.extend(255 if value is None else
+                        (quantize(value, low, high, HEATMAP_BINS) if high > low else HEATMAP_BINS - 1)
+                        for value in views["values"][row])
+        sections.append((f"heatmap:{view_id}", bins))
+
+    entry = {"years": views["years"], "unis": views["unis"]}
+    return entry, sections
+
+
+# Wert-Zelle als (uniCode, year, gender, category, value) fuer dimensions/
+DimensionRow = Tuple[str, int, Optional[str], str, float]
+
+DIMENSION_FIELDS = ["uniCode", "year", "gender", "category"]
+
+
+def build_dimensions(rows: List[DimensionRow], kennzahl_code: str) -> dict:
+    """
+    Mehrdimensionale Datenpunkte einer Kennzahl mit kompakten Woerterbuechern.
+
+    - dims[feld]: Werte jeder Dimension in Reihenfolge des ersten Auftretens
+    - points: [Index je Dimension aus fields..., value]
+    "gender" entfaellt, wenn die Arbeitsmappe keine Geschlechts-Spalten hat.
+    """
+    fields = [field for field in DIMENSION_FIELDS
+              if field != "gender" or any(row[2] is not None for row in rows)]
+    positions = [DIMENSION_FIELDS.index(field) for field in fields]
+    dims: Dict[str, Dict] = {field: {} for field in fields}
+    lookups = [dims[field] for field in fields]
+
+    points = []
+    for row in rows:
+        point = [lookup.setdefault(row[pos], len(lookup)) for lookup, pos in zip(lookups, positions)]
+        point.append(compact_number(row[4]))
+        points.append(point)
+
+    return {
+        "format": "dimensions",
+        "version": 1,
+        "kennzahl": kennzahl_code,
+        "fields": fields + ["value"],
+        "dims": {field: list(values) for field, values in dims.items()},
+        "points": points
+    }
 
-        uni_code = str(codex).strip()
-        if uni_code not in VALID_UNI_CODES:
+
+def write_points(points: Iterable[dict], output_file: Path,
+                 compact: bool = False) -> List[PointRow]:
+    """
+    Schreibt Datenpunkte (auch direkt aus einem Generator) inkrementell
+    und atomar als JSON-Array. Die Punkt-Dicts werden nicht gesammelt,
+    nur die PointRows fuer Spalten-Format und Cube.
+    Ohne Datenpunkte wird keine Datei geschrieben.
+    Returns: PointRows in Reihenfolge der Datei
+    """
+    points = iter(points)
+    first = next(points, None)
+    if first is None:
+        return []
+
+    rows: List[PointRow] = []
+    with atomic_write(output_file) as f:
+        writer = JsonArrayWriter(f, compact)
+        for point in chain((first,), points):
+            writer.write(point)
+            rows.append((point["uniCode"], point["year"], point["value"]))
+        writer.close()
+    return rows
+
+
+def write_derived(rows: List[PointRow], output_dir: Path, kennzahl_code: str,
+                  dimension_rows: Optional[List[DimensionRow]] = None):
+    """
+    Schreibt Spalten-Format (columnar/), Aggregat-Cube (cube/) und Chart-
+    Ansichten (views/) einer Kennzahl, bei Dimensions-Spezifikation
+    zusaetzlich dimensions/.
+    """
+    filename = f"{kennzahl_code}.json"
+    outputs = [(COLUMNAR_DIRNAME, to_columnar, rows), (CUBE_DIRNAME, build_cube, rows),
+               (VIEWS_DIRNAME, build_views, rows)]
+    if dimension_rows is not None:
+        outputs.append((DIMENSIONS_DIRNAME, build_dimensions, dimension_rows))
+    for dirname, build, data in outputs:
+        target_dir = output_dir / dirname
+        target_dir.mkdir(exist_ok=True)
+        write_json(target_dir / filename, build(data, kennzahl_code), compact=True)
+
+
+def load_converted(output_dir: Path) -> Dict[str, List[dict]]:
+    """Laedt alle konvertierten Kennzahlen (Array-Format) aus dem Output-Verzeichnis."""
+    converted = {}
+    for json_file in sorted(output_dir.glob("*.json")):
+        if json_file.name.startswith("_"):
             continue
+        with open(json_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, list) and data:
+            converted[json_file.stem] = data
+    return converted
+
+
+def rank_values(values: List[float]) -> List[float]:
+    """Raenge (1-basiert) mit Durchschnittsrang bei Bindungen."""
+    order = sorted(range(len(values)), key=lambda i: values[i])
+    ranks = [0.0] * len(values)
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[order[k]] = (i + j) / 2 + 1
+        i = j + 1
+    return ranks
+
+
+def pearson(xs: List[float], ys: List[float]) -> Optional[float]:
+    """Pearson-Korrelation (None bei weniger als 3 Paaren oder Varianz 0)."""
+    n = len(xs)
+    if n < 3:
+        return None
+    mean_x = sum(xs) / n
+    mean_y = sum(ys) / n
+    cov = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    var_x = sum((x - mean_x) ** 2 for x in xs)
+    var_y = sum((y - mean_y) ** 2 for y in ys)
+    if var_x == 0 or var_y == 0:
+        return None
+    return cov / (var_x * var_y) ** 0.5
 
-        unis_found.add(uni_code)
 
-        for year, col_idx in year_columns.items():
-            if col_idx >= len(row):
-                continue
+def spearman(xs: List[float], ys: List[float]) -> Optional[float]:
+    """Spearman-Rangkorrelation (Pearson auf Raengen)."""
+    return pearson(rank_values(xs), rank_values(ys))
 
-            point = {
-                "uniCode": uni_code,
-                "year": year,
-                "value": normalize_value(row[col_idx]),
-                "kennzahl": kennzahl_code
-            }
 
-            if validate_data_point(point):
-                data_points.append(point)
+def build_join_table(converted: Dict[str, List[dict]]) -> dict:
+    """
+    Legt alle Kennzahlen auf eine gemeinsame (uniCode, year)-Achse.
+
+    - uniCodes/years: parallele Arrays, sortiert nach Uni-Code und Jahr
+    - columns[code][i]: Wert der Kennzahl am Schluessel i (null wenn fehlend)
+    - correlations: Pearson/Spearman und Anzahl Paare fuer alle Kennzahl-Paare
+
+    Damit lassen sich zwei Kennzahlen ohne Hashing per Index verbinden.
+    """
+    keys = sorted({(point["uniCode"], point["year"])
+                   for data in converted.values() for point in data})
+    key_pos = {key: i for i, key in enumerate(keys)}
+
+    codes = sorted(converted)
+    columns: Dict[str, List[Optional[float]]] = {}
+    for code in codes:
+        column: List[Optional[float]] = [None] * len(keys)
+        for point in converted[code]:
+            column[key_pos[(point["uniCode"], point["year"])]] = compact_number(point["value"])
+        columns[code] = column
+
+    size = len(codes)
+    matrix_pearson: List[List[Optional[float]]] = [[None] * size for _ in range(size)]
+    matrix_spearman: List[List[Optional[float]]] = [[None] * size for _ in range(size)]
+    matrix_n = [[0] * size for _ in range(size)]
+
+    for a in range(size):
+        for b in range(a, size):
+            pairs = [(x, y) for x, y in zip(columns[codes[a]], columns[codes[b]])
+                     if x is not None and y is not None]
+            xs = [x for x, _ in pairs]
+            ys = [y for _, y in pairs]
+            r_p = pearson(xs, ys)
+            r_s = spearman(xs, ys)
+            for i, j in ((a, b), (b, a)):
+                matrix_pearson[i][j] = round(r_p, 4) if r_p is not None else None
+                matrix_spearman[i][j] = round(r_s, 4) if r_s is not None else None
+                matrix_n[i][j] = len(pairs)
+
+    return {
+        "format": "join",
+        "version": 1,
+        "uniCodes": [uni for uni, _ in keys],
+        "years": [year for _, year in keys],
+        "columns": columns,
+        "correlations": {
+            "kennzahlen": codes,
+            "pearson": matrix_pearson,
+            "spearman": matrix_spearman,
+            "n": matrix_n
+        }
+    }
+
+
+def write_join_table(output_dir: Path) -> dict:
+    """Schreibt die Join-Tabelle aller konvertierten Kennzahlen."""
+    join = build_join_table(load_converted(output_dir))
+    join_dir = output_dir / JOIN_DIRNAME
+    join_dir.mkdir(exist_ok=True)
+    write_json(join_dir / JOIN_FILENAME, join, compact=True)
+    return {
+        "output": f"{JOIN_DIRNAME}/{JOIN_FILENAME}",
+        "keys": len(join["years"]),
+        "kennzahlen": len(join["columns"])
+    }
+
+
+def write_tiles(output_dir: Path, bits: int = SPARKLINE_BITS) -> dict:
+    """
+    Schreibt Sparklines und Heatmap-Farbstufen aller Kennzahlen (aus views/)
+    in eine Binaerdatei (tiles.bin) mit JSON-Index (index.json).
+
+    index.kennzahlen[code] = {years, unis, sparklines, trend, heatmap: {ansicht}},
+    jeder Abschnitt als {offset, length} in Elementen; Offsets in Bytes,
+    auf 4 Byte ausgerichtet, damit der Client Typed Arrays direkt auf den
+    Puffer legen kann. Zahlen in Little Endian.
+    """
+    index = {
+        "format": "tiles",
+        "version": 1,
+        "sparklineBits": bits,
+        "heatmapBins": HEATMAP_BINS,
+        "kennzahlen": {}
+    }
+    blob = bytearray()
+    for views_file in sorted((output_dir / VIEWS_DIRNAME).glob("*.json")):
+        with open(views_file, 'r', encoding='utf-8') as f:
+            views = json.load(f)
+        entry, sections = build_tiles(views, bits)
+        heatmap = {}
+        for name, values in sections:
+            blob += bytes(-len(blob) % 4)
+            if sys.byteorder == "big":
+                values.byteswap()
+            location = {"offset": len(blob), "length": len(values)}
+            if name.startswith("heatmap:"):
+                heatmap[name.split(":", 1)[1]] = location
             else:
-                invalid_count += 1
+                entry[name] = location
+            blob += values.tobytes()
+        entry["heatmap"] = heatmap
+        index["kennzahlen"][views["kennzahl"]] = entry
+
+    tiles_dir = output_dir / TILES_DIRNAME
+    tiles_dir.mkdir(exist_ok=True)
+    write_bytes(tiles_dir / TILES_BLOB_FILENAME, bytes(blob))
+    write_json(tiles_dir / TILES_INDEX_FILENAME, index, compact=True)
+    return {
+        "output": f"{TILES_DIRNAME}/{TILES_BLOB_FILENAME}",
+        "kennzahlen": len(index["kennzahlen"]),
+        "bytes": len(blob)
+    }
 
-    wb.close()
 
-    if not data_points:
-        return {"error": "Keine gueltigen Datenpunkte gefunden", "file": filepath.name}
+def write_anomaly_report(output_dir: Path, data_version: Optional[str] = None) -> dict:
+    """Schreibt den Plausibilitaets-Report aller konvertierten Kennzahlen."""
+    report = build_anomaly_report(load_converted(output_dir), data_version)
+    anomaly_dir = output_dir / ANOMALY_DIRNAME
+    anomaly_dir.mkdir(exist_ok=True)
+    write_json(anomaly_dir / ANOMALY_FILENAME, report, compact=True)
+    return {
+        "output": f"{ANOMALY_DIRNAME}/{ANOMALY_FILENAME}",
+        "flags": sum(len(entries) for entries in report["flags"].values()),
+        "counts": report["counts"]
+    }
+
+
+def write_store(output_dir: Path, data_version: Optional[str] = None) -> dict:
+    """Schreibt alle konvertierten Kennzahlen in den SQLite-Speicher (store/)."""
+    universities = {code: (name, UNI_TYPE_BY_CODE.get(code))
+                    for code, name in VALID_UNI_CODES.items()}
+    meta = {"converterVersion": CONVERTER_VERSION, "dataVersion": data_version}
+    summary = build_store(output_dir / STORE_DIRNAME / STORE_FILENAME,
+                          load_converted(output_dir), universities, kennzahl_names(), meta)
+    return {"output": f"{STORE_DIRNAME}/{STORE_FILENAME}", **summary}
 
-    # JSON speichern
-    output_file = output_dir / f"{kennzahl_code}.json"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data_points, f, ensure_ascii=False, indent=2)
+
+def write_bundle(output_dir: Path) -> dict:
+    """
+    Buendelt alle Kennzahlen (Spalten-Format) in eine Datei fuer den Kaltstart.
+
+    Aufbau (NDJSON):
+      Zeile 1: Header {format, version, dataVersion, index}
+      Danach:  eine Zeile pro Kennzahl (Spalten-Format), gefolgt vom Cube
+               und den Ansichten, am Ende die Join-Tabelle
+    index[code] = {offset, length, points, cube: {offset, length},
+    views: {offset, length}} und
+    join = {offset, length}: Byte-Offsets relativ zum Ende der Header-Zeile,
+    so dass der Client nur die benoetigten Abschnitte parst.
+    dataVersion ist ein Hash ueber den Inhalt (Cache-Busting).
+
+    Zusaetzlich werden .gz und (falls brotli installiert) .br geschrieben.
+    """
+    columnar_dir = output_dir / COLUMNAR_DIRNAME
+    payloads = []
+    for columnar_file in sorted(columnar_dir.glob("*.json")):
+        with open(columnar_file, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+        payloads.append(payload)
+
+    index = {}
+    body = bytearray()
+    for payload in payloads:
+        line = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        entry = {
+            "offset": len(body),
+            "length": len(line),
+            "points": payload["mask"].count("1") + payload["mask"].count("0")
+        }
+        body += line + b"\n"
+
+        for key, dirname in (("cube", CUBE_DIRNAME), ("views", VIEWS_DIRNAME)):
+            derived_file = output_dir / dirname / f"{payload['kennzahl']}.json"
+            if derived_file.exists():
+                derived_line = derived_file.read_bytes().strip()
+                entry[key] = {"offset": len(body), "length": len(derived_line)}
+                body += derived_line + b"\n"
+
+        index[payload["kennzahl"]] = entry
+
+    join_location = None
+    join_file = output_dir / JOIN_DIRNAME / JOIN_FILENAME
+    if join_file.exists():
+        join_line = join_file.read_bytes().strip()
+        join_location = {"offset": len(body), "length": len(join_line)}
+        body += join_line + b"\n"
+
+    header = {
+        "format": "bundle",
+        "version": 1,
+        "dataVersion": hashlib.sha256(body).hexdigest()[:16],
+        "index": index
+    }
+    if join_location:
+        header["join"] = join_location
+    content = json.dumps(header, separators=(',', ':')).encode('utf-8') + b"\n" + bytes(body)
+
+    bundle_dir = output_dir / BUNDLE_DIRNAME
+    bundle_dir.mkdir(exist_ok=True)
+    bundle_file = bundle_dir / BUNDLE_FILENAME
+    write_bytes(bundle_file, content)
+
+    # mtime=0 haelt die .gz-Datei bei gleichem Inhalt byte-identisch
+    sizes = {"raw": len(content)}
+    compressed = gzip.compress(content, compresslevel=9, mtime=0)
+    write_bytes(bundle_dir / f"{BUNDLE_FILENAME}.gz", compressed)
+    sizes["gzip"] = len(compressed)
+    if brotli is not None:
+        compressed = brotli.compress(content, quality=11)
+        write_bytes(bundle_dir / f"{BUNDLE_FILENAME}.br", compressed)
+        sizes["brotli"] = len(compressed)
 
     return {
-        "file": filepath.name,
-        "kennzahl": kennzahl_code,
-        "output": output_file.name,
-        "data_points": len(data_points),
-        "invalid_points": invalid_count,
-        "universities": len(unis_found),
-        "years": sorted(years_found),
-        "unis": sorted(unis_found)
+        "output": f"{BUNDLE_DIRNAME}/{BUNDLE_FILENAME}",
+        "kennzahlen": len(index),
+        "dataVersion": header["dataVersion"],
+        "sizes": sizes
     }
 
 
 # ============================================================
-# SPEZIAL-KONVERTER
+# KONVERTER-ENGINE
 # ============================================================
 
-def convert_3a1(filepath: Path, output_dir: Path) -> dict:
+def kennzahl_names() -> Dict[str, Tuple[str, str]]:
+    """{code: (Name, Quelldatei)}, Name aus dem Dateinamen ohne Code-Praefix."""
+    return {code: (Path(filename).stem.split(" ", 1)[-1], filename)
+            for filename, code in FILE_TO_KENNZAHL.items()}
+
+
+def kennzahl_for_file(filename: str) -> Optional[str]:
+    """Kennzahl-Code zu einem Dateinamen, auch in der Schreibweise mit Umlauten."""
+    name = unicodedata.normalize("NFC", filename).translate(FILENAME_TRANSLITERATION)
+    return FILE_TO_KENNZAHL.get(name)
+
+
+def converter_spec(kennzahl_code: str) -> dict:
+    """Spezifikation einer Kennzahl aus der Registry (sonst STANDARD_SPEC)."""
+    return KENNZAHL_SPECS.get(kennzahl_code, STANDARD_SPEC)
+
+
+def select_sheet(wb, spec: dict) -> str:
+    """Sheet-Name gemaess Spezifikation: fest, sonst "Tab" oder das erste Sheet."""
+    if spec.get("sheet"):
+        return spec["sheet"]
+    return 'Tab' if 'Tab' in wb.sheetnames else wb.sheetnames[0]
+
+
+def read_header(ws, sheet_name: str, spec: dict, data_dir: Path) -> dict:
     """
-    Spezial-Konverter fuer 3-A-1 (Ausserordentliche Studienabschluesse).
-    Nur fuer Donau-Uni Krems (UM).
+    Liest den Header gemaess spec["header"] aus dem Zeilen-Stream.
+
+    Returns: {
+        rows: Stream ab der ersten Zeile nach dem Header,
+        year_columns: {year: col_idx (0-basiert)} oder None bei row-years,
+        header_cells, labels: Jahres-Header und Geschlechts-Beschriftung
+                      (fuer dimensions/, leer wenn nicht vorhanden),
+        codex_col, layout, layout_cached (nur bei detect)
+    }
     """
-    wb = openpyxl.load_workbook(filepath, data_only=True)
-    ws = wb['Tab']
+    header = spec["header"]
+    strategy = header["strategy"]
+    result = {"year_columns": None, "header_cells": (), "labels": (),
+              "codex_col": None, "layout": None, "layout_cached": False}
+
+    if strategy == "detect":
+        # Layout (Header-Zeile, Jahres- und Codex-Spalte) aus Cache oder Erkennung
+        layout, rows, layout_cached, top = detect_layout(ws, sheet_name, data_dir)
+        result.update(rows=rows, year_columns=layout_year_columns(layout),
+                      codex_col=layout["codex_col"], layout=layout, layout_cached=layout_cached)
+        header_row = layout["header_row"]
+        if header_row is not None:
+            around = dict(top)
+            result["header_cells"] = around[header_row]
+            result["labels"] = gender_labels(around.get(header_row + 1, ()),
+                                             around.get(header_row - 1, ()))
+        return result
+
+    rows = stream_rows(ws, max_row=spec["rows"]["last"])
+    result["rows"] = rows
+
+    if strategy == "fixed-row":
+        year_columns = {}
+        first_col, last_col = header["columns"]
+        previous: tuple = ()
+        for row_idx, row in rows:
+            if row_idx == header["row"]:
+                for col in range(first_col, last_col + 1):
+                    year = extract_year_from_header(row_value(row, col))
+                    if year:
+                        year_columns[year] = col - 1 + header["offset"]
+                # Beschriftungszeile lesen und in den Stream zuruecklegen
+                below = next(rows, None)
+                if below is not None:
+                    result["rows"] = chain((below,), rows)
+                result["header_cells"] = row[:last_col]
+                result["labels"] = gender_labels(below[1] if below else (), previous)[:last_col]
+                break
+            previous = row
+        result["year_columns"] = year_columns
+    elif strategy != "row-years":
+        raise ValueError(f"Unbekannte Header-Strategie: {strategy}")
+
+    return result
+
+
+def code_reader(codes: dict, codex_col: Optional[int]) -> Callable[[tuple], Optional[str]]:
+    """Funktion Zeile -> Uni-Code (oder None) gemaess spec["codes"]."""
+    strategy = codes["strategy"]
+
+    if strategy == "codex":
+        def read(row: tuple) -> Optional[str]:
+            if codex_col >= len(row):
+                return None
+            codex = row[codex_col]
+            if codex is None:
+                return None
+            uni_code = str(codex).strip()
+            return uni_code if uni_code in VALID_UNI_CODES else None
+        return read
+
+    if strategy == "letter":
+        current: Optional[str] = None
+
+        def read(row: tuple) -> Optional[str]:
+            nonlocal current
+            letter = row_value(row, codes["column"])
+            if letter and row_value(row, codes["name_column"]):
+                current = LETTER_TO_UNI_CODE.get(str(letter).strip(), current)
+            return current
+        return read
+
+    if strategy == "match":
+        def read(row: tuple) -> Optional[str]:
+            cell = row_value(row, codes["column"])
+            return codes["code"] if cell and codes["contains"] in str(cell).strip() else None
+        return read
+
+    raise ValueError(f"Unbekannte Code-Strategie: {strategy}")
+
+
+def gender_label(cell) -> Optional[str]:
+    """Geschlechts-Beschriftung einer Zelle (GENDER_LABELS) oder None."""
+    if cell is None:
+        return None
+    label = str(cell).strip()
+    return label if label in GENDER_LABELS else None
 
-    data_points = []
 
-    for row_idx in range(17, 100):
-        col1 = ws.cell(row=row_idx, column=1).value  # Studienjahr
-        col3 = ws.cell(row=row_idx, column=3).value  # Uni-Code
-        col5 = ws.cell(row=row_idx, column=5).value  # Wert
+def gender_labels(*candidates: tuple) -> tuple:
+    """Erste Zeile mit Geschlechts-Beschriftung, sonst ()."""
+    for row in candidates:
+        if any(gender_label(cell) for cell in row):
+            return row
+    return ()
 
-        year = extract_year_from_header(col1)
 
-        if year and col3 and 'UM' in str(col3).strip():
+def value_columns(header_cells: tuple, labels: tuple) -> List[Tuple[int, int, Optional[str]]]:
+    """
+    Alle Wert-Spalten unter dem Jahres-Header als (col_idx, year, gender).
+
+    Ein Jahr gilt ab seiner Header-Zelle bis zur naechsten gefuellten
+    Header-Zelle (verbundene Zellen im XLCubed-Export). Gibt es eine
+    Beschriftungszeile, zaehlen nur Spalten mit Geschlechts-Beschriftung.
+    """
+    columns = []
+    year = None
+    for col_idx in range(max(len(header_cells), len(labels))):
+        cell = header_cells[col_idx] if col_idx < len(header_cells) else None
+        if cell is not None and str(cell).strip():
+            year = extract_year_from_header(cell)
+            if year not in VALID_YEARS:
+                year = None
+        if year is None:
+            continue
+        gender = gender_label(labels[col_idx]) if col_idx < len(labels) else None
+        if labels and gender is None:
+            continue
+        columns.append((col_idx, year, gender))
+    return columns
+
+
+def dimension_reader(spec: dict, header: dict,
+                     rows: List[DimensionRow]) -> Callable[[tuple, Optional[str]], None]:
+    """
+    Funktion (Zeile, Uni-Code) -> None, die alle Wert-Zellen einer Zeile
+    mit Jahr, Geschlecht und Kategorie an rows anhaengt (leere Zellen
+    entfallen). Bei Codex-Zeilen gelten Unterzeilen ohne Codex fuer die
+    Uni darueber, bis eine Zeile mit anderem Eintrag in Spalte A folgt.
+    """
+    columns = value_columns(header["header_cells"], header["labels"])
+    category_col = spec["dimensions"]["category"]["column"]
+    carry = spec["codes"]["strategy"] == "codex"
+    current: Optional[str] = None
+
+    def collect(row: tuple, uni_code: Optional[str]):
+        nonlocal current
+        if carry:
+            if uni_code is not None or row_value(row, 1) not in (None, ""):
+                current = uni_code
+            uni_code = current
+        if uni_code is None:
+            return
+
+        category = row_value(row, category_col)
+        category = str(category).strip() if category is not None else ""
+        category = category or TOTAL_CATEGORY
+
+        for col_idx, year, gender in columns:
+            if col_idx >= len(row):
+                break
+            value = normalize_value(row[col_idx])
+            if value is not None:
+                rows.append((uni_code, year, gender, category, value))
+    return collect
+
+
+def extract_points(spec: dict, header: dict, kennzahl_code: str, stats: dict,
+                   dimension_rows: Optional[List[DimensionRow]] = None) -> Iterator[dict]:
+    """
+    Gemeinsame Extraktion fuer alle Spezifikationen in einem Durchlauf
+    ueber den Zeilen-Stream. Ungueltige Punkte werden in stats["invalid"]
+    gezaehlt. Mit dimension_rows werden im selben Durchlauf alle Wert-Zellen
+    mit ihren Dimensionen gesammelt (dimension_reader).
+    """
+    read_code = code_reader(spec["codes"], header["codex_col"])
+    collect = None
+    if dimension_rows is not None:
+        collect = dimension_reader(spec, header, dimension_rows)
+    first_row = spec["rows"]["first"]
+    row_filter = spec["values"].get("filter")
+    year_column = value_idx = None
+    if header["year_columns"] is None:
+        year_column = spec["header"]["column"]
+        value_idx = spec["values"]["column"] - 1
+    columns = list(header["year_columns"].items()) if year_column is None else []
+
+    for row_idx, row in header["rows"]:
+        if row_idx < first_row:
+            continue
+
+        uni_code = read_code(row)
+        if collect is not None:
+            collect(row, uni_code)
+        if uni_code is None:
+            continue
+
+        if row_filter:
+            cell = row_value(row, row_filter["column"])
+            if not cell or row_filter["contains"] not in str(cell):
+                continue
+
+        if year_column is not None:
+            year = extract_year_from_header(row_value(row, year_column))
+            if not year:
+                continue
+            columns = [(year, value_idx)]
+
+        for year, col_idx in columns:
+            if col_idx >= len(row):
+                continue
+
             point = {
-                "uniCode": "UM",
+                "uniCode": uni_code,
                 "year": year,
-                "value": normalize_value(col5),
-                "kennzahl": "3-A-1"
+                "value": normalize_value(row[col_idx]),
+                "kennzahl": kennzahl_code
             }
-            if validate_data_point(point):
-                data_points.append(point)
 
-    wb.close()
-
-    output_file = output_dir / "3-A-1.json"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data_points, f, ensure_ascii=False, indent=2)
-
-    return {
-        "file": filepath.name,
-        "kennzahl": "3-A-1",
-        "output": output_file.name,
-        "data_points": len(data_points),
-        "universities": 1,
-        "years": sorted(set(d['year'] for d in data_points)),
-        "unis": ["UM"]
-    }
+            if validate_data_point(point):
+                yield point
+            else:
+                stats["invalid"] += 1
 
 
-def convert_3a3(filepath: Path, output_dir: Path) -> dict:
+def convert_file(filepath: Path, output_dir: Path, kennzahl_code: str,
+                 compact: bool = False) -> dict:
     """
-    Spezial-Konverter fuer 3-A-3 (Studienabschluesse mit Auslandsaufenthalt).
-    Andere Struktur mit Buchstaben-Codes.
+    Konvertiert eine Datei gemaess ihrer Spezifikation (converter_spec).
+    Die Arbeitsmappe wird einmal geoeffnet und in einem Durchlauf gelesen;
+    die Datenpunkte werden waehrend der Extraktion in die JSON-Datei
+    gestreamt (Stage "extract"), "write" umfasst Spalten-Format, Cube und
+    die im selben Durchlauf gesammelten Dimensionen.
     """
-    wb = openpyxl.load_workbook(filepath, data_only=True)
-    ws = wb['Tab']
+    spec = converter_spec(kennzahl_code)
+    output_file = output_dir / f"{kennzahl_code}.json"
+    stats = {"invalid": 0}
+    dimension_rows: Optional[List[DimensionRow]] = [] if spec.get("dimensions") else None
 
-    # Jahr-Spalten finden (Zeile 11)
-    year_columns = {}
-    for col in range(1, 20):
-        cell = ws.cell(row=11, column=col).value
-        year = extract_year_from_header(cell)
-        if year:
-            year_columns[year] = col + 2  # Gesamt-Spalte ist 2 weiter
+    with stage("load", file=filepath.name):
+        wb = open_workbook(filepath)
+    try:
+        sheet_name = select_sheet(wb, spec)
+        ws = wb[sheet_name]
 
-    data_points = []
-    current_uni_code = None
-    unis_found: Set[str] = set()
-
-    for row_idx in range(13, 300):
-        uni_name = ws.cell(row=row_idx, column=1).value
-        letter = ws.cell(row=row_idx, column=2).value
-        category = ws.cell(row=row_idx, column=3).value
-
-        # Neue Uni erkennen
-        if uni_name and letter:
-            letter_str = str(letter).strip()
-            if letter_str in LETTER_TO_UNI_CODE:
-                current_uni_code = LETTER_TO_UNI_CODE[letter_str]
-
-        # Nur "Insgesamt"-Zeilen
-        if current_uni_code and category and "Insgesamt" in str(category):
-            for year, col_idx in year_columns.items():
-                point = {
-                    "uniCode": current_uni_code,
-                    "year": year,
-                    "value": normalize_value(ws.cell(row=row_idx, column=col_idx).value),
-                    "kennzahl": "3-A-3"
-                }
-                if validate_data_point(point):
-                    data_points.append(point)
-                    unis_found.add(current_uni_code)
+        with stage("header", file=filepath.name):
+            header = read_header(ws, sheet_name, spec, filepath.parent)
+        if header["year_columns"] is not None and not header["year_columns"]:
+            return {"error": "Keine Jahreszahlen im Header gefunden", "file": filepath.name}
+
+        # Daten extrahieren und direkt in die JSON-Datei schreiben
+        with stage("extract", file=filepath.name):
+            point_rows = write_points(extract_points(spec, header, kennzahl_code, stats,
+                                                     dimension_rows),
+                                      output_file, compact)
+    finally:
+        wb.close()
 
-    wb.close()
+    if not point_rows:
+        return {"error": "Keine gueltigen Datenpunkte gefunden", "file": filepath.name}
 
-    output_file = output_dir / "3-A-3.json"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data_points, f, ensure_ascii=False, indent=2)
+    with stage("write", file=filepath.name):
+        write_derived(point_rows, output_dir, kennzahl_code, dimension_rows)
 
-    return {
+    unis = sorted({uni_code for uni_code, _, _ in point_rows})
+    result = {
         "file": filepath.name,
-        "kennzahl": "3-A-3",
+        "kennzahl": kennzahl_code,
         "output": output_file.name,
-        "data_points": len(data_points),
-        "universities": len(unis_found),
-        "years": sorted(set(d['year'] for d in data_points)),
-        "unis": sorted(unis_found)
+        "data_points": len(point_rows),
+        "invalid_points": stats["invalid"],
+        "universities": len(unis),
+        "years": sorted({year for _, year, _ in point_rows}),
+        "unis": unis
     }
+    if dimension_rows is not None:
+        result["dimension_points"] = len(dimension_rows)
+    if header["layout"] is not None:
+        result["layout"] = header["layout"]
+        result["layout_cached"] = header["layout_cached"]
+    return result
 
 
 # ============================================================
@@ -369,34 +1451,63 @@ def convert_3a3(filepath: Path, output_dir: Path) -> dict:
 
 def analyze_excel(filepath: Path) -> dict:
     """Analysiert die Struktur einer Excel-Datei."""
-    wb = openpyxl.load_workbook(filepath, data_only=True)
+    wb = open_workbook(filepath)
 
     result = {"filename": filepath.name, "sheets": []}
 
-    for sheet_name in wb.sheetnames:
-        ws = wb[sheet_name]
-        header_row, year_columns = find_header_row(ws)
+    try:
+        for sheet_name in wb.sheetnames:
+            ws = wb[sheet_name]
+
+            # Ein Durchlauf ueber die obersten Zeilen: Layout + Beispielzeilen
+            top = list(stream_rows(ws, max_row=LAYOUT_SCAN_ROWS))
+            layout, layout_cached = layout_from_rows(sheet_name, top, filepath.parent)
+            sample_rows = [[str(cell)[:30] if cell is not None else "" for cell in row[:10]]
+                           for _, row in top[:15]]
+
+            result["sheets"].append({
+                "name": sheet_name,
+                "header_row": layout["header_row"],
+                "years": sorted(layout_year_columns(layout)),
+                "codex_col": layout["codex_col"],
+                "layout_cached": layout_cached,
+                "sample_rows": sample_rows
+            })
+    finally:
+        wb.close()
+
+    return result
 
-        sample_rows = []
-        for row_idx, row in enumerate(ws.iter_rows(max_row=20, max_col=10, values_only=True)):
-            sample_rows.append([str(cell)[:30] if cell is not None else "" for cell in row])
 
-        result["sheets"].append({
-            "name": sheet_name,
-            "header_row": header_row,
-            "years": sorted(year_columns.keys()) if year_columns else [],
-            "sample_rows": sample_rows[:15]
-        })
+def validate_output(output_dir: Path, layout_cache: Optional[dict] = None,
+                    kennzahlen: Optional[Iterable[str]] = None) -> dict:
+    """
+    Validiert alle generierten JSON-Dateien (oder nur die der angegebenen Kennzahlen).
+    Die Datenpunkte werden spaltenweise geprueft (siehe validation.py):
+    Uni-Code, Jahr, Wert und doppelte (uniCode, year)-Schluessel.
+    Mit Layout-Cache wird zusaetzlich geprueft, ob die Jahre im Output
+    den Jahres-Spalten der Quelldatei entsprechen.
 
-    wb.close()
-    return result
+    Returns: {valid, invalid, warnings, violations: {datei: {regel: [zeilen]}}}
+    """
+    results = {"valid": [], "invalid": [], "warnings": [], "violations": {}}
 
+    expected_years: Dict[str, List[int]] = {}
+    if layout_cache:
+        for entry in layout_cache["files"].values():
+            layout = layout_cache["layouts"].get(entry["fingerprint"])
+            if layout and entry.get("kennzahl"):
+                expected_years[entry["kennzahl"]] = sorted(layout_year_columns(layout))
 
-def validate_output(output_dir: Path) -> dict:
-    """Validiert alle generierten JSON-Dateien."""
-    results = {"valid": [], "invalid": [], "warnings": []}
+    selected = set(kennzahlen) if kennzahlen is not None else None
+
+    for json_file in sorted(output_dir.glob("*.json")):
+        # Interne Dateien (Manifest etc.) beginnen mit "_"
+        if json_file.name.startswith("_"):
+            continue
+        if selected is not None and json_file.stem not in selected:
+            continue
 
-    for json_file in output_dir.glob("*.json"):
         try:
             with open(json_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
@@ -405,16 +1516,25 @@ def validate_output(output_dir: Path) -> dict:
                 results["invalid"].append(f"{json_file.name}: Kein Array")
                 continue
 
-            invalid_points = []
-            for i, point in enumerate(data):
-                if not validate_data_point(point):
-                    invalid_points.append(i)
+            report = validate_points(data, VALID_UNI_CODES, VALID_YEARS)
+            if report["invalid"]:
+                results["violations"][json_file.name] = {
+                    rule: positions for rule, positions in report["positions"].items() if positions
+                }
 
-            if invalid_points:
+            expected = expected_years.get(json_file.stem)
+            years = sorted({point.get('year') for point in data if isinstance(point, dict)})
+            layout_mismatch = expected is not None and years != expected
+            if layout_mismatch:
                 results["warnings"].append(
-                    f"{json_file.name}: {len(invalid_points)} ungueltige Punkte"
+                    f"{json_file.name}: Jahre {years} weichen vom Excel-Layout {expected} ab"
                 )
-            else:
+            if report["invalid"]:
+                results["warnings"].append(
+                    f"{json_file.name}: {len(report['invalid'])} ungueltige Punkte "
+                    f"({summarize_violations(report)})"
+                )
+            if not layout_mismatch and not report["invalid"]:
                 results["valid"].append(f"{json_file.name}: {len(data)} Punkte OK")
 
         except json.JSONDecodeError as e:
@@ -425,18 +1545,426 @@ def validate_output(output_dir: Path) -> dict:
     return results
 
 
+# ============================================================
+# INKREMENTELLE KONVERTIERUNG (MANIFEST)
+# ============================================================
+
+def file_sha256(filepath: Path) -> str:
+    """Berechnet den SHA-256 Hash einer Datei (blockweise)."""
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def converter_fingerprint() -> str:
+    """
+    Fingerprint der Konverter-Logik: Version plus Hash der Quelldateien.
+    Aendert sich der Konverter, werden alle Dateien neu konvertiert.
+    """
+    digest = hashlib.sha256(CONVERTER_VERSION.encode())
+    for source in CONVERTER_SOURCES:
+        digest.update(source.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def source_fingerprint(filepath: Path) -> dict:
+    """Erfasst Hash, Groesse und Aenderungszeit einer Quelldatei."""
+    stat = filepath.stat()
+    return {
+        "sha256": file_sha256(filepath),
+        "size": stat.st_size,
+        "mtime": stat.st_mtime
+    }
+
+
+def load_manifest(output_dir: Path) -> dict:
+    """
+    Laedt das Manifest. Bei fehlender/defekter Datei oder geaenderter
+    Konverter-Logik wird ein leeres Manifest zurueckgegeben.
+    """
+    empty = {
+        "converter_version": CONVERTER_VERSION,
+        "converter_hash": converter_fingerprint(),
+        "sources": {}
+    }
+    manifest_file = output_dir / MANIFEST_FILENAME
+    if not manifest_file.exists():
+        return empty
+
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return empty
+
+    if (manifest.get("converter_version") != empty["converter_version"] or
+            manifest.get("converter_hash") != empty["converter_hash"]):
+        return empty
+
+    manifest.setdefault("sources", {})
+    return manifest
+
+
+def save_manifest(output_dir: Path, manifest: dict):
+    """Speichert das Manifest (Quellen alphabetisch sortiert)."""
+    manifest["generated"] = datetime.now().isoformat(timespec='seconds')
+    manifest["sources"] = dict(sorted(manifest["sources"].items()))
+    write_json(output_dir / MANIFEST_FILENAME, manifest)
+
+
+def is_up_to_date(filepath: Path, output_dir: Path, kennzahl_code: str,
+                  manifest: dict) -> bool:
+    """
+    Prueft, ob eine Quelldatei seit der letzten Konvertierung unveraendert ist.
+    Groesse + mtime gleich -> unveraendert (ohne Hashing).
+    Nur mtime geaendert -> Hash entscheidet, mtime wird nachgefuehrt.
+    """
+    entry = manifest["sources"].get(filepath.name)
+    if not entry or entry.get("kennzahl") != kennzahl_code:
+        return False
+    output = entry.get("output", "")
+    derived = [COLUMNAR_DIRNAME, CUBE_DIRNAME, VIEWS_DIRNAME]
+    if converter_spec(kennzahl_code).get("dimensions"):
+        derived.append(DIMENSIONS_DIRNAME)
+    expected = [output_dir / output] + [output_dir / d / output for d in derived]
+    if not all(path.exists() for path in expected):
+        return False
+
+    stat = filepath.stat()
+    if stat.st_size != entry.get("size"):
+        return False
+    if stat.st_mtime == entry.get("mtime"):
+        return True
+
+    if file_sha256(filepath) == entry.get("sha256"):
+        entry["mtime"] = stat.st_mtime
+        return True
+    return False
+
+
+def record_conversion(manifest: dict, filepath: Path, fingerprint: dict, result: dict):
+    """Traegt eine erfolgreiche Konvertierung ins Manifest ein."""
+    if "error" in result:
+        manifest["sources"].pop(filepath.name, None)
+        return
+
+    manifest["sources"][filepath.name] = {
+        "kennzahl": result["kennzahl"],
+        "output": result["output"],
+        **fingerprint,
+        "data_points": result["data_points"],
+        "universities": result["universities"],
+        "years": result["years"],
+        "converted": datetime.now().isoformat(timespec='seconds')
+    }
+
+
+def cached_result(filepath: Path, manifest: dict) -> dict:
+    """Baut ein Ergebnis-Dict fuer eine uebersprungene Datei aus dem Manifest."""
+    entry = manifest["sources"][filepath.name]
+    return {
+        "file": filepath.name,
+        "kennzahl": entry["kennzahl"],
+        "output": entry["output"],
+        "data_points": entry["data_points"],
+        "universities": entry["universities"],
+        "years": entry["years"],
+        "skipped": True
+    }
+
+
 # ============================================================
 # HAUPTFUNKTION
 # ============================================================
 
-def convert_file(filepath: Path, output_dir: Path, kennzahl_code: str) -> dict:
-    """Konvertiert eine Datei mit dem passenden Konverter."""
-    if kennzahl_code == "3-A-1":
-        return convert_3a1(filepath, output_dir)
-    elif kennzahl_code == "3-A-3":
-        return convert_3a3(filepath, output_dir)
+def convert_file_timed(filepath: Path, output_dir: Path, kennzahl_code: str,
+                       profile: bool = False, compact: bool = False) -> dict:
+    """
+    Konvertiert eine Datei und misst die Laufzeit.
+    Fehler werden als Ergebnis-Dict zurueckgegeben, damit auch
+    Worker-Prozesse im Parallel-Modus immer ein Ergebnis liefern.
+    Mit profile=True enthaelt das Ergebnis die Stage-Messungen ("stages").
+    """
+    if profile:
+        start_stage_recording()
+        tracemalloc.start()
+
+    start = time.perf_counter()
+    try:
+        result = convert_file(filepath, output_dir, kennzahl_code, compact)
+    except Exception as e:
+        result = {"file": filepath.name, "error": str(e)}
+    result["seconds"] = round(time.perf_counter() - start, 3)
+
+    if profile:
+        tracemalloc.stop()
+        result["stages"] = stop_stage_recording()
+    return result
+
+
+def convert_parallel(tasks: List[Tuple[Path, str]], output_dir: Path, jobs: int,
+                     profile: bool = False, compact: bool = False):
+    """
+    Verteilt die Konvertierung auf einen Prozess-Pool.
+    Liefert (index, result) in der Reihenfolge, in der die Dateien fertig werden.
+    """
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+        futures = {
+            pool.submit(convert_file_timed, filepath, output_dir, kennzahl_code,
+                        profile, compact): idx
+            for idx, (filepath, kennzahl_code) in enumerate(tasks)
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def print_result(result: dict):
+    """Gibt das Ergebnis einer einzelnen Konvertierung aus."""
+    timing = f" ({result['seconds']:.2f}s)" if "seconds" in result else ""
+    if "error" in result:
+        print(f"  [FAIL] {result['error']}{timing}")
     else:
-        return convert_standard(filepath, output_dir, kennzahl_code)
+        invalid = result.get('invalid_points', 0)
+        invalid_msg = f", {invalid} ungueltig" if invalid else ""
+        print(f"  [OK] {result['data_points']} Punkte, "
+              f"{result['universities']} Unis, Jahre: {result['years']}{invalid_msg}{timing}")
+
+
+def print_validation(results: dict):
+    """Gibt das Ergebnis von validate_output aus."""
+    for msg in results["valid"]:
+        print(f"  [OK] {msg}")
+    for msg in results["warnings"]:
+        print(f"  [WARN] {msg}")
+    for msg in results["invalid"]:
+        print(f"  [FAIL] {msg}")
+
+
+def write_aggregates(output_dir: Path, store: bool = False):
+    """
+    Schreibt Join-Tabelle, Sparklines/Heatmap-Stufen, Bundle und Anomalie-
+    Report aller Kennzahlen neu, mit store=True auch den SQLite-Speicher.
+    """
+    with stage("join"):
+        join = write_join_table(output_dir)
+    print(f"[Converter] Join-Tabelle: {join['output']} "
+          f"({join['keys']} Schluessel x {join['kennzahlen']} Kennzahlen)")
+
+    with stage("tiles"):
+        tiles = write_tiles(output_dir)
+    print(f"[Converter] Sparklines/Heatmap: {tiles['output']} "
+          f"({tiles['kennzahlen']} Kennzahlen, {tiles['bytes']} B)")
+
+    with stage("bundle"):
+        bundle = write_bundle(output_dir)
+    sizes = ", ".join(f"{k}: {v} B" for k, v in bundle["sizes"].items())
+    print(f"[Converter] Bundle: {bundle['output']} ({bundle['kennzahlen']} Kennzahlen, "
+          f"Version {bundle['dataVersion']}, {sizes})")
+
+    with stage("anomalies"):
+        anomalies = write_anomaly_report(output_dir, bundle["dataVersion"])
+    counts = ", ".join(f"{k}: {v}" for k, v in sorted(anomalies["counts"].items()))
+    print(f"[Converter] Anomalien: {anomalies['output']} "
+          f"({anomalies['flags']} markiert{f'; {counts}' if counts else ''})")
+
+    if store:
+        with stage("store"):
+            summary = write_store(output_dir, bundle["dataVersion"])
+        print(f"[Converter] Speicher: {summary['output']} ({summary['facts']} Fakten, "
+              f"{summary['kennzahlen']} Kennzahlen, {summary['universities']} Unis)")
+
+
+# ============================================================
+# WATCH-MODUS
+# ============================================================
+
+def scan_sources(data_dir: Path, select: Callable[[str], Optional[str]]) -> Dict[str, Tuple[int, int]]:
+    """Groesse und mtime (ns) der beobachteten Quelldateien (ein scandir, kein Hashing)."""
+    snapshot = {}
+    with os.scandir(data_dir) as entries:
+        for entry in entries:
+            if select(entry.name) and entry.is_file():
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    # Zwischen scandir und stat geloescht (z.B. Temp-Datei beim Speichern)
+                    continue
+                snapshot[entry.name] = (stat.st_size, stat.st_mtime_ns)
+    return snapshot
+
+
+def watch_changes(data_dir: Path, select: Callable[[str], Optional[str]],
+                  interval: float = WATCH_INTERVAL,
+                  debounce: float = WATCH_DEBOUNCE) -> Iterator[List[str]]:
+    """
+    Pollt das data-Verzeichnis und liefert geaenderte oder neue Dateien,
+    sobald Groesse und mtime debounce Sekunden lang stabil sind (Excel und
+    Kopiervorgaenge schreiben in mehreren Schritten). Geloeschte Dateien
+    werden ignoriert.
+    """
+    known = scan_sources(data_dir, select)
+    changed_at: Dict[str, float] = {}
+
+    while True:
+        time.sleep(interval)
+        now = time.monotonic()
+        current = scan_sources(data_dir, select)
+        for name, stat in current.items():
+            if known.get(name) != stat:
+                changed_at[name] = now
+        known = current
+
+        ready = sorted(name for name, since in changed_at.items()
+                       if name in current and now - since >= debounce)
+        for name in list(changed_at):
+            if name in ready or name not in current:
+                del changed_at[name]
+        if ready:
+            yield ready
+
+
+def watch(data_dir: Path, output_dir: Path, select: Callable[[str], Optional[str]],
+          manifest: dict, compact: bool = False, store: bool = False):
+    """
+    Watch-Modus: konvertiert jede geaenderte Quelldatei ueber convert_file
+    (nur die betroffene Kennzahl), validiert deren Output und schreibt
+    Join-Tabelle, Bundle und Anomalie-Report neu. Dateien, deren Inhalt
+    trotz neuer mtime gleich ist (Manifest-Hash), werden uebersprungen.
+    Fehler eines Durchlaufs (z.B. eine beim Speichern umbenannte Datei)
+    werden ausgegeben, der Watch-Modus laeuft weiter.
+
+    select: Dateiname -> Kennzahl-Code (None = nicht beobachten)
+    """
+    print(f"\n[Converter] Watch-Modus: {data_dir} (Strg+C zum Beenden)")
+    try:
+        for names in watch_changes(data_dir, select):
+            try:
+                converted = []
+                for name in names:
+                    filepath, kennzahl_code = data_dir / name, select(name)
+                    if is_up_to_date(filepath, output_dir, kennzahl_code, manifest):
+                        continue
+
+                    fingerprint = source_fingerprint(filepath)
+                    print(f"[Converter] {datetime.now():%H:%M:%S} {name} -> {kennzahl_code}.json")
+                    result = convert_file_timed(filepath, output_dir, kennzahl_code, compact=compact)
+                    print_result(result)
+                    record_conversion(manifest, filepath, fingerprint, result)
+                    if "layout" in result:
+                        merge_layout(data_dir, name, kennzahl_code, result["layout"])
+                    if "error" not in result:
+                        converted.append(kennzahl_code)
+
+                save_manifest(output_dir, manifest)
+                save_layout_cache(data_dir)
+                if not converted:
+                    continue
+
+                print_validation(validate_output(output_dir, load_layout_cache(data_dir), converted))
+                write_aggregates(output_dir, store)
+            except Exception as e:
+                print(f"[Converter] Fehler im Watch-Modus: {e} (naechster Versuch bei der naechsten Aenderung)")
+    except KeyboardInterrupt:
+        print("\n[Converter] Watch-Modus beendet")
+
+
+# ============================================================
+# PROFILING
+# ============================================================
+
+# Spalten der Profil-Tabelle (Stages pro Datei)
+PROFILE_STAGES = ["load", "header", "extract", "write"]
+
+
+def format_bytes(num: int) -> str:
+    """Bytes lesbar (KB/MB)."""
+    if num >= 1024 * 1024:
+        return f"{num / 1024 / 1024:.1f} MB"
+    return f"{num / 1024:.0f} KB"
+
+
+def print_profile(results: List[dict], global_records: List[dict]):
+    """Tabelle pro Datei und Stage: Laufzeit (ms) und Speicher-Peak."""
+    profiled = [r for r in results if r and r.get("stages")]
+    if not profiled and not global_records:
+        return
+
+    header = "".join(f"{name:>10}" for name in PROFILE_STAGES)
+    print("\n[Converter] Profil (ms pro Stage, Peak = hoechster Speicherstand)")
+    print(f"  {'Kennzahl':<14}{header}{'gesamt':>10}{'Peak':>11}")
+
+    for result in sorted(profiled, key=lambda r: r["seconds"], reverse=True):
+        per_stage: Dict[str, float] = {}
+        for record in result["stages"]:
+            per_stage[record["stage"]] = per_stage.get(record["stage"], 0.0) + record["seconds"]
+        cells = "".join(f"{per_stage[name] * 1000:>10.1f}" if name in per_stage else f"{'-':>10}"
+                        for name in PROFILE_STAGES)
+        peak = max((record.get("peak_bytes", 0) for record in result["stages"]), default=0)
+        name = result.get("kennzahl") or result["file"]
+        print(f"  {name:<14}{cells}{result['seconds'] * 1000:>10.1f}{format_bytes(peak):>11}")
+
+    for record in global_records:
+        print(f"  {record['stage']:<14}{'':>{10 * len(PROFILE_STAGES)}}"
+              f"{record['seconds'] * 1000:>10.1f}{format_bytes(record.get('peak_bytes', 0)):>11}")
+
+
+def write_chrome_trace(path: Path, results: List[dict], global_records: List[dict],
+                       origin: float) -> int:
+    """
+    Schreibt die Stage-Messungen im Chrome Trace-Event-Format
+    (chrome://tracing, ui.perfetto.dev). Ein Track pro Prozess.
+    Returns: Anzahl Events
+    """
+    records = [record for r in results if r and r.get("stages") for record in r["stages"]]
+    records += global_records
+
+    events = []
+    for record in records:
+        args = {key: record[key] for key in ("file", "peak_bytes", "current_bytes") if key in record}
+        events.append({
+            "name": record["stage"],
+            "cat": "convert",
+            "ph": "X",
+            "ts": round((record["start"] - origin) * 1e6, 1),
+            "dur": round(record["seconds"] * 1e6, 1),
+            "pid": record["pid"],
+            "tid": 0,
+            "args": args
+        })
+
+    write_json(path, {"traceEvents": events, "displayTimeUnit": "ms"}, compact=True)
+    return len(events)
+
+
+def profile_slowest(results: List[dict], tasks: List[Tuple[Path, str]], path: Path,
+                    limit: int = 15, compact: bool = False) -> Optional[str]:
+    """
+    Konvertiert die langsamste Datei erneut unter cProfile (in ein temporaeres
+    Verzeichnis) und speichert die Statistik fuer pstats/snakeviz.
+    Returns: Dateiname der profilierten Datei
+    """
+    import cProfile
+    import pstats
+    import tempfile
+
+    timed = [(r["seconds"], idx) for idx, r in enumerate(results)
+             if r and "error" not in r and not r.get("skipped")]
+    if not timed:
+        return None
+    _, idx = max(timed)
+    filepath, kennzahl_code = tasks[idx]
+
+    profiler = cProfile.Profile()
+    with tempfile.TemporaryDirectory() as tmp:
+        profiler.runcall(convert_file, filepath, Path(tmp), kennzahl_code, compact)
+    profiler.dump_stats(str(path))
+
+    print(f"\n[Converter] cProfile: {filepath.name} -> {path}")
+    stats = pstats.Stats(profiler, stream=sys.stdout)
+    stats.sort_stats("cumulative").print_stats(limit)
+    return filepath.name
 
 
 def main():
@@ -449,14 +1977,44 @@ Beispiele:
     python convert.py --file 1-A-1       Nur Kennzahl 1-A-1
     python convert.py --analyze          Strukturen analysieren
     python convert.py --validate         Output validieren
+    python convert.py --jobs 4           Parallel mit 4 Prozessen (0 = alle Kerne)
+    python convert.py --force            Unveraenderte Dateien nicht ueberspringen
+    python convert.py --compact          Kennzahl-Dateien kompakt (ohne Einrueckung)
+    python convert.py --watch            Nach der Konvertierung data/ beobachten
+    python convert.py --store            Zusaetzlich SQLite-Speicher schreiben
+    python convert.py --profile          Laufzeit und Speicher pro Stage ausgeben
+    python convert.py --force --trace trace.json --cprofile slowest.prof
         """
     )
     parser.add_argument("--file", help="Nur diese Kennzahl konvertieren (z.B. 1-A-1)")
     parser.add_argument("--analyze", action="store_true", help="Nur Struktur analysieren")
     parser.add_argument("--validate", action="store_true", help="Output-Dateien validieren")
+    parser.add_argument("--force", action="store_true",
+                        help="Alle Dateien neu konvertieren (Manifest ignorieren)")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Anzahl paralleler Prozesse (0 = alle Kerne)")
+    parser.add_argument("--compact", action="store_true",
+                        help="Kennzahl-Dateien ohne Einrueckung, ganzzahlige Werte als int")
+    parser.add_argument("--watch", action="store_true",
+                        help="data/ beobachten und geaenderte Dateien sofort neu konvertieren")
+    parser.add_argument("--store", action="store_true",
+                        help=f"Alle Kennzahlen zusaetzlich in {STORE_DIRNAME}/{STORE_FILENAME} (SQLite) schreiben")
     parser.add_argument("--verbose", "-v", action="store_true", help="Ausfuehrliche Ausgabe")
+    parser.add_argument("--profile", action="store_true",
+                        help="Laufzeit und Speicher pro Datei und Stage messen (langsamer)")
+    parser.add_argument("--trace", type=Path, metavar="DATEI",
+                        help="Stage-Messungen als Chrome-Trace (JSON) speichern, impliziert --profile")
+    parser.add_argument("--cprofile", type=Path, metavar="DATEI",
+                        help="Langsamste Datei unter cProfile wiederholen und Statistik speichern")
     args = parser.parse_args()
 
+    if openpyxl is None:
+        print("[Converter] Fehler: openpyxl nicht installiert")
+        print("[Converter] Installation: pip install openpyxl")
+        sys.exit(1)
+
+    profile = args.profile or bool(args.trace)
+
     # Pfade
     script_dir = Path(__file__).parent
     project_root = script_dir.parent
@@ -464,7 +2022,7 @@ Beispiele:
     output_dir = project_root / "docs" / "data" / "json"
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    print(f"[Converter] Wissensbilanz Konverter v2.0")
+    print(f"[Converter] Wissensbilanz Konverter v{CONVERTER_VERSION}")
     print(f"[Converter] Data:   {data_dir}")
     print(f"[Converter] Output: {output_dir}")
     print()
@@ -472,27 +2030,24 @@ Beispiele:
     # Validierung
     if args.validate:
         print("[Converter] Validiere Output...")
-        results = validate_output(output_dir)
-
-        for msg in results["valid"]:
-            print(f"  [OK] {msg}")
-        for msg in results["warnings"]:
-            print(f"  [WARN] {msg}")
-        for msg in results["invalid"]:
-            print(f"  [FAIL] {msg}")
+        results = validate_output(output_dir, load_layout_cache(data_dir))
+        print_validation(results)
 
         print(f"\nErgebnis: {len(results['valid'])} OK, "
               f"{len(results['warnings'])} Warnungen, {len(results['invalid'])} Fehler")
         return
 
     # Dateien sammeln
-    all_files = list(data_dir.glob("*.xlsx"))
-    if args.file:
-        # Kennzahl-Code oder Dateiname
-        files = [f for f in all_files if args.file in f.name or
-                 FILE_TO_KENNZAHL.get(f.name, "") == args.file]
-    else:
-        files = [f for f in all_files if f.name in FILE_TO_KENNZAHL]
+    all_files = sorted(data_dir.glob("*.xlsx"))
+    def select(name: str) -> Optional[str]:
+        """Kennzahl-Code einer Datei, falls sie konvertiert werden soll."""
+        kennzahl_code = kennzahl_for_file(name)
+        if kennzahl_code and args.file and args.file not in name and kennzahl_code != args.file:
+            return None
+        return kennzahl_code
+
+    # Kennzahl-Code oder Dateiname (--file)
+    files = [f for f in all_files if select(f.name)]
 
     if not files:
         print("[Converter] Keine passenden Dateien gefunden")
@@ -500,6 +2055,11 @@ Beispiele:
         for f in all_files:
             if f.name.startswith(("1-", "2-", "3-")):
                 print(f"  - {f.name}")
+        # Im Watch-Modus auf die ersten Dateien warten
+        if args.watch and not args.analyze:
+            manifest = load_manifest(output_dir)
+            manifest["compact"] = args.compact
+            watch(data_dir, output_dir, select, manifest, args.compact, args.store)
         return
 
     print(f"[Converter] {len(files)} Dateien zu verarbeiten")
@@ -511,48 +2071,119 @@ Beispiele:
             analysis = analyze_excel(filepath)
             for sheet in analysis["sheets"]:
                 print(f"Sheet: {sheet['name']}")
-                print(f"Header Row: {sheet['header_row']}")
+                print(f"Header Row: {sheet['header_row']}"
+                      f"{' (Layout-Cache)' if sheet['layout_cached'] else ''}")
                 print(f"Jahre: {sheet['years']}")
                 if args.verbose:
                     for i, row in enumerate(sheet["sample_rows"][:8]):
                         non_empty = [c for c in row if c][:4]
                         print(f"  {i+1}: {non_empty}")
+        save_layout_cache(data_dir)
         return
 
     # Konvertierung
-    results = []
+    tasks: List[Tuple[Path, str]] = []
     for filepath in files:
-        kennzahl_code = FILE_TO_KENNZAHL.get(filepath.name)
+        kennzahl_code = select(filepath.name)
         if not kennzahl_code:
             print(f"[Converter] Ueberspringe: {filepath.name} (kein Mapping)")
             continue
-
-        print(f"[Converter] {filepath.name} -> {kennzahl_code}.json")
-
-        try:
-            result = convert_file(filepath, output_dir, kennzahl_code)
-            results.append(result)
-
-            if "error" in result:
-                print(f"  [FAIL] {result['error']}")
-            else:
-                invalid = result.get('invalid_points', 0)
-                invalid_msg = f", {invalid} ungueltig" if invalid else ""
-                print(f"  [OK] {result['data_points']} Punkte, "
-                      f"{result['universities']} Unis, Jahre: {result['years']}{invalid_msg}")
-
-        except Exception as e:
-            print(f"  [FAIL] {e}")
-            results.append({"file": filepath.name, "error": str(e)})
+        tasks.append((filepath, kennzahl_code))
+
+    # Unveraenderte Quellen ueberspringen (ausser --force)
+    # Wechsel zwischen lesbarem und kompaktem Format: alles neu schreiben
+    manifest = load_manifest(output_dir)
+    if args.force or manifest.get("compact", False) != args.compact:
+        manifest["sources"] = {}
+    manifest["compact"] = args.compact
+
+    results: List[dict] = [None] * len(tasks)
+    pending: List[int] = []
+    for idx, (filepath, kennzahl_code) in enumerate(tasks):
+        if is_up_to_date(filepath, output_dir, kennzahl_code, manifest):
+            results[idx] = cached_result(filepath, manifest)
+        else:
+            pending.append(idx)
+
+    skipped = len(tasks) - len(pending)
+    if skipped:
+        print(f"[Converter] {skipped} Dateien unveraendert (--force zum Neu-Konvertieren)")
+        if args.verbose:
+            for result in results:
+                if result:
+                    print(f"  [SKIP] {result['file']}")
+
+    # Fingerprint vor der Konvertierung erfassen: aendert sich die Datei
+    # waehrenddessen, wird sie beim naechsten Lauf erneut konvertiert
+    fingerprints = {idx: source_fingerprint(tasks[idx][0]) for idx in pending}
+    pending_tasks = [tasks[idx] for idx in pending]
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    wall_start = time.perf_counter()
+
+    if jobs > 1 and len(pending_tasks) > 1:
+        print(f"[Converter] Parallel-Modus: {min(jobs, len(pending_tasks))} Prozesse")
+        for pos, result in convert_parallel(pending_tasks, output_dir, jobs, profile, args.compact):
+            filepath, kennzahl_code = pending_tasks[pos]
+            print(f"[Converter] {filepath.name} -> {kennzahl_code}.json")
+            print_result(result)
+            results[pending[pos]] = result
+    else:
+        for idx, (filepath, kennzahl_code) in zip(pending, pending_tasks):
+            print(f"[Converter] {filepath.name} -> {kennzahl_code}.json")
+            result = convert_file_timed(filepath, output_dir, kennzahl_code, profile, args.compact)
+            print_result(result)
+            results[idx] = result
+
+    wall_seconds = time.perf_counter() - wall_start
+
+    for idx in pending:
+        record_conversion(manifest, tasks[idx][0], fingerprints[idx], results[idx])
+    save_manifest(output_dir, manifest)
+
+    # Layouts (auch aus Worker-Prozessen) in den Layout-Cache uebernehmen
+    layout_results = [r for r in results if "layout" in r]
+    for result in layout_results:
+        merge_layout(data_dir, result["file"], result.get("kennzahl"), result["layout"])
+    save_layout_cache(data_dir)
+    if layout_results:
+        hits = sum(1 for r in layout_results if r["layout_cached"])
+        print(f"[Converter] Layout-Cache: {hits}/{len(layout_results)} Treffer")
+
+    # Join-Tabelle, Bundle und Anomalien aller Kennzahlen (auch der unveraenderten) neu schreiben
+    if profile:
+        start_stage_recording()
+        tracemalloc.start()
+
+    write_aggregates(output_dir, args.store)
 
     # Zusammenfassung
     successful = [r for r in results if "error" not in r]
+    converted = [r for r in successful if not r.get("skipped")]
     total_points = sum(r.get('data_points', 0) for r in successful)
 
-    print(f"\n[Converter] Fertig: {len(successful)}/{len(results)} Dateien konvertiert")
+    print(f"\n[Converter] Fertig: {len(converted)}/{len(pending)} Dateien konvertiert"
+          f"{f', {skipped} unveraendert' if skipped else ''}")
     print(f"[Converter] Gesamt: {total_points} Datenpunkte")
+    print(f"[Converter] Laufzeit: {wall_seconds:.2f}s "
+          f"(Summe pro Datei: {sum(r.get('seconds', 0) for r in results):.2f}s)")
     print(f"[Converter] Datum: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
 
+    # Profiling-Ausgaben
+    if profile:
+        tracemalloc.stop()
+        global_records = stop_stage_recording()
+        print_profile(results, global_records)
+        if args.trace:
+            count = write_chrome_trace(args.trace, results, global_records, wall_start)
+            print(f"\n[Converter] Trace: {args.trace} ({count} Events)")
+    if args.cprofile:
+        if not profile_slowest(results, tasks, args.cprofile, compact=args.compact):
+            print("\n[Converter] cProfile: keine konvertierte Datei (--force?)")
+
+    if args.watch:
+        watch(data_dir, output_dir, select, manifest, args.compact, args.store)
+
 
 if __name__ == "__main__":
     main()
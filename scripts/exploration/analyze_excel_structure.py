@@ -14,122 +14,35 @@ Verwendung:
 
 Output:
     - Strukturanalyse als Markdown
+
+Die Dateien werden über die gemeinsame Scan-Schicht gelesen (scan.py:
+parallel, Ergebnis pro Datei gecacht).
 """
 
 import pandas as pd
 from pathlib import Path
 import argparse
 import sys
-import re
-
-
-def find_header_row(df: pd.DataFrame) -> int | None:
-    """
-    Findet die Header-Zeile anhand von Schlüsselwörtern.
-
-    Returns:
-        Zeilennummer oder None
-    """
-    keywords = ['Universität', 'Frauen', 'Männer', 'Gesamt']
-
-    for i in range(min(30, len(df))):
-        row_str = ' '.join([str(x) for x in df.iloc[i].values if pd.notna(x)])
-        if any(kw in row_str for kw in keywords):
-            # Prüfe ob es wirklich die Daten-Header-Zeile ist
-            if 'Universität' in row_str and ('Frauen' in row_str or 'Gesamt' in row_str):
-                return i
-
-    return None
-
-
-def extract_years(df: pd.DataFrame) -> list[str]:
-    """
-    Extrahiert verfügbare Jahre/Semester aus dem DataFrame.
-
-    Returns:
-        Liste von Jahren/Semestern
-    """
-    years = set()
-
-    for i in range(min(25, len(df))):
-        for j in range(df.shape[1]):
-            val = str(df.iloc[i, j]) if pd.notna(df.iloc[i, j]) else ''
-
-            # Wintersemester Format
-            match = re.search(r'Wintersemester (\d{4})', val)
-            if match:
-                years.add(f"WS {match.group(1)}")
 
-            # Studienjahr Format
-            match = re.search(r'Studienjahr (\d{4}/\d{2})', val)
-            if match:
-                years.add(f"STJ {match.group(1)}")
+from scan import add_scan_arguments, scan_files
 
-            # Jahr Format
-            match = re.search(r'Jahr (\d{4})', val)
-            if match:
-                years.add(f"{match.group(1)}")
 
-    return sorted(years, reverse=True)
-
-
-def extract_stichtag(df: pd.DataFrame) -> str | None:
+def analyze_file(scan: dict) -> dict:
     """
-    Extrahiert den Stichtag aus dem DataFrame.
+    Analyse-Ergebnis einer Datei aus ihrem Scan (scan.py).
 
-    Returns:
-        Stichtag-String oder None
-    """
-    for i in range(min(25, len(df))):
-        for j in range(df.shape[1]):
-            val = str(df.iloc[i, j]) if pd.notna(df.iloc[i, j]) else ''
-            match = re.search(r'Stichtag: (\d{2}\.\d{2}\.\d{4})', val)
-            if match:
-                return match.group(1)
-    return None
-
-
-def analyze_file(file_path: Path) -> dict:
-    """
-    Analysiert eine einzelne Excel-Datei.
+    Die Struktur-Analyse gilt nur für das Sheet "Tab"; Dateien ohne
+    "Tab" (Dokumentations-Format) werden als Fehler geführt.
 
     Returns:
         Dictionary mit Analyseergebnissen
     """
-    result = {
-        'filename': file_path.name,
-        'error': None,
-        'sheets': [],
-        'rows': 0,
-        'cols': 0,
-        'header_row': None,
-        'years': [],
-        'stichtag': None,
-        'title': None,
-        'category': 'wissensbilanz' if file_path.name[0].isdigit() else 'unidata'
-    }
-
-    try:
-        xl = pd.ExcelFile(file_path)
-        result['sheets'] = xl.sheet_names
-
-        df = pd.read_excel(file_path, sheet_name='Tab', header=None)
-        result['rows'] = df.shape[0]
-        result['cols'] = df.shape[1]
-        result['header_row'] = find_header_row(df)
-        result['years'] = extract_years(df)
-        result['stichtag'] = extract_stichtag(df)
-
-        # Titel aus ersten Zeilen
-        for i in range(min(5, len(df))):
-            val = df.iloc[i, 0]
-            if pd.notna(val) and str(val).strip():
-                result['title'] = str(val).strip()[:80]
-                break
-
-    except Exception as e:
-        result['error'] = str(e)
-
+    keys = ['filename', 'error', 'sheets', 'rows', 'cols', 'header_row',
+            'years', 'stichtag', 'title', 'category']
+    result = {key: scan[key] for key in keys}
+    if not scan['error'] and scan['sheet'] != 'Tab':
+        result.update(error='Kein Sheet "Tab"', rows=0, cols=0,
+                      header_row=None, years=[], stichtag=None, title=None)
     return result
 
 
@@ -198,6 +111,7 @@ def main():
     parser.add_argument('--file', help='Einzelne Datei analysieren')
     parser.add_argument('--category', choices=['wissensbilanz', 'unidata'],
                         help='Nur bestimmte Kategorie analysieren')
+    add_scan_arguments(parser)
     args = parser.parse_args()
 
     # Finde data-Verzeichnis
@@ -215,12 +129,13 @@ def main():
         if not file_path.exists():
             print(f"Fehler: Datei nicht gefunden: {file_path}", file=sys.stderr)
             sys.exit(1)
-        results = [analyze_file(file_path)]
+        paths = [file_path]
     else:
         # Alle Dateien
-        results = []
-        for f in sorted(data_dir.glob('*.xlsx')):
-            results.append(analyze_file(f))
+        paths = sorted(data_dir.glob('*.xlsx'))
+
+    scans = scan_files(paths, data_dir, args.jobs, args.refresh)
+    results = [analyze_file(scan) for scan in scans.values()]
 
     print_analysis(results, args.category)
 
@@ -0,0 +1,233 @@
+"""
+Gemeinsame Scan-Schicht der Explorations-Skripte.
+
+Öffnet jede Excel-Datei genau einmal und extrahiert alles, was
+analyze_excel_structure.py, verify_stichtage.py und
+verify_university_codes.py brauchen:
+
+- Sheets, Dimensionen, Header-Zeile, Titel
+- Jahre/Semester und Stichtage (inkl. Kontext für die Verifikation)
+- Universitäts-Codes (Code, Kurztext, Langtext)
+
+Dateien werden über einen Prozess-Pool verteilt. Das Ergebnis pro Datei
+wird in data/.cache/scans.json abgelegt (Schlüssel: Dateiname, Größe,
+mtime); solange sich eine Datei nicht ändert, lesen alle drei Skripte
+nur noch den Cache.
+
+Verwendung:
+    from scan import scan_files, add_scan_arguments
+    scans = scan_files(sorted(data_dir.glob('*.xlsx')), data_dir, jobs=args.jobs)
+"""
+
+import os
+import sys
+import json
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+# Gemeinsame Header-Parser und atomares Schreiben aus scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from header_parsing import (STICHTAG_PATTERN, extract_period, extract_period_labels,
+                            extract_stichtage)
+from json_writer import write_json
+
+
+# ============================================================
+# KONFIGURATION
+# ============================================================
+
+# Bei Änderungen an scan_file erhöhen (verwirft alte Cache-Einträge)
+SCAN_VERSION = 1
+
+# Cache relativ zum data-Verzeichnis (wie der Layout-Cache von convert.py)
+SCAN_CACHE_FILE = Path('.cache') / 'scans.json'
+
+# Zeilen für Header-Suche und Stichtag-Verifikation bzw. Jahre/Stichtag/Titel
+HEADER_SCAN_ROWS = 30
+PERIOD_SCAN_ROWS = 25
+TITLE_SCAN_ROWS = 5
+
+# Universitäts-Zeilen beginnen nach dem Header-Bereich
+UNI_FIRST_ROW = 20
+
+HEADER_KEYWORDS = ['Universität', 'Frauen', 'Männer', 'Gesamt']
+
+
+# ============================================================
+# EXTRAKTION
+# ============================================================
+
+def find_header_row(top: list[list[str]]) -> int | None:
+    """Header-Zeile anhand von Schlüsselwörtern (Zeilen als Texte)."""
+    for i, cells in enumerate(top):
+        row_str = ' '.join(cell for cell in cells if cell)
+        if any(kw in row_str for kw in HEADER_KEYWORDS):
+            # Prüfe ob es wirklich die Daten-Header-Zeile ist
+            if 'Universität' in row_str and ('Frauen' in row_str or 'Gesamt' in row_str):
+                return i
+    return None
+
+
+def stichtag_context(text: str) -> str:
+    if 'Wintersemester' in text:
+        return 'Wintersemester'
+    if 'Sommersemester' in text:
+        return 'Sommersemester'
+    if 'Studienjahr' in text:
+        return 'Studienjahr'
+    return ''
+
+
+def extract_university_codes(df: pd.DataFrame) -> list[list[str]]:
+    """Universitätszeilen: Code beginnt mit U, ist 2 Zeichen, Name ist nicht leer."""
+    if df.shape[1] < 3:
+        return []
+    found = {}
+    for col0, col1, col2 in df.iloc[UNI_FIRST_ROW:, :3].itertuples(index=False):
+        col0 = str(col0).strip() if pd.notna(col0) else ''
+        col1 = str(col1).strip() if pd.notna(col1) else ''
+        col2 = str(col2).strip() if pd.notna(col2) else ''
+        if col1.startswith('U') and len(col1) == 2 and col0 and col1 not in found:
+            found[col1] = [col1, col0, col2]
+    return sorted(found.values())
+
+
+def scan_file(file_path: Path) -> dict:
+    """
+    Liest eine Datei einmal (Sheet "Tab", sonst das erste Sheet).
+
+    Returns:
+        Dictionary mit allen Scan-Ergebnissen; bei Lesefehlern ist 'error' gesetzt
+    """
+    result = {
+        'filename': file_path.name,
+        'error': None,
+        'sheets': [],
+        'sheet': None,
+        'rows': 0,
+        'cols': 0,
+        'header_row': None,
+        'years': [],
+        'stichtag': None,
+        'stichtage': [],
+        'title': None,
+        'uni_codes': [],
+        'category': 'wissensbilanz' if file_path.name[0].isdigit() else 'unidata'
+    }
+
+    try:
+        with pd.ExcelFile(file_path) as xl:
+            result['sheets'] = xl.sheet_names
+            result['sheet'] = 'Tab' if 'Tab' in xl.sheet_names else xl.sheet_names[0]
+            df = xl.parse(result['sheet'], header=None)
+    except Exception as e:
+        result['error'] = str(e)
+        return result
+
+    result['rows'], result['cols'] = (int(n) for n in df.shape)
+
+    # Obere Zeilen einmal als Texte (leere Zellen = '')
+    top = [[str(v) if pd.notna(v) else '' for v in row]
+           for row in df.head(HEADER_SCAN_ROWS).itertuples(index=False)]
+
+    result['header_row'] = find_header_row(top)
+
+    years = set()
+    for i, cells in enumerate(top):
+        for val in cells:
+            if i < PERIOD_SCAN_ROWS:
+                # Wintersemester-, Studienjahr- und Jahr-Format in einem Durchlauf
+                years.update(extract_period_labels(val))
+                if result['stichtag'] is None:
+                    stichtage = extract_stichtage(val)
+                    if stichtage:
+                        result['stichtag'] = stichtage[0]
+
+            for date in STICHTAG_PATTERN.findall(val):
+                result['stichtage'].append({
+                    'file': file_path.name,
+                    'stichtag': date,
+                    'context': stichtag_context(val),
+                    'period': extract_period(val),
+                    'full_text': val[:100]
+                })
+    result['years'] = sorted(years, reverse=True)
+
+    # Titel aus ersten Zeilen
+    for cells in top[:TITLE_SCAN_ROWS]:
+        if cells and cells[0].strip():
+            result['title'] = cells[0].strip()[:80]
+            break
+
+    result['uni_codes'] = extract_university_codes(df)
+    return result
+
+
+# ============================================================
+# CACHE UND PARALLELER SCAN
+# ============================================================
+
+def file_key(file_path: Path) -> list:
+    stat = file_path.stat()
+    return [SCAN_VERSION, stat.st_size, stat.st_mtime_ns]
+
+
+def load_scan_cache(data_dir: Path) -> dict:
+    try:
+        with open(data_dir / SCAN_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_scan_cache(data_dir: Path, cache: dict):
+    """Schreibt den Cache atomar (json_writer.write_json)."""
+    path = data_dir / SCAN_CACHE_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_json(path, cache, compact=True)
+
+
+def scan_files(paths: list[Path], data_dir: Path, jobs: int | None = None,
+               refresh: bool = False) -> dict[str, dict]:
+    """
+    Scan-Ergebnisse für alle Dateien (Dateiname -> Ergebnis).
+
+    Nur Dateien ohne gültigen Cache-Eintrag werden gelesen, bei mehr als
+    einer solchen Datei parallel (jobs: Anzahl Prozesse, None = alle Kerne).
+    """
+    cache = load_scan_cache(data_dir)
+    results = {}
+    missing = []
+    for path in paths:
+        entry = None if refresh else cache.get(path.name)
+        if entry and entry.get('key') == file_key(path):
+            results[path.name] = entry['result']
+        else:
+            missing.append(path)
+
+    if missing:
+        workers = min(jobs or os.cpu_count() or 1, len(missing))
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                scanned = list(pool.map(scan_file, missing))
+        else:
+            scanned = [scan_file(path) for path in missing]
+
+        for path, result in zip(missing, scanned):
+            results[path.name] = result
+            cache[path.name] = {'key': file_key(path), 'result': result}
+        save_scan_cache(data_dir, cache)
+
+    return {path.name: results[path.name] for path in paths}
+
+
+def add_scan_arguments(parser: argparse.ArgumentParser):
+    """Gemeinsame Optionen der Explorations-Skripte."""
+    parser.add_argument('--jobs', '-j', type=int, default=None,
+                        help='Anzahl paralleler Prozesse (Standard: alle Kerne)')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Scan-Cache ignorieren und alle Dateien neu lesen')
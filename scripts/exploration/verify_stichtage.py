@@ -5,66 +5,27 @@ Extrahiert alle Stichtage und deren Kontext (Personal, Studierende, etc.)
 direkt aus den Excel-Quelldateien.
 
 Verwendung:
-    python scripts/exploration/verify_stichtage.py
+    python scripts/exploration/verify_stichtage.py [--jobs N] [--refresh]
+
+Die Dateien werden über die gemeinsame Scan-Schicht gelesen (scan.py).
 """
 
 import pandas as pd
 from pathlib import Path
-import re
+import argparse
 import sys
 
+from scan import add_scan_arguments, scan_files
+
 
-def extract_stichtage(file_path: Path) -> list[dict]:
+def extract_stichtage(scan: dict) -> list[dict]:
     """
-    Extrahiert alle Stichtage aus einer Excel-Datei.
+    Alle Stichtage einer Excel-Datei aus ihrem Scan (scan.py).
 
     Returns:
         Liste von Dictionaries mit Stichtag-Informationen
     """
-    results = []
-
-    try:
-        xl = pd.ExcelFile(file_path)
-        sheet_name = 'Tab' if 'Tab' in xl.sheet_names else xl.sheet_names[0]
-        df = pd.read_excel(file_path, sheet_name=sheet_name, header=None)
-    except Exception as e:
-        return []
-
-    for i in range(min(30, len(df))):
-        for j in range(df.shape[1]):
-            val = str(df.iloc[i, j]) if pd.notna(df.iloc[i, j]) else ''
-
-            # Stichtag-Pattern
-            matches = re.findall(r'(Stichtag:\s*(\d{2}\.\d{2}\.\d{4}))', val)
-            for full_match, date in matches:
-                # Kontext ermitteln
-                context = ''
-                if 'Wintersemester' in val:
-                    context = 'Wintersemester'
-                elif 'Sommersemester' in val:
-                    context = 'Sommersemester'
-                elif 'Studienjahr' in val:
-                    context = 'Studienjahr'
-
-                # Semester/Jahr extrahieren
-                semester_match = re.search(r'(Wintersemester|Sommersemester)\s+(\d{4})', val)
-                year_match = re.search(r'Studienjahr\s+(\d{4}/\d{2})', val)
-
-                period = ''
-                if semester_match:
-                    period = f"{semester_match.group(1)} {semester_match.group(2)}"
-                elif year_match:
-                    period = f"Studienjahr {year_match.group(1)}"
-
-                results.append({
-                    'file': file_path.name,
-                    'stichtag': date,
-                    'context': context,
-                    'period': period,
-                    'full_text': val[:100]
-                })
-
-    return results
+    return [] if scan['error'] else scan['stichtage']
 
 
 def analyze_stichtage_patterns(all_stichtage: list[dict]) -> dict:
@@ -91,6 +52,10 @@ def analyze_stichtage_patterns(all_stichtage: list[dict]) -> dict:
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Verifikation der Stichtage')
+    add_scan_arguments(parser)
+    args = parser.parse_args()
+
     script_dir = Path(__file__).parent
     project_root = script_dir.parent.parent
     data_dir = project_root / 'data'
@@ -106,9 +71,9 @@ def main():
 
     # Sammle alle Stichtage
     all_stichtage = []
-    for f in sorted(data_dir.glob('*.xlsx')):
-        stichtage = extract_stichtage(f)
-        all_stichtage.extend(stichtage)
+    scans = scan_files(sorted(data_dir.glob('*.xlsx')), data_dir, args.jobs, args.refresh)
+    for scan in scans.values():
+        all_stichtage.extend(extract_stichtage(scan))
 
     print(f"**Gefundene Stichtag-Einträge:** {len(all_stichtage)}")
     print()
@@ -10,41 +10,45 @@ Verwendung:
 Output:
     - Markdown-Tabelle mit allen verifizierten Codes
     - Warnungen bei Inkonsistenzen zwischen Dateien
+
+Die Dateien werden über die gemeinsame Scan-Schicht gelesen (scan.py).
 """
 
 import pandas as pd
 from pathlib import Path
+import argparse
 import sys
 
-def extract_university_codes(file_path: Path) -> list[tuple[str, str, str]]:
+from scan import add_scan_arguments, scan_files
+
+
+def extract_university_codes(scan: dict) -> list[tuple[str, str, str]]:
     """
-    Extrahiert Universitäts-Codes aus einer Excel-Datei.
+    Universitäts-Codes einer Excel-Datei aus ihrem Scan (scan.py).
+    Nur Dateien mit Sheet "Tab" enthalten Universitätszeilen.
 
     Returns:
         Liste von Tupeln: (Code, Kurztext, Langtext)
     """
-    try:
-        df = pd.read_excel(file_path, sheet_name='Tab', header=None)
-    except Exception as e:
-        print(f"Fehler beim Lesen von {file_path.name}: {e}", file=sys.stderr)
+    if scan['error']:
+        print(f"Fehler beim Lesen von {scan['filename']}: {scan['error']}", file=sys.stderr)
         return []
+    if scan['sheet'] != 'Tab':
+        print(f"Übersprungen: {scan['filename']} hat kein Sheet \"Tab\"", file=sys.stderr)
+        return []
+    return [tuple(entry) for entry in scan['uni_codes']]
 
-    found_unis = []
-    for i in range(20, len(df)):
-        row = df.iloc[i]
-        col0 = str(row.iloc[0]).strip() if pd.notna(row.iloc[0]) else ''
-        col1 = str(row.iloc[1]).strip() if pd.notna(row.iloc[1]) else ''
-        col2 = str(row.iloc[2]).strip() if pd.notna(row.iloc[2]) else ''
-
-        # Universitätszeilen: Code beginnt mit U, ist 2 Zeichen, Name ist nicht leer
-        if col1.startswith('U') and len(col1) == 2 and col0:
-            if col1 not in [u[0] for u in found_unis]:
-                found_unis.append((col1, col0, col2))
 
-    return sorted(found_unis)
+# Primärquelle und weitere Dateien für die Konsistenzprüfung
+MAIN_FILE = '1-A-1 Personal - Köpfe.xlsx'
+FILES_TO_CHECK = [
+    MAIN_FILE,
+    'Ordentliche Studierende nach Universitäten.xlsx',
+    'Studienabschlüsse nach Universitäten.xlsx',
+]
 
 
-def verify_codes_across_files(data_dir: Path) -> dict:
+def verify_codes_across_files(scans: dict[str, dict]) -> dict:
     """
     Verifiziert Codes über mehrere Dateien hinweg.
 
@@ -53,17 +57,9 @@ def verify_codes_across_files(data_dir: Path) -> dict:
     """
     all_codes = {}
 
-    # Prüfe mehrere Dateien für Konsistenz
-    files_to_check = [
-        '1-A-1 Personal - Köpfe.xlsx',
-        'Ordentliche Studierende nach Universitäten.xlsx',
-        'Studienabschlüsse nach Universitäten.xlsx',
-    ]
-
-    for filename in files_to_check:
-        file_path = data_dir / filename
-        if file_path.exists():
-            codes = extract_university_codes(file_path)
+    for filename in FILES_TO_CHECK:
+        if filename in scans:
+            codes = extract_university_codes(scans[filename])
             for code, kurz, lang in codes:
                 if code not in all_codes:
                     all_codes[code] = []
@@ -73,6 +69,10 @@ def verify_codes_across_files(data_dir: Path) -> dict:
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Verifikation der Universitäts-Codes')
+    add_scan_arguments(parser)
+    args = parser.parse_args()
+
     # Finde data-Verzeichnis
     script_dir = Path(__file__).parent
     project_root = script_dir.parent.parent
@@ -87,10 +87,14 @@ def main():
     print(f"**Quelle:** `{data_dir}`")
     print()
 
+    # Alle benötigten Dateien in einem Scan (Hauptdatei ist darin enthalten)
+    paths = [data_dir / name for name in FILES_TO_CHECK if (data_dir / name).exists()]
+    scans = scan_files(paths, data_dir, args.jobs, args.refresh)
+
     # Extrahiere aus Hauptdatei
-    main_file = data_dir / '1-A-1 Personal - Köpfe.xlsx'
-    if main_file.exists():
-        codes = extract_university_codes(main_file)
+    main_file = data_dir / MAIN_FILE
+    if main_file.name in scans:
+        codes = extract_university_codes(scans[main_file.name])
 
         print(f"**Primärquelle:** `{main_file.name}`")
         print(f"**Anzahl Universitäten:** {len(codes)}")
@@ -104,7 +108,7 @@ def main():
     # Konsistenzprüfung
     print("## Konsistenzprüfung")
     print()
-    all_codes = verify_codes_across_files(data_dir)
+    all_codes = verify_codes_across_files(scans)
 
     inconsistencies = []
     for code, entries in all_codes.items():
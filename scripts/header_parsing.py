@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Header-Parsing - Gemeinsame Erkennung von Jahren, Perioden und Stichtagen.
+
+Wird vom Konverter (convert.py) und den Explorations-Skripten verwendet,
+damit Header ueberall gleich gelesen werden.
+
+Die Muster sind vorkompiliert, die Jahres-Erkennung laeuft in einem
+einzigen Durchlauf ueber den Text und ist memoisiert: XLCubed-Exporte
+wiederholen dieselben Header-Texte in jeder Datei und jedem Sheet.
+
+Benchmark: python scripts/benchmarks/bench_year_extractor.py
+"""
+
+import re
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+
+# ============================================================
+# MUSTER
+# ============================================================
+
+# Alle drei Header-Formate in einem Muster. Prioritaet wie bisher:
+#   1. WS2024
+#   2. Wintersemester 2024 / Studienjahr 2024
+#   3. Jahr allein (20xx)
+YEAR_PATTERN = re.compile(
+    r'WS(\d{4})'
+    r'|(?:Wintersemester|Studienjahr)\s*(\d{4})'
+    r'|\b(20\d{2})\b'
+)
+
+# Perioden-Labels fuer die Struktur-Analyse (z.B. "WS 2024", "STJ 2023/24")
+PERIOD_PATTERN = re.compile(
+    r'Wintersemester (\d{4})'
+    r'|Studienjahr (\d{4}/\d{2})'
+    r'|Jahr (\d{4})'
+)
+
+# Stichtag: "Stichtag: 31.12.2024"
+STICHTAG_PATTERN = re.compile(r'Stichtag:\s*(\d{2}\.\d{2}\.\d{4})')
+
+# Semester bzw. Studienjahr mit Jahr (Kontext eines Stichtags)
+SEMESTER_PATTERN = re.compile(r'(Wintersemester|Sommersemester)\s+(\d{4})')
+STUDIENJAHR_PATTERN = re.compile(r'Studienjahr\s+(\d{4}/\d{2})')
+
+# Groesse der Memo-Caches (verschiedene Header-Texte ueber alle Dateien)
+CACHE_SIZE = 8192
+
+
+# ============================================================
+# JAHRES-ERKENNUNG
+# ============================================================
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _year_from_text(text: str) -> Optional[int]:
+    """Single-Pass-Suche: bricht beim ersten WS-Treffer ab, sonst erster Treffer nach Prioritaet."""
+    named = None
+    bare = None
+    for match in YEAR_PATTERN.finditer(text):
+        ws_year, named_year, bare_year = match.groups()
+        if ws_year:
+            return int(ws_year)
+        if named_year and named is None:
+            named = int(named_year)
+        elif bare_year and bare is None:
+            bare = int(bare_year)
+    return named if named is not None else bare
+
+
+def extract_year_from_header(header_text) -> Optional[int]:
+    """Extrahiert Jahr aus verschiedenen Header-Formaten."""
+    if not header_text:
+        return None
+    return _year_from_text(str(header_text))
+
+
+# ============================================================
+# PERIODEN UND STICHTAGE
+# ============================================================
+
+@lru_cache(maxsize=CACHE_SIZE)
+def extract_period_labels(text: str) -> Tuple[str, ...]:
+    """Findet Perioden-Labels ("WS 2024", "STJ 2023/24", "2024") in einem Text."""
+    labels = []
+    for ws_year, stj, year in PERIOD_PATTERN.findall(text):
+        if ws_year:
+            labels.append(f"WS {ws_year}")
+        elif stj:
+            labels.append(f"STJ {stj}")
+        elif year:
+            labels.append(year)
+    return tuple(labels)
+
+
+def extract_stichtage(text: str) -> List[str]:
+    """Findet alle Stichtage (TT.MM.JJJJ) in einem Text."""
+    return STICHTAG_PATTERN.findall(text)
+
+
+def extract_period(text: str) -> str:
+    """Periode eines Header-Textes, z.B. "Wintersemester 2024" oder "Studienjahr 2023/24"."""
+    match = SEMESTER_PATTERN.search(text)
+    if match:
+        return f"{match.group(1)} {match.group(2)}"
+    match = STUDIENJAHR_PATTERN.search(text)
+    if match:
+        return f"Studienjahr {match.group(1)}"
+    return ''
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+JSON-Writer - Inkrementelles und atomares Schreiben der Output-Dateien.
+
+Wird von convert.py fuer alle Dateien unter docs/data/json/ verwendet:
+
+- atomic_write:      schreibt in eine temporaere Datei im Zielverzeichnis und
+                     ersetzt das Ziel erst nach vollstaendigem Schreiben
+                     (os.replace). Bricht der Prozess ab, bleibt die alte
+                     Datei unveraendert, halbe Dateien entstehen nie.
+- JsonArrayWriter:   schreibt ein JSON-Array Element fuer Element, so dass
+                     Datenpunkte direkt aus einem Generator kommen koennen
+                     und nie als Liste im Speicher liegen muessen
+- write_json:        ganzes Objekt atomar schreiben
+- atomic_path:       wie atomic_write, aber fuer Dateien, die ein anderes
+                     Modul ueber den Pfad schreibt (SQLite-Speicher)
+
+Formate:
+- lesbar (Standard): wie json.dump(..., indent=2), byte-identisch
+- kompakt:           ohne Einrueckung und Leerzeichen, kuerzeste
+                     Float-Darstellung (repr). JsonArrayWriter schreibt
+                     zusaetzlich ganzzahlige Floats als int (7640.0 -> 7640)
+                     und ein Element pro Zeile, damit Diffs lesbar bleiben.
+                     Abgeleitete Formate (columnar/, cube/, ...) runden
+                     selbst und werden unveraendert kodiert.
+"""
+
+import os
+import json
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterable, List, Optional
+
+
+# ============================================================
+# KONFIGURATION
+# ============================================================
+
+INDENT = 2
+
+# Elemente pro Schreibvorgang in JsonArrayWriter (begrenzt den Puffer)
+CHUNK_SIZE = 1024
+
+_PRETTY = json.JSONEncoder(ensure_ascii=False, indent=INDENT)
+_COMPACT = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+
+# ============================================================
+# KOMPAKTE WERTE
+# ============================================================
+
+def compact_number(value: Optional[float]):
+    """Gibt ganzzahlige Floats als int zurueck (7640.0 -> 7640)."""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def compact_values(obj):
+    """Wendet compact_number rekursiv auf Dicts und Listen an."""
+    if isinstance(obj, float):
+        return compact_number(obj)
+    if isinstance(obj, dict):
+        return {key: compact_values(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [compact_values(value) for value in obj]
+    return obj
+
+
+def encode(obj, compact: bool = False) -> str:
+    """Kodiert ein Objekt lesbar (indent=2) oder ohne Leerzeichen."""
+    return (_COMPACT if compact else _PRETTY).encode(obj)
+
+
+# ============================================================
+# ATOMARES SCHREIBEN
+# ============================================================
+
+@contextmanager
+def atomic_path(path: Path):
+    """
+    Liefert einen temporaeren Pfad neben path (".<name>.<pid>.tmp") und
+    ersetzt path erst, wenn der with-Block ohne Fehler endet.
+    Bei einer Exception wird die temporaere Datei entfernt.
+    """
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        yield tmp
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+@contextmanager
+def atomic_write(path: Path, mode: str = 'w'):
+    """Oeffnet eine temporaere Datei (atomic_path) und ersetzt path am Ende."""
+    encoding = None if 'b' in mode else 'utf-8'
+    with atomic_path(path) as tmp:
+        with open(tmp, mode, encoding=encoding) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def write_json(path: Path, obj, compact: bool = False):
+    """Schreibt ein Objekt atomar als JSON."""
+    with atomic_write(path) as f:
+        f.write(encode(obj, compact))
+
+
+def write_bytes(path: Path, content: bytes):
+    """Schreibt Bytes atomar (z.B. Bundle und vorkomprimierte Varianten)."""
+    with atomic_write(path, 'wb') as f:
+        f.write(content)
+
+
+# ============================================================
+# INKREMENTELLES ARRAY
+# ============================================================
+
+class JsonArrayWriter:
+    """
+    Schreibt ein JSON-Array Element fuer Element in eine offene Datei.
+
+    Lesbar entspricht die Ausgabe json.dump(items, f, indent=2),
+    kompakt steht jedes Element ohne Leerzeichen auf einer eigenen Zeile.
+    Elemente werden in Bloecken von CHUNK_SIZE kodiert (ein Encoder-Aufruf
+    pro Block statt pro Element).
+    """
+
+    def __init__(self, f: IO[str], compact: bool = False):
+        self.f = f
+        self.compact = compact
+        self.count = 0
+        self._pending: List = []
+
+    def write(self, item):
+        self._pending.append(item)
+        if len(self._pending) >= CHUNK_SIZE:
+            self._flush()
+
+    def _flush(self):
+        if not self._pending:
+            return
+        if self.compact:
+            text = ",\n".join(map(_COMPACT.encode, map(compact_values, self._pending)))
+        else:
+            # "[\n  {...},\n  {...}\n]" ohne die aeusseren Klammern
+            text = _PRETTY.encode(self._pending)[2:-2]
+        self.f.write(("[\n" if self.count == 0 else ",\n") + text)
+        self.count += len(self._pending)
+        self._pending = []
+
+    def close(self):
+        self._flush()
+        self.f.write("\n]" if self.count else "[]")
+
+
+def write_json_array(path: Path, items: Iterable, compact: bool = False) -> int:
+    """
+    Schreibt items (auch Generator) atomar als JSON-Array.
+    Returns: Anzahl geschriebener Elemente
+    """
+    with atomic_write(path) as f:
+        writer = JsonArrayWriter(f, compact)
+        for item in items:
+            writer.write(item)
+        writer.close()
+    return writer.count
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Mock der Messages-API - Lokaler Endpoint fuer Offline-Tests (H2).
+
+Nimmt Anfragen wie https://api.anthropic.com/v1/messages entgegen und
+antwortet im selben Format, ohne API-Key und ohne Netzwerk. Damit lassen
+sich reports.py und die Lasttests (benchmarks/bench_reports.py)
+reproduzierbar gegen eine einstellbare Latenz und Fehlerrate fahren:
+
+- POST /v1/messages: prueft model, max_tokens und messages, wartet
+  latency +/- jitter Sekunden und liefert eine Antwort mit usage
+  (Tokens geschaetzt: 4 Zeichen pro Token)
+- mit error_rate: Antwort 429 (rate_limit_error) wie die echte API
+- GET /stats: Zaehler (Anfragen, Fehler, Tokens)
+
+Verwendung:
+    python scripts/mock_messages_api.py --port 8765 --latency 0.5
+    python scripts/reports.py 2-A-5 --endpoint http://127.0.0.1:8765/v1/messages
+
+    from mock_messages_api import start_server
+    server = start_server(latency=0.1)     # Port frei gewaehlt
+    ...
+    server.shutdown()
+"""
+
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+
+# ============================================================
+# KONFIGURATION
+# ============================================================
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_LATENCY = 0.5
+DEFAULT_JITTER = 0.1
+
+MESSAGES_PATH = "/v1/messages"
+STATS_PATH = "/stats"
+
+# Grobe Schaetzung wie bei Claude-Modellen ueblich
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+# ============================================================
+# SERVER
+# ============================================================
+
+class MockServer(ThreadingHTTPServer):
+    """HTTP-Server mit Einstellungen und Zaehlern fuer alle Handler-Threads."""
+
+    daemon_threads = True
+    # Lasttests oeffnen viele Verbindungen gleichzeitig
+    request_queue_size = 256
+
+    def __init__(self, address, latency: float = DEFAULT_LATENCY, jitter: float = DEFAULT_JITTER,
+                 error_rate: float = 0.0, seed: Optional[int] = None, verbose: bool = False):
+        super().__init__(address, MessagesHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.verbose = verbose
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "errors": 0, "rejected": 0, "inputTokens": 0, "outputTokens": 0}
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{MESSAGES_PATH}"
+
+    def count(self, **increments):
+        with self.lock:
+            for name, value in increments.items():
+                self.stats[name] += value
+
+    def draw(self) -> tuple:
+        """Latenz und ob die Anfrage abgelehnt wird (ein Zufallsgenerator fuer alle Threads)."""
+        with self.lock:
+            delay = max(0.0, self.latency + self.random.uniform(-self.jitter, self.jitter))
+            return delay, self.random.random() < self.error_rate
+
+
+class MessagesHandler(BaseHTTPRequestHandler):
+    server: MockServer
+
+    def send_json(self, status: int, payload: dict):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_error_json(self, status: int, error_type: str, message: str):
+        self.send_json(status, {"type": "error", "error": {"type": error_type, "message": message}})
+
+    def do_GET(self):
+        if self.path != STATS_PATH:
+            self.send_error_json(404, "not_found_error", f"Unbekannter Pfad: {self.path}")
+            return
+        with self.server.lock:
+            stats = dict(self.server.stats)
+        self.send_json(200, stats)
+
+    def do_POST(self):
+        if self.path != MESSAGES_PATH:
+            self.send_error_json(404, "not_found_error", f"Unbekannter Pfad: {self.path}")
+            return
+        self.server.count(requests=1)
+
+        try:
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            prompt = self.validate(body)
+        except (ValueError, TypeError, KeyError, AttributeError) as e:
+            self.server.count(errors=1)
+            self.send_error_json(400, "invalid_request_error", str(e) or "Ungueltiger Request")
+            return
+
+        delay, rejected = self.server.draw()
+        time.sleep(delay)
+        if rejected:
+            self.server.count(rejected=1)
+            self.send_error_json(429, "rate_limit_error", "Mock: Rate Limit erreicht")
+            return
+
+        text = self.answer(prompt)
+        usage = {"input_tokens": estimate_tokens(prompt),
+                 "output_tokens": min(estimate_tokens(text), body["max_tokens"])}
+        self.server.count(inputTokens=usage["input_tokens"], outputTokens=usage["output_tokens"])
+        self.send_json(200, {
+            "id": f"msg_mock_{self.server.stats['requests']:08d}",
+            "type": "message",
+            "role": "assistant",
+            "model": body["model"],
+            "content": [{"type": "text", "text": text}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": usage
+        })
+
+    @staticmethod
+    def validate(body: dict) -> str:
+        """Prueft die Pflichtfelder; Returns: Text aller user-Nachrichten."""
+        if not isinstance(body, dict):
+            raise ValueError("Request-Body muss ein JSON-Objekt sein")
+        if not isinstance(body.get("model"), str):
+            raise ValueError("model: Pflichtfeld")
+        if not isinstance(body.get("max_tokens"), int) or body["max_tokens"] < 1:
+            raise ValueError("max_tokens: positive Ganzzahl erwartet")
+        messages = body.get("messages")
+        if not isinstance(messages, list) or not messages:
+            raise ValueError("messages: nicht-leere Liste erwartet")
+        if not all(isinstance(m, dict) for m in messages):
+            raise ValueError("messages: Objekte mit role und content erwartet")
+        if any(m.get("role") not in ("user", "assistant") for m in messages):
+            raise ValueError("messages: role muss user oder assistant sein")
+        return "\n".join(m["content"] if isinstance(m["content"], str)
+                         else "".join(part.get("text", "") for part in m["content"])
+                         for m in messages if m["role"] == "user")
+
+    @staticmethod
+    def answer(prompt: str) -> str:
+        """Deterministische Antwort aus den ersten Prompt-Zeilen."""
+        lines = [line.strip() for line in prompt.splitlines() if line.strip()]
+        return (f"Mock-Bericht ({len(lines)} Zeilen Kontext).\n"
+                + "\n".join(lines[:3]))
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def start_server(host: str = DEFAULT_HOST, port: int = 0, **options) -> MockServer:
+    """Startet den Server in einem Hintergrund-Thread (port=0: freier Port)."""
+    server = MockServer((host, port), **options)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# ============================================================
+# HAUPTFUNKTION
+# ============================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Lokaler Mock der Messages-API")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="Adresse")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Port")
+    parser.add_argument("--latency", type=float, default=DEFAULT_LATENCY, help="Antwortzeit in Sekunden")
+    parser.add_argument("--jitter", type=float, default=DEFAULT_JITTER, help="Streuung der Antwortzeit")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Anteil abgelehnter Anfragen (429)")
+    parser.add_argument("--seed", type=int, help="Zufalls-Seed fuer reproduzierbare Laeufe")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Anfragen protokollieren")
+    args = parser.parse_args()
+
+    server = MockServer((args.host, args.port), args.latency, args.jitter,
+                        args.error_rate, args.seed, args.verbose)
+    print(f"[Mock] {server.url} (Latenz {args.latency}s +/- {args.jitter}s, "
+          f"Fehlerrate {args.error_rate:.0%})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"[Mock] {json.dumps(server.stats)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Token-Budget fuer Berichts-Prompts (H2) - Schaetzen und Verdichten.
+
+ReportPanel.js schreibt alle gefilterten Datenpunkte einzeln in den
+Prompt; mit 22 Unis und mehreren Jahren wird er dadurch deutlich
+groesser als noetig. Dieses Modul schaetzt die Tokens eines Prompts und
+verdichtet den Kontext aus reports.py stufenweise, bis er in ein Budget
+passt (Stufen wie reports.STRATEGIES):
+
+1. delta:   Reihen als Startwert und Veraenderungen zum Vorjahr
+2. round:   Werte auf signifikante Stellen gerundet
+3. dedupe:  gleiche Reihen zusammengefasst, konstante Reihen verkuerzt
+4. group:   Reihen je Uni-Typ gemittelt (VetMed bleibt einzeln)
+5. trim:    optionale Angaben weggelassen (groesste Veraenderungen,
+            Summe und Extremwerte je Jahr)
+
+Passt auch die letzte Stufe nicht, wird sie trotzdem verwendet und als
+ueber dem Budget markiert. Als Vergleich dient der Prompt, den
+ReportPanel.js fuer dieselbe Auswahl bauen wuerde (baseline_prompt);
+ist er kuerzer als die gewaehlte Stufe, wird er selbst verwendet
+(Stufe "panel"), verdichtet wird also nie ueber das Panel hinaus.
+
+Die Schaetzung kommt ohne Tokenizer aus: Ziffern zaehlen in Gruppen zu
+drei, Woerter in Stuecken zu vier Zeichen, Satzzeichen und Zeilen-
+umbrueche einzeln. Fuer den Vergleich von Varianten desselben Prompts
+genuegt das.
+
+Verwendung:
+    python scripts/prompt_budget.py 2-A-5 --budget 400
+    python scripts/prompt_budget.py 2-A-5 --types med --years 2022-2024 --budget 250
+    python scripts/prompt_budget.py 2-A-5 --template anomaly --budget 400 --show-prompt
+"""
+
+import re
+import sys
+import argparse
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Tuple
+
+import convert
+from query import KennzahlIndex, aggregate_by_year, make_filter_state, parse_codes, parse_year_range
+from reports import (DEFAULT_OUTPUT_DIR, STRATEGIES, TEMPLATES, MessagesClient, ReportService,
+                     ResponseCache, build_context, format_number, render_prompt)
+
+
+# ============================================================
+# KONFIGURATION
+# ============================================================
+
+DEFAULT_BUDGET = 500
+
+# Zeichen pro Token bei Woertern bzw. Ziffernfolgen
+CHARS_PER_WORD_TOKEN = 4
+DIGITS_PER_TOKEN = 3
+
+TOKEN_PATTERN = re.compile(r"\d+|[^\W\d_]+|\S|\n")
+
+# Stufen: keine Verdichtung, dann jeweils eine Strategie mehr
+LEVELS: List[Tuple[str, ...]] = [tuple(STRATEGIES[:n]) for n in range(len(STRATEGIES) + 1)]
+
+# Stufe, wenn der Prompt wie in ReportPanel.js kuerzer ist als jede Verdichtung
+PANEL_LEVEL: Tuple[str, ...] = ("panel",)
+
+# Prompts wie REPORT_TEMPLATES in ReportPanel.js (Vergleichsbasis)
+BASELINE_PROMPTS = {
+    "summary": """
+Erstelle eine prägnante Zusammenfassung der folgenden Wissensbilanz-Daten.
+
+**Kennzahl:** {kennzahl_name} ({kennzahl_code})
+**Zeitraum:** {year_start}–{year_end}
+**Universitäten:** {uni_codes}
+
+**Datenpunkte:**
+{data_points}
+
+Fasse die wichtigsten Erkenntnisse in 2-3 Sätzen zusammen. Nenne konkrete Zahlen.
+""",
+    "comparison": """
+Vergleiche die folgenden Universitäten anhand der Kennzahl "{kennzahl_name}".
+
+**Zeitraum:** {year_start}–{year_end}
+**Universitäten:** {uni_names}
+
+**Daten pro Universität:**
+{data_by_uni}
+
+Erstelle einen strukturierten Vergleich:
+1. Welche Universität hat die höchsten/niedrigsten Werte?
+2. Wie unterscheiden sich die Entwicklungen?
+3. Gibt es auffällige Unterschiede zwischen Medizinischen und anderen Unis?
+
+Formatiere als Fließtext mit konkreten Zahlen.
+""",
+    "trend": """
+Analysiere den zeitlichen Verlauf der Kennzahl "{kennzahl_name}".
+
+**Zeitraum:** {year_start}–{year_end}
+**Datenpunkte gesamt:** {total_points}
+**Durchschnitt:** {average}
+**Trend (letztes Jahr vs. Vorjahr):** {trend}%
+
+**Jährliche Entwicklung:**
+{yearly_data}
+
+Beschreibe:
+1. Den allgemeinen Trend (steigend/fallend/stabil)
+2. Besondere Jahre oder Ausreißer
+3. Mögliche Interpretationen der Entwicklung
+
+Antworte sachlich und mit konkreten Zahlenangaben.
+""",
+    "anomaly": """
+Identifiziere auffällige Werte in den folgenden Wissensbilanz-Daten.
+
+**Kennzahl:** {kennzahl_name}
+**Durchschnitt:** {average}
+**Standardabweichung:** {std_dev}
+
+**Alle Datenpunkte:**
+{data_points}
+
+**Automatisch markierte Punkte (Plausibilitätsprüfung):**
+{flagged}
+
+Finde und erkläre:
+1. Werte, die mehr als 1,5 Standardabweichungen vom Durchschnitt entfernt sind
+2. Unerwartete Sprünge zwischen Jahren
+3. Universitäten mit untypischen Mustern
+
+Falls keine Auffälligkeiten vorliegen, sage das explizit.
+"""
+}
+
+
+# ============================================================
+# SCHAETZUNG
+# ============================================================
+
+def estimate_tokens(text: str) -> int:
+    """Geschaetzte Anzahl Tokens (siehe Modul-Docstring)."""
+    tokens = 0
+    for piece in TOKEN_PATTERN.findall(text):
+        if piece.isdigit():
+            tokens += -(-len(piece) // DIGITS_PER_TOKEN)
+        elif piece.isalpha():
+            tokens += -(-len(piece) // CHARS_PER_WORD_TOKEN)
+        else:
+            tokens += 1
+    return tokens
+
+
+# ============================================================
+# VERDICHTUNG
+# ============================================================
+
+class Fit(NamedTuple):
+    prompt: str
+    tokens: int
+    strategies: Tuple[str, ...]
+    within_budget: bool
+
+
+def fit_prompt(index: KennzahlIndex, template: str, filter_state: dict, budget: int,
+               anomalies: Optional[dict] = None, name: Optional[str] = None) -> Fit:
+    """
+    Erste Stufe aus LEVELS, deren Prompt hoechstens budget Tokens hat (sonst
+    die letzte); der Prompt wie in ReportPanel.js, falls er kuerzer ist.
+    """
+    for strategies in LEVELS:
+        prompt = render_prompt(template, build_context(index, template, filter_state,
+                                                       anomalies, name, strategies))
+        tokens = estimate_tokens(prompt)
+        if tokens <= budget:
+            break
+    panel = baseline_prompt(index, template, filter_state, anomalies, name)
+    panel_tokens = estimate_tokens(panel)
+    if panel_tokens < tokens:
+        return Fit(panel, panel_tokens, PANEL_LEVEL, panel_tokens <= budget)
+    return Fit(prompt, tokens, strategies, tokens <= budget)
+
+
+def baseline_prompt(index: KennzahlIndex, template: str, filter_state: dict,
+                    anomalies: Optional[dict] = None, name: Optional[str] = None) -> str:
+    """Prompt, wie ReportPanel.js ihn fuer dieselbe Auswahl baut (alle Datenpunkte)."""
+    rows = index.select(filter_state)
+    context = build_context(index, template, filter_state, anomalies, name)
+
+    by_uni = {}
+    for code, year, value in rows:
+        by_uni.setdefault(code, []).append(f"{year}: {format_number(value)}")
+    context.update({
+        "data_points": "\n".join(f"{code} ({year}): {format_number(value)}" for code, year, value in rows),
+        "data_by_uni": "\n".join(f"**{convert.VALID_UNI_CODES.get(code, code)}:** {', '.join(values)}"
+                                 for code, values in by_uni.items()),
+        "yearly_data": "\n".join(f"{year}: {format_number(value)}"
+                                 for _, year, value in aggregate_by_year(rows, "average"))
+    })
+    return BASELINE_PROMPTS[template].format(**context)
+
+
+class BudgetedReportService(ReportService):
+    """ReportService, dessen Prompts in ein Token-Budget verdichtet werden."""
+
+    def __init__(self, output_dir: Path, client: MessagesClient,
+                 cache: Optional[ResponseCache] = None, budget: int = DEFAULT_BUDGET):
+        super().__init__(output_dir, client, cache)
+        self.budget = budget
+
+    def fit(self, kennzahl_code: str, template: str, filter_state: dict) -> Fit:
+        return fit_prompt(self.index(kennzahl_code), template, filter_state, self.budget,
+                          self.anomalies(), self.names.get(kennzahl_code))
+
+    def prompt(self, kennzahl_code: str, template: str, filter_state: dict) -> str:
+        return self.fit(kennzahl_code, template, filter_state).prompt
+
+    def cache_key(self, kennzahl_code: str, template: str, filter_state: dict) -> str:
+        return ResponseCache.key(template, kennzahl_code, filter_state, self.version,
+                                 self.client.model, f"budget:{self.budget}")
+
+
+def token_savings(service: BudgetedReportService, kennzahl_code: str, filter_state: dict,
+                  templates: Optional[List[str]] = None) -> List[dict]:
+    """
+    Je Template: Tokens wie in ReportPanel.js (baseline), ohne Verdichtung
+    (compact) und im Budget (fitted), dazu Stufe und Ersparnis.
+    """
+    index = service.index(kennzahl_code)
+    anomalies, name = service.anomalies(), service.names.get(kennzahl_code)
+    savings = []
+    for template in templates or list(TEMPLATES):
+        baseline = estimate_tokens(baseline_prompt(index, template, filter_state, anomalies, name))
+        compact = estimate_tokens(render_prompt(template, build_context(index, template, filter_state,
+                                                                       anomalies, name)))
+        fit = service.fit(kennzahl_code, template, filter_state)
+        savings.append({
+            "template": template,
+            "baseline": baseline,
+            "compact": compact,
+            "fitted": fit.tokens,
+            "strategies": list(fit.strategies),
+            "withinBudget": fit.within_budget,
+            "saved": baseline - fit.tokens,
+            "savedPct": round((baseline - fit.tokens) / baseline * 100, 1) if baseline else 0.0
+        })
+    return savings
+
+
+# ============================================================
+# HAUPTFUNKTION
+# ============================================================
+
+def print_savings(savings: List[dict], budget: int):
+    print(f"{'Template':<11} {'Panel':>7} {'Kompakt':>8} {'Budget':>7} {'Gespart':>8} {'%':>6}  Stufe")
+    for s in savings:
+        marker = "" if s["withinBudget"] else f"  (ueber {budget})"
+        print(f"{s['template']:<11} {s['baseline']:>7} {s['compact']:>8} {s['fitted']:>7} "
+              f"{s['saved']:>8} {s['savedPct']:>6}  {'+'.join(s['strategies']) or '-'}{marker}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Token-Schaetzung und Verdichtung der Berichts-Prompts",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Beispiele:
+    python prompt_budget.py 2-A-5 --budget 400
+    python prompt_budget.py 2-A-5 --types med --budget 250
+    python prompt_budget.py 2-A-5 --template anomaly --budget 400 --show-prompt
+        """
+    )
+    parser.add_argument("kennzahl", help="Kennzahl-Code (z.B. 2-A-5)")
+    parser.add_argument("--budget", type=int, default=DEFAULT_BUDGET, help="Token-Budget je Prompt")
+    parser.add_argument("--template", choices=list(TEMPLATES), help="Nur dieses Template")
+    parser.add_argument("--unis", help="Uni-Codes, kommagetrennt (z.B. UI,UN)")
+    parser.add_argument("--types", help=f"Uni-Typen, kommagetrennt ({', '.join(convert.UNI_TYPES)})")
+    parser.add_argument("--years", type=parse_year_range, help="Jahresbereich (z.B. 2022-2024)")
+    parser.add_argument("--show-prompt", action="store_true", help="Verdichtete Prompts ausgeben")
+    parser.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR,
+                        help="Output-Verzeichnis von convert.py")
+    args = parser.parse_args()
+
+    filter_state = make_filter_state(parse_codes(args.unis), parse_codes(args.types), args.years)
+    service = BudgetedReportService(args.output_dir, MessagesClient(), budget=args.budget)
+    templates = [args.template] if args.template else None
+    try:
+        savings = token_savings(service, args.kennzahl, filter_state, templates)
+    except FileNotFoundError as e:
+        print(f"[Budget] Fehler: Kennzahl nicht konvertiert ({Path(e.filename).name})", file=sys.stderr)
+        sys.exit(1)
+
+    if args.show_prompt:
+        for s in savings:
+            print(f"--- {s['template']} ({s['fitted']} Tokens) ---")
+            print(service.prompt(args.kennzahl, s["template"], filter_state).strip())
+            print()
+    print_savings(savings, args.budget)
+
+
+if __name__ == "__main__":
+    main()
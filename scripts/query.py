@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Abfragen ueber die konvertierten Kennzahlen (H1) von der Kommandozeile.
+
+Beantwortet Filter-, Aggregat- und Verhaeltnis-Fragen direkt aus dem
+Output von convert.py, ohne Excel-Dateien erneut zu lesen. Die Filter
+entsprechen dem Dashboard (dataLoader.js):
+
+- universities / uniTypes / yearRange wie createFilterFn (loadFiltered):
+  leere Listen filtern nicht, alle gesetzten Filter gelten zusammen
+- --ratio wie calculateRatio: Zaehler / Nenner je (Uni, Jahr), Nenner
+  0 oder null und Zaehler null entfallen
+- --aggregate wie aggregateByYear bzw. der Cube (null-Werte ignoriert)
+
+Die Filter werden auf den Index einer Kennzahl (Spalten-Format,
+columnar/) angewendet: aus den Achsen werden erst die passenden Uni- und
+Jahres-Positionen bestimmt, gelesen werden nur deren Zellen. Mit --store
+wird der Index statt aus columnar/ aus dem SQLite-Speicher gelesen
+(convert.py --store), ohne JSON-Parsing.
+
+Verwendung:
+    python scripts/query.py 2-A-5 --unis UI --years 2019-2024
+    python scripts/query.py 2-A-5 --types med --years 2019-2024 --aggregate average --compare UI
+    python scripts/query.py 1-A-1 --ratio 1-A-1-VZA --types med --format csv
+    python scripts/query.py 2-A-5 --aggregate sum --by type --format json
+    python scripts/query.py 1-A-1 --ratio 1-A-1-VZA --types med --store
+"""
+
+import sys
+import csv
+import json
+import argparse
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import convert
+from json_writer import compact_number
+from store import fetch_points, open_store
+
+
+# ============================================================
+# KONFIGURATION
+# ============================================================
+
+# Aggregationen wie im Cube bzw. aggregateByYear (average = mean)
+AGGREGATIONS = ["sum", "average", "count", "min", "max"]
+
+OUTPUT_FORMATS = ["table", "csv", "json"]
+
+# Nachkommastellen in der Tabellen-Ausgabe (CSV/JSON ungerundet)
+TABLE_DECIMALS = 4
+
+
+# ============================================================
+# INDEX
+# ============================================================
+
+class KennzahlIndex:
+    """
+    Spalten-Format einer Kennzahl mit Positions-Index der Achsen.
+
+    Zelle (Uni u, Jahr y) liegt an Position u * len(years) + y; ein Filter
+    waehlt zuerst Positionen auf den Achsen aus und liest dann nur die
+    Zellen im Kreuzprodukt.
+    """
+
+    def __init__(self, payload: dict):
+        self.kennzahl = payload["kennzahl"]
+        self.unis = {code: u for u, code in enumerate(payload["unis"])}
+        self.years = {year: y for y, year in enumerate(payload["years"])}
+        self.values = payload["values"]
+        self.mask = payload["mask"]
+
+    @classmethod
+    def load(cls, output_dir: Path, kennzahl_code: str) -> "KennzahlIndex":
+        path = output_dir / convert.COLUMNAR_DIRNAME / f"{kennzahl_code}.json"
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    @classmethod
+    def from_store(cls, conn, kennzahl_code: str) -> "KennzahlIndex":
+        """Index aus dem SQLite-Speicher (KeyError, wenn die Kennzahl fehlt)."""
+        rows = [(uni_code, year, value) for _, uni_code, year, value in fetch_points(conn, kennzahl_code)]
+        if not rows:
+            raise KeyError(kennzahl_code)
+        return cls(convert.to_columnar(rows, kennzahl_code))
+
+    def uni_positions(self, universities: List[str], uni_types: List[str]) -> List[Tuple[str, int]]:
+        """(uniCode, Position) der Unis, die beide Filter erfuellen, nach Code sortiert."""
+        if universities:
+            candidates = [(code, self.unis[code]) for code in sorted(set(universities))
+                          if code in self.unis]
+        else:
+            candidates = sorted(self.unis.items())
+        if uni_types:
+            candidates = [(code, u) for code, u in candidates
+                          if convert.UNI_TYPE_BY_CODE.get(code) in uni_types]
+        return candidates
+
+    def year_positions(self, year_range: Optional[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """(year, Position) im Jahresbereich (inklusive), aufsteigend."""
+        return sorted((year, y) for year, y in self.years.items()
+                      if year_range is None or year_range[0] <= year <= year_range[1])
+
+    def select(self, filter_state: dict) -> List[convert.PointRow]:
+        """Datenpunkte (uniCode, year, value) fuer einen Filter-State."""
+        n_years = len(self.years)
+        years = self.year_positions(filter_state["yearRange"])
+        rows = []
+        for code, u in self.uni_positions(filter_state["universities"], filter_state["uniTypes"]):
+            for year, y in years:
+                idx = u * n_years + y
+                flag = self.mask[idx]
+                if flag != ".":
+                    rows.append((code, year, self.values[idx] if flag == "1" else None))
+        return rows
+
+
+# ============================================================
+# ABFRAGEN
+# ============================================================
+
+def make_filter_state(universities: Iterable[str] = (), uni_types: Iterable[str] = (),
+                      year_range: Optional[Tuple[int, int]] = None) -> dict:
+    """Filter-State wie state.getFilterState() im Dashboard."""
+    return {"universities": list(universities), "uniTypes": list(uni_types), "yearRange": year_range}
+
+
+def calculate_ratio(primary: List[convert.PointRow], secondary: List[convert.PointRow]) -> List[tuple]:
+    """Verhaeltnis je (Uni, Jahr) wie calculateRatio: (uniCode, year, value, primaryValue, secondaryValue)."""
+    denominators = {(code, year): value for code, year, value in secondary}
+    ratio = []
+    for code, year, value in primary:
+        denominator = denominators.get((code, year))
+        if denominator and value is not None:
+            ratio.append((code, year, value / denominator, value, denominator))
+    return ratio
+
+
+def aggregate(values: List[Optional[float]], aggregation: str) -> Optional[float]:
+    """Aggregat ueber die Nicht-null-Werte (sum = 0 und count = 0 bei leerer Liste)."""
+    valid = [v for v in values if v is not None]
+    if aggregation == "sum":
+        return sum(valid)
+    if aggregation == "count":
+        return len(valid)
+    if not valid:
+        return None
+    if aggregation == "average":
+        return sum(valid) / len(valid)
+    return min(valid) if aggregation == "min" else max(valid)
+
+
+def aggregate_by_year(rows: List[tuple], aggregation: str, by_type: bool = False,
+                      label: str = "all") -> List[tuple]:
+    """(Gruppe, year, value) je Jahr, Gruppe label oder der Uni-Typ."""
+    groups: Dict[Tuple[str, int], List[Optional[float]]] = {}
+    for row in rows:
+        group = convert.UNI_TYPE_BY_CODE.get(row[0], "?") if by_type else label
+        groups.setdefault((group, row[1]), []).append(row[2])
+    return [(group, year, aggregate(values, aggregation))
+            for (group, year), values in sorted(groups.items())]
+
+
+def run_query(output_dir: Path, kennzahl_code: str, filter_state: dict,
+              ratio: Optional[str] = None, aggregation: Optional[str] = None,
+              by_type: bool = False, compare: Iterable[str] = (),
+              store: bool = False) -> Tuple[List[str], List[tuple]]:
+    """
+    Fuehrt eine Abfrage aus. Returns: (Spaltennamen, Zeilen)
+
+    store: Kennzahlen aus dem SQLite-Speicher (store/) statt aus columnar/ lesen.
+
+    compare: Unis, deren eigene Werte neben dem Aggregat stehen (nur der
+    Jahresbereich gilt fuer sie, z.B. VetMed neben dem Mittel der Med-Unis);
+    ihre Rohwerte stehen in der eigenen Spalte "value", das Aggregat bleibt
+    dort leer und umgekehrt.
+    """
+    codes = list(filter(None, (kennzahl_code, ratio)))
+    if store:
+        conn = open_store(output_dir / convert.STORE_DIRNAME / convert.STORE_FILENAME)
+        try:
+            indexes = {code: KennzahlIndex.from_store(conn, code) for code in codes}
+        finally:
+            conn.close()
+    else:
+        indexes = {code: KennzahlIndex.load(output_dir, code) for code in codes}
+
+    def select(state: dict) -> List[tuple]:
+        rows = indexes[kennzahl_code].select(state)
+        if ratio:
+            rows = calculate_ratio(rows, indexes[ratio].select(state))
+        return rows
+
+    rows = select(filter_state)
+    if not aggregation:
+        columns = ["uniCode", "year", "value"]
+        if ratio:
+            columns += ["primaryValue", "secondaryValue"]
+        return columns, rows
+
+    # Ohne --by type traegt das Aggregat den Filter als Namen (z.B. "med")
+    label = ",".join(filter_state["uniTypes"] or filter_state["universities"]) or "all"
+    result = aggregate_by_year(rows, aggregation, by_type, label)
+    if not compare:
+        return ["group" if by_type else "series", "year", aggregation], result
+
+    own = select(make_filter_state(compare, (), filter_state["yearRange"]))
+    result = ([(group, year, value, None) for group, year, value in result]
+              + [(code, year, None, value) for code, year, value, *_ in own])
+    return ["group", "year", aggregation, "value"], result
+
+
+# ============================================================
+# AUSGABE
+# ============================================================
+
+def format_cell(value, decimals: Optional[int] = None) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        value = compact_number(round(value, decimals) if decimals is not None else value)
+    return str(value)
+
+
+def print_table(columns: List[str], rows: List[tuple]):
+    """Ausgerichtete Text-Tabelle (Zahlen rechtsbuendig)."""
+    cells = [[format_cell(v, TABLE_DECIMALS) for v in row] for row in rows]
+    widths = [max([len(name)] + [len(row[i]) for row in cells]) for i, name in enumerate(columns)]
+    numeric = [all(isinstance(row[i], (int, float)) or row[i] is None for row in rows)
+               for i in range(len(columns))]
+
+    def line(values: List[str]) -> str:
+        return "  ".join(v.rjust(w) if num else v.ljust(w)
+                         for v, w, num in zip(values, widths, numeric)).rstrip()
+
+    print(line(columns))
+    print(line(["-" * w for w in widths]))
+    for row in cells:
+        print(line(row))
+
+
+def write_output(columns: List[str], rows: List[tuple], output_format: str):
+    if output_format == "csv":
+        writer = csv.writer(sys.stdout, lineterminator="\n")
+        writer.writerow(columns)
+        writer.writerows([format_cell(v) for v in row] for row in rows)
+    elif output_format == "json":
+        records = [dict(zip(columns, (compact_number(v) for v in row))) for row in rows]
+        print(json.dumps(records, ensure_ascii=False, indent=2))
+    else:
+        print_table(columns, rows)
+
+
+# ============================================================
+# HAUPTFUNKTION
+# ============================================================
+
+def parse_codes(text: Optional[str]) -> List[str]:
+    """"UI,UN" -> ["UI", "UN"]"""
+    return [code.strip() for code in text.split(",") if code.strip()] if text else []
+
+
+def parse_year_range(text: Optional[str]) -> Optional[Tuple[int, int]]:
+    """"2019-2024" (auch mit Gedankenstrich) oder "2024" -> (von, bis)"""
+    if not text:
+        return None
+    parts = text.replace("–", "-").split("-")
+    start, end = (parts[0], parts[-1]) if len(parts) <= 2 else (None, None)
+    if not (start and end and start.strip().isdigit() and end.strip().isdigit()):
+        raise argparse.ArgumentTypeError(f"Ungueltiger Jahresbereich: {text}")
+    if int(start) > int(end):
+        raise argparse.ArgumentTypeError(f"Ungueltiger Jahresbereich: {text} (von > bis)")
+    return int(start), int(end)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Abfragen ueber konvertierte Wissensbilanz-Kennzahlen",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Beispiele:
+    python query.py 2-A-5 --unis UI,UN --years 2019-2024
+    python query.py 2-A-5 --types med --aggregate average --compare UI
+    python query.py 1-A-1 --ratio 1-A-1-VZA --format csv
+        """
+    )
+    parser.add_argument("kennzahl", help="Kennzahl-Code (z.B. 2-A-5)")
+    parser.add_argument("--unis", help="Uni-Codes, kommagetrennt (z.B. UI,UN)")
+    parser.add_argument("--types", help=f"Uni-Typen, kommagetrennt ({', '.join(convert.UNI_TYPES)})")
+    parser.add_argument("--years", type=parse_year_range, help="Jahresbereich (z.B. 2019-2024)")
+    parser.add_argument("--ratio", metavar="KENNZAHL", help="Verhaeltnis zu dieser Kennzahl (Nenner)")
+    parser.add_argument("--aggregate", choices=AGGREGATIONS, help="Je Jahr aggregieren")
+    parser.add_argument("--by", choices=["all", "type"], default="all",
+                        help="Aggregat ueber alle gefilterten Unis oder je Uni-Typ")
+    parser.add_argument("--compare", help="Uni-Codes, deren Werte neben dem Aggregat stehen")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="table", help="Ausgabeformat")
+    parser.add_argument("--store", action="store_true",
+                        help="Aus dem SQLite-Speicher lesen (convert.py --store)")
+    parser.add_argument("--output-dir", type=Path,
+                        default=Path(__file__).resolve().parent.parent / "docs" / "data" / "json",
+                        help="Output-Verzeichnis von convert.py")
+    args = parser.parse_args()
+
+    if args.compare and not args.aggregate:
+        parser.error("--compare benoetigt --aggregate")
+    unknown = [t for t in parse_codes(args.types) if t not in convert.UNI_TYPES]
+    if unknown:
+        parser.error(f"Unbekannte Uni-Typen: {', '.join(unknown)}")
+
+    store_path = args.output_dir / convert.STORE_DIRNAME / convert.STORE_FILENAME
+    if args.store and not store_path.exists():
+        print(f"[Query] Fehler: Kein Speicher unter {store_path} (convert.py --store)", file=sys.stderr)
+        sys.exit(1)
+
+    filter_state = make_filter_state(parse_codes(args.unis), parse_codes(args.types), args.years)
+    try:
+        columns, rows = run_query(args.output_dir, args.kennzahl, filter_state, args.ratio,
+                                  args.aggregate, args.by == "type", parse_codes(args.compare),
+                                  args.store)
+    except FileNotFoundError as e:
+        print(f"[Query] Fehler: Kennzahl nicht konvertiert ({Path(e.filename).name})", file=sys.stderr)
+        sys.exit(1)
+    except KeyError as e:
+        print(f"[Query] Fehler: Kennzahl nicht im Speicher ({e.args[0]})", file=sys.stderr)
+        sys.exit(1)
+
+    write_output(columns, rows, args.format)
+
+
+if __name__ == "__main__":
+    main()
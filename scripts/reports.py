@@ -0,0 +1,719 @@
+#!/usr/bin/env python3
+"""
+Berichts-Service - LLM-Berichte ueber die konvertierten Kennzahlen (H2).
+
+Gegenstueck zu ReportPanel.js fuer Skripte und Lasttests. Statt alle
+Datenpunkte einzeln in den Prompt zu schreiben, baut der Service je
+Template einen kompakten Kontext aus dem Output von convert.py:
+
+- yearly:    je Jahr Mittelwert, Summe, Minimum/Maximum (mit Uni), Anzahl
+- byUni:     je Uni die Werte aller Jahre und die Veraenderung im Zeitraum
+- movers:    die Unis mit der groessten Veraenderung im Zeitraum
+- flagged:   vorberechnete Auffaelligkeiten (anomalies/report.json)
+
+Jedes Template liest nur die Abschnitte, die sein Prompt braucht.
+Mit strategies wird der Kontext weiter verdichtet (Delta-Kodierung,
+signifikante Stellen, Zusammenfassen gleicher Reihen, Gruppieren nach
+Uni-Typ, Weglassen optionaler Angaben); welche Stufe in ein Token-Budget passt, bestimmt
+prompt_budget.py.
+
+Antworten werden im ResponseCache abgelegt, Schluessel ist
+(Template, Kennzahl, Filter-State, dataVersion, Modell). Der Cache
+verdraengt die am laengsten nicht genutzten Eintraege (LRU) und liegt
+in data/.cache/reports.json, solange sich die Daten nicht aendern
+(neue dataVersion), wird dieselbe Frage nur einmal an die API gestellt.
+
+Fuer Tests ohne API-Key: scripts/mock_messages_api.py
+
+Verwendung:
+    python scripts/reports.py 2-A-5 --template trend --types med --years 2022-2024
+    python scripts/reports.py 2-A-5 --template comparison --unis UI,UN,UO --prompt-only
+    python scripts/reports.py 2-A-5 --endpoint http://127.0.0.1:8765/v1/messages
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import threading
+import urllib.error
+import urllib.request
+from collections import OrderedDict
+from pathlib import Path
+from statistics import pstdev
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import convert
+from json_writer import write_json
+from query import KennzahlIndex, aggregate, make_filter_state, parse_codes, parse_year_range
+
+
+# ============================================================
+# KONFIGURATION
+# ============================================================
+
+# Wie callLLM in ReportPanel.js
+API_URL = "https://api.anthropic.com/v1/messages"
+API_VERSION = "2023-06-01"
+MODEL = "claude-3-haiku-20240307"
+MAX_TOKENS = 1024
+REQUEST_TIMEOUT = 60
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_OUTPUT_DIR = PROJECT_ROOT / "docs" / "data" / "json"
+
+# Antwort-Cache (wie der Layout-Cache unter data/.cache)
+REPORT_CACHE_FILE = PROJECT_ROOT / "data" / ".cache" / "reports.json"
+# Bei Aenderungen an Templates oder Kontext erhoehen (verwirft alte Antworten)
+REPORT_CACHE_VERSION = 4
+REPORT_CACHE_SIZE = 512
+
+# Anzahl Unis im Abschnitt movers
+TOP_MOVERS = 5
+
+# Verdichtung des Kontexts, in der Reihenfolge, in der prompt_budget.py sie zuschaltet
+STRATEGIES = ["delta", "round", "dedupe", "group", "trim"]
+
+# Abschnitte, die bei "trim" samt Ueberschrift aus dem Prompt fallen
+OPTIONAL_SECTIONS = ["movers"]
+
+# Signifikante Stellen bei "round"
+SIGNIFICANT_DIGITS = 3
+
+# Bleiben bei "group" einzeln sichtbar
+FOCUS_UNIS = ["UI"]
+
+# Labels wie ANOMALY_CHECKS in ReportPanel.js
+ANOMALY_CHECKS = {
+    "yoy": "Ungewöhnliche Veränderung zum Vorjahr",
+    "mad": "Ausreißer gegenüber den anderen Universitäten",
+    "consistency": "Widerspruch zu verwandter Kennzahl",
+    "ratio": "Ungewöhnliches Verhältnis zu verwandter Kennzahl"
+}
+
+# Templates wie REPORT_TEMPLATES in ReportPanel.js; sections = benoetigte Abschnitte
+TEMPLATES = {
+    "summary": {
+        "name": "Zusammenfassung",
+        "sections": ["yearly", "movers"],
+        "prompt": """
+Erstelle eine prägnante Zusammenfassung der folgenden Wissensbilanz-Daten.
+
+**Kennzahl:** {kennzahl_name} ({kennzahl_code})
+**Zeitraum:** {year_start}–{year_end}
+**Universitäten:** {uni_codes}
+
+**Jährliche Werte:**
+{yearly}
+
+**Größte Veränderungen:**
+{movers}
+
+Fasse die wichtigsten Erkenntnisse in 2-3 Sätzen zusammen. Nenne konkrete Zahlen.
+"""
+    },
+    "comparison": {
+        "name": "Vergleich",
+        "sections": ["byUni"],
+        "prompt": """
+Vergleiche die folgenden Universitäten anhand der Kennzahl "{kennzahl_name}".
+
+**Zeitraum:** {year_start}–{year_end}
+**Universitäten:** {uni_names}
+
+**Daten pro Universität:**
+{byUni}
+
+Erstelle einen strukturierten Vergleich:
+1. Welche Universität hat die höchsten/niedrigsten Werte?
+2. Wie unterscheiden sich die Entwicklungen?
+3. Gibt es auffällige Unterschiede zwischen Medizinischen und anderen Unis?
+
+Formatiere als Fließtext mit konkreten Zahlen.
+"""
+    },
+    "trend": {
+        "name": "Trendanalyse",
+        "sections": ["yearly", "movers"],
+        "prompt": """
+Analysiere den zeitlichen Verlauf der Kennzahl "{kennzahl_name}".
+
+**Zeitraum:** {year_start}–{year_end}
+**Datenpunkte gesamt:** {total_points}
+**Durchschnitt:** {average}
+**Trend (letztes Jahr vs. Vorjahr):** {trend}%
+
+**Jährliche Entwicklung:**
+{yearly}
+
+**Größte Veränderungen:**
+{movers}
+
+Beschreibe:
+1. Den allgemeinen Trend (steigend/fallend/stabil)
+2. Besondere Jahre oder Ausreißer
+3. Mögliche Interpretationen der Entwicklung
+
+Antworte sachlich und mit konkreten Zahlenangaben.
+"""
+    },
+    "anomaly": {
+        "name": "Auffälligkeiten",
+        "sections": ["byUni", "flagged"],
+        "prompt": """
+Identifiziere auffällige Werte in den folgenden Wissensbilanz-Daten.
+
+**Kennzahl:** {kennzahl_name}
+**Durchschnitt:** {average}
+**Standardabweichung:** {std_dev}
+
+**Daten pro Universität:**
+{byUni}
+
+**Automatisch markierte Punkte (Plausibilitätsprüfung):**
+{flagged}
+
+Finde und erkläre:
+1. Werte, die mehr als 1,5 Standardabweichungen vom Durchschnitt entfernt sind
+2. Unerwartete Sprünge zwischen Jahren
+3. Universitäten mit untypischen Mustern
+
+Falls keine Auffälligkeiten vorliegen, sage das explizit.
+"""
+    }
+}
+
+
+class ReportError(Exception):
+    """Fehler der Messages-API (HTTP-Status und Meldung wie in callLLM)."""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+# ============================================================
+# FORMATIERUNG
+# ============================================================
+
+def significant(value: float, digits: Optional[int]) -> float:
+    """Rundet auf digits signifikante Stellen (None: unveraendert)."""
+    if digits is None or value == 0:
+        return value
+    return float(f"{value:.{digits}g}")
+
+
+def format_number(value: Optional[float], digits: Optional[int] = None) -> str:
+    """
+    Zahl im Format de-AT wie formatValue (1.234,5). Ganze Zahlen und
+    Werte ab 1.000 ohne, kleinere mit hoechstens 2 Nachkommastellen;
+    digits rundet vorher auf signifikante Stellen.
+    """
+    if value is None:
+        return "–"
+    value = significant(value, digits)
+    if float(value).is_integer() or abs(value) >= 1000:
+        text = f"{value:,.0f}"
+    else:
+        text = f"{value:,.2f}".rstrip("0").rstrip(".")
+    return text.replace(",", "_").replace(".", ",").replace("_", ".")
+
+
+def format_change(first: float, last: float) -> str:
+    """Relative Veraenderung "+12,3 %" (bei Startwert 0 absolut)."""
+    if first == 0:
+        return f"{'+' if last >= 0 else ''}{format_number(last - first)}"
+    pct = (last - first) / abs(first) * 100
+    return f"{'+' if pct >= 0 else ''}{format_number(round(pct, 1))} %"
+
+
+def uni_label(code: str) -> str:
+    return f"{code} {convert.VALID_UNI_CODES.get(code, '')}".strip()
+
+
+# ============================================================
+# KONTEXT
+# ============================================================
+
+def series_by_uni(rows: List[convert.PointRow]) -> Dict[str, List[Tuple[int, float]]]:
+    """{uniCode: [(year, value), ...]} aufsteigend nach Jahr, ohne null-Werte."""
+    series: Dict[str, List[Tuple[int, float]]] = {}
+    for code, year, value in sorted(rows):
+        if value is not None:
+            series.setdefault(code, []).append((year, value))
+    return series
+
+
+def yearly_section(rows: List[convert.PointRow], strategies: Iterable[str] = ()) -> str:
+    """Je Jahr Mittel, Summe, Extremwerte; bei dedupe ohne Summe (= Mittel x n), bei trim nur Mittel."""
+    digits = SIGNIFICANT_DIGITS if "round" in strategies else None
+    by_year: Dict[int, List[Tuple[float, str]]] = {}
+    for code, year, value in rows:
+        if value is not None:
+            by_year.setdefault(year, []).append((value, code))
+    lines = []
+    for year, entries in sorted(by_year.items()):
+        values = [v for v, _ in entries]
+        if "trim" in strategies:
+            lines.append(f"{year}: Ø {format_number(aggregate(values, 'average'), digits)}, n={len(values)}")
+            continue
+        low, high = min(entries), max(entries)
+        total = "" if "dedupe" in strategies else f"Summe {format_number(sum(values), digits)}, "
+        lines.append(f"{year}: Ø {format_number(aggregate(values, 'average'), digits)}, {total}"
+                     f"min {format_number(low[0], digits)} ({low[1]}), "
+                     f"max {format_number(high[0], digits)} ({high[1]}), n={len(values)}")
+    return "\n".join(lines)
+
+
+def encode_series(points: List[Tuple[int, float]], strategies: Iterable[str] = ()) -> str:
+    """
+    Werte einer Reihe als "2022 2.418, 2023 2.430, 2024 2.460 (+1,7 %)".
+
+    delta:  ab dem zweiten Jahr die Veraenderung zum Vorjahr, das Jahr
+            nur nach Luecken ("2022 2.418, +12, +30 (+1,7 %)")
+    round:  Werte vorher auf SIGNIFICANT_DIGITS Stellen gerundet (Deltas
+            aus den gerundeten Werten, die Reihe bleibt rekonstruierbar)
+    dedupe: konstante Reihen als "2022–2024 konstant 5"
+    """
+    digits = SIGNIFICANT_DIGITS if "round" in strategies else None
+    points = [(year, significant(value, digits)) for year, value in points]
+    (first_year, first), (last_year, last) = points[0], points[-1]
+    if "dedupe" in strategies and len(points) > 2 and all(v == first for _, v in points):
+        return f"{first_year}–{last_year} konstant {format_number(first)}"
+
+    parts = [f"{first_year} {format_number(first)}"]
+    for (prev_year, prev), (year, value) in zip(points, points[1:]):
+        if "delta" in strategies:
+            delta = value - prev
+            text = f"{'+' if delta >= 0 else ''}{format_number(delta)}"
+            parts.append(text if year == prev_year + 1 else f"{year} {text}")
+        else:
+            parts.append(f"{year} {format_number(value)}")
+    change = f" ({format_change(first, last)})" if len(points) > 1 else ""
+    return ", ".join(parts) + change
+
+
+def group_by_type(series: Dict[str, List[Tuple[int, float]]],
+                  focus: Iterable[str] = FOCUS_UNIS) -> Dict[str, List[Tuple[int, float]]]:
+    """
+    Ersetzt die Reihen je Uni-Typ (ab 2 Unis) durch deren Mittel je Jahr;
+    Unis aus focus und allein stehende Typen bleiben einzeln.
+    """
+    focus = set(focus)
+    members: Dict[str, List[str]] = {}
+    for code in series:
+        if code not in focus:
+            members.setdefault(convert.UNI_TYPE_BY_CODE.get(code, "?"), []).append(code)
+
+    grouped = {code: points for code, points in series.items()
+               if code in focus or len(members[convert.UNI_TYPE_BY_CODE.get(code, "?")]) < 2}
+    for uni_type, codes in members.items():
+        if len(codes) < 2:
+            continue
+        by_year: Dict[int, List[float]] = {}
+        for code in codes:
+            for year, value in series[code]:
+                by_year.setdefault(year, []).append(value)
+        grouped[f"{uni_type} (Ø {len(codes)} Unis)"] = [(year, sum(values) / len(values))
+                                                        for year, values in sorted(by_year.items())]
+    return grouped
+
+
+def by_uni_section(series: Dict[str, List[Tuple[int, float]]], strategies: Iterable[str] = ()) -> str:
+    """Eine Zeile je Uni (bzw. Uni-Typ); bei dedupe teilen sich gleiche Reihen eine Zeile."""
+    if "group" in strategies:
+        series = group_by_type(series)
+    lines = [(label, encode_series(points, strategies)) for label, points in series.items()]
+    if "dedupe" in strategies:
+        merged: Dict[str, List[str]] = OrderedDict()
+        for label, encoded in lines:
+            merged.setdefault(encoded, []).append(label)
+        lines = [(", ".join(labels), encoded) for encoded, labels in merged.items()]
+    return "\n".join(f"{label}: {encoded}" for label, encoded in lines)
+
+
+def movers_section(series: Dict[str, List[Tuple[int, float]]], limit: int = TOP_MOVERS,
+                   strategies: Iterable[str] = ()) -> str:
+    """Unis mit der groessten relativen Veraenderung zwischen erstem und letztem Jahr."""
+    digits = SIGNIFICANT_DIGITS if "round" in strategies else None
+    changes = []
+    for code, points in series.items():
+        (first_year, first), (last_year, last) = points[0], points[-1]
+        if len(points) > 1 and first != 0:
+            changes.append((abs(last - first) / abs(first), code, first_year, first, last_year, last))
+    changes.sort(key=lambda c: (-c[0], c[1]))
+    return "\n".join(f"{code}: {format_change(first, last)} ({first_year} {format_number(first, digits)} → "
+                     f"{last_year} {format_number(last, digits)})"
+                     for _, code, first_year, first, last_year, last in changes[:limit]) or "Keine"
+
+
+def flagged_section(report: Optional[dict], kennzahl_code: str, unis: List[str],
+                    year_range: Optional[Tuple[int, int]], strategies: Iterable[str] = ()) -> str:
+    """
+    Markierte Punkte wie flaggedPoints in ReportPanel.js, doppelte Zeilen
+    entfernt. Bei dedupe eine Zeile je Uni und Pruefung (Label nur einmal).
+    """
+    if not report:
+        return "Keine"
+    digits = SIGNIFICANT_DIGITS if "round" in strategies else None
+    fields = report["fields"]
+    selected = set(unis)
+    lines: Dict[str, None] = OrderedDict()
+    merged: Dict[Tuple[str, str], List[str]] = OrderedDict()
+    for entry in report["flags"].get(kennzahl_code, []):
+        flag = dict(zip(fields, entry))
+        if flag["uniCode"] not in selected:
+            continue
+        if year_range and not year_range[0] <= flag["year"] <= year_range[1]:
+            continue
+        check = ANOMALY_CHECKS.get(flag["check"].split(":")[0], flag["check"])
+        # Konsistenz-Pruefungen haben keinen Score (null), wie in ReportPanel.js
+        score = f"Score {format_number(flag['score'])} " if flag["score"] is not None else ""
+        detail = (f"{score}(Wert {format_number(flag['value'], digits)}, "
+                  f"Referenz {format_number(flag['reference'], digits)})")
+        if "dedupe" in strategies:
+            merged.setdefault((flag["uniCode"], check), []).append(f"{flag['year']} {detail}")
+        else:
+            lines[f"{flag['uniCode']} ({flag['year']}): {check}{', ' if score else ' '}{detail}"] = None
+    for (code, check), details in merged.items():
+        lines[f"{code}: {check}: {'; '.join(dict.fromkeys(details))}"] = None
+    return "\n".join(lines) or "Keine"
+
+
+def build_context(index: KennzahlIndex, template: str, filter_state: dict,
+                  anomalies: Optional[dict] = None, name: Optional[str] = None,
+                  strategies: Iterable[str] = ()) -> dict:
+    """
+    Kontext fuer ein Template: Kopfdaten, Kennwerte und die Abschnitte aus
+    TEMPLATES[template]["sections"] (fertig formatierte Texte).
+    strategies: Teilmenge von STRATEGIES (siehe encode_series, group_by_type;
+    trim laesst OPTIONAL_SECTIONS weg)
+    """
+    digits = SIGNIFICANT_DIGITS if "round" in strategies else None
+    rows = index.select(filter_state)
+    values = [value for _, _, value in rows if value is not None]
+    series = series_by_uni(rows)
+    years = sorted({year for _, year, _ in rows})
+    unis = sorted({code for code, _, _ in rows})
+
+    # Trend wie stats.trend im Dashboard: Mittel letztes Jahr vs. Vorjahr
+    trend = "–"
+    if len(years) > 1:
+        last, previous = ([v for _, y, v in rows if y == year and v is not None] for year in years[:-3:-1])
+        if last and previous and aggregate(previous, "average"):
+            change = (aggregate(last, "average") / aggregate(previous, "average") - 1) * 100
+            trend = format_number(round(change, 1))
+
+    # Bei group nennt auch der Kopf nur die Gruppen statt aller Unis
+    if "group" in strategies:
+        uni_codes = uni_names = ", ".join(group_by_type(series))
+    else:
+        uni_codes, uni_names = ", ".join(unis), ", ".join(uni_label(code) for code in unis)
+
+    context = {
+        "kennzahl_code": index.kennzahl,
+        "kennzahl_name": name or index.kennzahl,
+        "year_start": years[0] if years else "–",
+        "year_end": years[-1] if years else "–",
+        "uni_codes": uni_codes,
+        "uni_names": uni_names,
+        "total_points": len(values),
+        "average": format_number(aggregate(values, "average"), digits),
+        "std_dev": format_number(pstdev(values), digits) if values else "–",
+        "trend": trend
+    }
+
+    builders = {
+        "yearly": lambda: yearly_section(rows, strategies),
+        "byUni": lambda: by_uni_section(series, strategies),
+        "movers": lambda: movers_section(series, strategies=strategies),
+        "flagged": lambda: flagged_section(anomalies, index.kennzahl, unis, filter_state["yearRange"],
+                                           strategies)
+    }
+    for section in TEMPLATES[template]["sections"]:
+        if "trim" in strategies and section in OPTIONAL_SECTIONS:
+            context[section] = None
+            continue
+        context[section] = builders[section]() or "Keine Daten"
+    return context
+
+
+def render_prompt(template: str, context: dict) -> str:
+    """Prompt des Templates; Abschnitte ohne Inhalt (None) fallen samt Ueberschrift weg."""
+    prompt = TEMPLATES[template]["prompt"]
+    dropped = [f"{{{section}}}" for section in TEMPLATES[template]["sections"] if context.get(section) is None]
+    if dropped:
+        prompt = "\n\n".join(block for block in prompt.split("\n\n")
+                              if not any(field in block for field in dropped))
+    return prompt.format(**context)
+
+
+def data_version(output_dir: Path) -> Optional[str]:
+    """dataVersion aus dem Kopf des Bundles bzw. des Auffaelligkeits-Reports."""
+    header = output_dir / "bundle" / "kennzahlen.ndjson"
+    try:
+        with open(header, 'r', encoding='utf-8') as f:
+            return json.loads(f.readline()).get("dataVersion")
+    except (OSError, ValueError):
+        pass
+    try:
+        with open(output_dir / "anomalies" / "report.json", 'r', encoding='utf-8') as f:
+            return json.load(f).get("dataVersion")
+    except (OSError, ValueError):
+        return None
+
+
+# ============================================================
+# ANTWORT-CACHE
+# ============================================================
+
+class ResponseCache:
+    """
+    LRU-Cache fuer Antworten, optional auf der Platte (path).
+
+    Thread-sicher; save() schreibt nur, wenn sich seit dem Laden bzw.
+    letzten Speichern etwas geaendert hat.
+    """
+
+    def __init__(self, path: Optional[Path] = REPORT_CACHE_FILE, capacity: int = REPORT_CACHE_SIZE):
+        self.path = path
+        self.capacity = capacity
+        self.entries: "OrderedDict[str, dict]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._lock = threading.Lock()
+        if path is not None:
+            self._load()
+
+    @staticmethod
+    def key(template: str, kennzahl_code: str, filter_state: dict,
+            version: Optional[str], model: str, variant: Optional[str] = None) -> str:
+        """
+        Schluessel unabhaengig von der Reihenfolge der Unis und Uni-Typen.
+        variant unterscheidet Prompts derselben Anfrage (z.B. Token-Budget).
+        """
+        year_range = filter_state["yearRange"]
+        canonical = [template, kennzahl_code, sorted(filter_state["universities"]),
+                     sorted(filter_state["uniTypes"]), list(year_range) if year_range else None,
+                     version, model, variant]
+        return hashlib.sha256(json.dumps(canonical).encode("utf-8")).hexdigest()[:32]
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(payload, dict) and payload.get("version") == REPORT_CACHE_VERSION:
+            # Aelteste zuerst, die zuletzt genutzten stehen am Ende
+            for key, entry in payload.get("entries", [])[-self.capacity:]:
+                self.entries[key] = entry
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, entry: dict):
+        with self._lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.capacity:
+                self.entries.popitem(last=False)
+            self._dirty = True
+
+    def save(self):
+        if self.path is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = {"format": "reports", "version": REPORT_CACHE_VERSION,
+                       "entries": [[key, entry] for key, entry in self.entries.items()]}
+            self._dirty = False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        write_json(self.path, payload, compact=True)
+
+
+# ============================================================
+# MESSAGES-API
+# ============================================================
+
+class MessagesClient:
+    """Minimaler Client fuer POST /v1/messages (Request wie callLLM)."""
+
+    def __init__(self, endpoint: str = API_URL, api_key: Optional[str] = None,
+                 model: str = MODEL, max_tokens: int = MAX_TOKENS, timeout: float = REQUEST_TIMEOUT):
+        self.endpoint = endpoint
+        self.api_key = api_key
+        self.model = model
+        self.max_tokens = max_tokens
+        self.timeout = timeout
+
+    def create(self, prompt: str) -> dict:
+        """Sendet einen Prompt. Returns: {text, usage}"""
+        body = json.dumps({
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "messages": [{"role": "user", "content": prompt}]
+        }).encode("utf-8")
+        headers = {"Content-Type": "application/json", "anthropic-version": API_VERSION}
+        if self.api_key:
+            headers["x-api-key"] = self.api_key
+        request = urllib.request.Request(self.endpoint, data=body, headers=headers, method="POST")
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                status = response.status
+                try:
+                    result = json.load(response)
+                except ValueError:
+                    raise ReportError("Ungueltige Antwort der API (kein JSON)", status) from None
+        except urllib.error.HTTPError as e:
+            try:
+                message = json.load(e).get("error", {}).get("message")
+            except (ValueError, AttributeError):
+                message = None
+            raise ReportError(message or f"API-Fehler: {e.code}", e.code) from None
+        except (urllib.error.URLError, OSError) as e:
+            raise ReportError(f"Keine Verbindung zu {self.endpoint}: {e}") from None
+        # Mit dem Status der Antwort (200): ein kaputter Body wird nicht wiederholt
+        try:
+            return {"text": result["content"][0]["text"], "usage": result.get("usage", {})}
+        except (KeyError, IndexError, TypeError, AttributeError):
+            raise ReportError("Ungueltige Antwort der API (kein Text)", status) from None
+
+
+# ============================================================
+# SERVICE
+# ============================================================
+
+class ReportService:
+    """
+    Erzeugt Berichte: Kontext bauen, Cache fragen, sonst die API.
+
+    Kennzahl-Indizes und der Auffaelligkeits-Report werden einmal
+    geladen und fuer alle Anfragen wiederverwendet.
+    """
+
+    def __init__(self, output_dir: Path, client: MessagesClient,
+                 cache: Optional[ResponseCache] = None):
+        self.output_dir = output_dir
+        self.client = client
+        self.cache = cache
+        self.version = data_version(output_dir)
+        self.names = {code: name for code, (name, _) in convert.kennzahl_names().items()}
+        self._indexes: Dict[str, KennzahlIndex] = {}
+        self._anomalies: Optional[dict] = None
+        self._anomalies_loaded = False
+        self._lock = threading.Lock()
+
+    def index(self, kennzahl_code: str) -> KennzahlIndex:
+        with self._lock:
+            if kennzahl_code not in self._indexes:
+                self._indexes[kennzahl_code] = KennzahlIndex.load(self.output_dir, kennzahl_code)
+            return self._indexes[kennzahl_code]
+
+    def anomalies(self) -> Optional[dict]:
+        with self._lock:
+            if not self._anomalies_loaded:
+                try:
+                    with open(self.output_dir / "anomalies" / "report.json", 'r', encoding='utf-8') as f:
+                        self._anomalies = json.load(f)
+                except (OSError, ValueError):
+                    self._anomalies = None
+                self._anomalies_loaded = True
+            return self._anomalies
+
+    def prompt(self, kennzahl_code: str, template: str, filter_state: dict) -> str:
+        context = build_context(self.index(kennzahl_code), template, filter_state,
+                                self.anomalies(), self.names.get(kennzahl_code))
+        return render_prompt(template, context)
+
+    def cache_key(self, kennzahl_code: str, template: str, filter_state: dict) -> str:
+        return ResponseCache.key(template, kennzahl_code, filter_state, self.version, self.client.model)
+
+    def generate(self, kennzahl_code: str, template: str, filter_state: dict) -> dict:
+        """Returns: {text, usage, cached, seconds}"""
+        start = time.perf_counter()
+        key = self.cache_key(kennzahl_code, template, filter_state)
+        entry = self.cache.get(key) if self.cache else None
+        if entry is None:
+            entry = self.client.create(self.prompt(kennzahl_code, template, filter_state))
+            if self.cache:
+                self.cache.put(key, entry)
+            cached = False
+        else:
+            cached = True
+        return {**entry, "cached": cached, "seconds": time.perf_counter() - start}
+
+
+# ============================================================
+# HAUPTFUNKTION
+# ============================================================
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="LLM-Berichte ueber konvertierte Wissensbilanz-Kennzahlen",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Beispiele:
+    python reports.py 2-A-5 --template trend --types med
+    python reports.py 2-A-5 --template comparison --unis UI,UN,UO --prompt-only
+    python reports.py 2-A-5 --endpoint http://127.0.0.1:8765/v1/messages
+
+Der API-Key wird aus ANTHROPIC_API_KEY gelesen.
+        """
+    )
+    parser.add_argument("kennzahl", help="Kennzahl-Code (z.B. 2-A-5)")
+    parser.add_argument("--template", choices=list(TEMPLATES), default="summary", help="Berichts-Template")
+    parser.add_argument("--unis", help="Uni-Codes, kommagetrennt (z.B. UI,UN)")
+    parser.add_argument("--types", help=f"Uni-Typen, kommagetrennt ({', '.join(convert.UNI_TYPES)})")
+    parser.add_argument("--years", type=parse_year_range, help="Jahresbereich (z.B. 2022-2024)")
+    parser.add_argument("--prompt-only", action="store_true", help="Nur den Prompt ausgeben")
+    parser.add_argument("--endpoint", default=API_URL, help="Messages-Endpoint (z.B. der Mock-Server)")
+    parser.add_argument("--model", default=MODEL, help="Modell")
+    parser.add_argument("--no-cache", action="store_true", help="Antwort-Cache nicht verwenden")
+    parser.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR,
+                        help="Output-Verzeichnis von convert.py")
+    args = parser.parse_args()
+
+    filter_state = make_filter_state(parse_codes(args.unis), parse_codes(args.types), args.years)
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    if not args.prompt_only and not api_key and args.endpoint == API_URL:
+        parser.error("ANTHROPIC_API_KEY ist nicht gesetzt")
+
+    cache = None if args.no_cache else ResponseCache()
+    service = ReportService(args.output_dir, MessagesClient(args.endpoint, api_key, args.model), cache)
+    try:
+        if args.prompt_only:
+            print(service.prompt(args.kennzahl, args.template, filter_state).strip())
+            return
+        result = service.generate(args.kennzahl, args.template, filter_state)
+    except FileNotFoundError as e:
+        print(f"[Reports] Fehler: Kennzahl nicht konvertiert ({Path(e.filename).name})", file=sys.stderr)
+        sys.exit(1)
+    except ReportError as e:
+        print(f"[Reports] Fehler: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if cache:
+            cache.save()
+
+    print(result["text"])
+    usage = result.get("usage", {})
+    source = "aus dem Cache" if result["cached"] else f"{result['seconds']:.2f}s"
+    print(f"\n[Reports] {TEMPLATES[args.template]['name']}: {source}, "
+          f"Tokens {usage.get('input_tokens', '?')} ein / {usage.get('output_tokens', '?')} aus",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
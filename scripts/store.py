@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Analytischer Speicher - Alle Kennzahlen in einer SQLite-Datei (H1, H2).
+
+Optionales Ausgabe-Ziel von convert.py (--store). Statt fuer jede Frage
+ueber mehrere Kennzahlen alle JSON-Dateien zu laden und in Python/JS zu
+verbinden, liegen die Datenpunkte in einer indizierten Datenbank:
+
+- facts:        (kennzahl, uniCode, year) -> value, geclustert nach
+                Kennzahl (WITHOUT ROWID, Primaerschluessel = Tabelle)
+- universities: Uni-Code, Name, Uni-Typ
+- kennzahlen:   Code, Name, Quelldatei, Anzahl Datenpunkte
+- meta:         Format-Version, Konverter-Version, dataVersion des Bundles
+
+Abdeckende Indizes fuer die typischen Zugriffe:
+- facts_by_uni:  alle Kennzahlen einer Uni (Berichts-Kontext, H2)
+- facts_by_year: eine Kennzahl ueber einen Jahresbereich (Vergleiche, H1)
+
+Die Datei wird neben dem Ziel aufgebaut und erst danach ersetzt, Leser
+sehen nie einen halb geschriebenen Stand.
+"""
+
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from json_writer import atomic_path
+
+
+# ============================================================
+# KONFIGURATION
+# ============================================================
+
+STORE_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+) WITHOUT ROWID;
+
+CREATE TABLE universities (
+    code TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    type TEXT
+) WITHOUT ROWID;
+
+CREATE TABLE kennzahlen (
+    code   TEXT PRIMARY KEY,
+    name   TEXT,
+    source TEXT,
+    points INTEGER NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE facts (
+    kennzahl TEXT NOT NULL REFERENCES kennzahlen (code),
+    uniCode  TEXT NOT NULL REFERENCES universities (code),
+    year     INTEGER NOT NULL,
+    value    REAL,
+    PRIMARY KEY (kennzahl, uniCode, year)
+) WITHOUT ROWID;
+"""
+
+# Nach dem Laden angelegt (schneller als beim Einfuegen gepflegt)
+INDEXES = """
+CREATE INDEX facts_by_uni ON facts (uniCode, year, kennzahl, value);
+CREATE INDEX facts_by_year ON facts (kennzahl, year, uniCode, value);
+CREATE INDEX universities_by_type ON universities (type, code);
+"""
+
+
+# ============================================================
+# AUFBAU
+# ============================================================
+
+def build_store(path: Path, converted: Dict[str, List[dict]],
+                universities: Dict[str, Tuple[str, Optional[str]]],
+                kennzahlen: Dict[str, Tuple[Optional[str], Optional[str]]],
+                meta: Dict[str, Optional[str]]) -> dict:
+    """
+    Schreibt alle Kennzahlen atomar in eine neue SQLite-Datei.
+
+    universities: {code: (name, type)}
+    kennzahlen:   {code: (name, quelldatei)}
+    meta:         zusaetzliche Eintraege (z.B. dataVersion)
+
+    Returns: {facts, kennzahlen, universities}
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with atomic_path(path) as tmp:
+        tmp.unlink(missing_ok=True)
+        conn = sqlite3.connect(tmp)
+        try:
+            # Neue Datei, die erst nach Abschluss sichtbar wird: kein Journal noetig
+            conn.execute("PRAGMA journal_mode = OFF")
+            conn.executescript(SCHEMA)
+            with conn:
+                conn.executemany("INSERT INTO meta VALUES (?, ?)",
+                                 [("format", "store"), ("version", str(STORE_VERSION))]
+                                 + sorted(meta.items()))
+                conn.executemany("INSERT INTO universities VALUES (?, ?, ?)",
+                                 [(code, name, type_id)
+                                  for code, (name, type_id) in sorted(universities.items())])
+                conn.executemany("INSERT INTO kennzahlen VALUES (?, ?, ?, ?)",
+                                 [(code, *kennzahlen.get(code, (None, None)), len(points))
+                                  for code, points in sorted(converted.items())])
+                for code, points in sorted(converted.items()):
+                    conn.executemany("INSERT INTO facts VALUES (?, ?, ?, ?)",
+                                     sorted((code, p["uniCode"], p["year"], p["value"])
+                                            for p in points))
+                conn.executescript(INDEXES)
+            conn.execute("ANALYZE")
+        finally:
+            conn.close()
+
+    return {
+        "facts": sum(len(points) for points in converted.values()),
+        "kennzahlen": len(converted),
+        "universities": len(universities)
+    }
+
+
+# ============================================================
+# ABFRAGEN
+# ============================================================
+
+def open_store(path: Path) -> sqlite3.Connection:
+    """Oeffnet den Speicher nur lesend."""
+    return sqlite3.connect(f"file:{Path(path).resolve()}?mode=ro", uri=True)
+
+
+def _where(kennzahl: Optional[str], uni_codes: Optional[Iterable[str]],
+           uni_types: Optional[Iterable[str]],
+           years: Optional[Tuple[int, int]]) -> Tuple[str, list]:
+    """WHERE-Klausel und Parameter fuer die Filter von fetch_points."""
+    clauses, params = [], []
+    if kennzahl is not None:
+        clauses.append("f.kennzahl = ?")
+        params.append(kennzahl)
+    if uni_codes is not None:
+        uni_codes = list(uni_codes)
+        clauses.append(f"f.uniCode IN ({', '.join('?' * len(uni_codes))})")
+        params += uni_codes
+    if uni_types is not None:
+        uni_types = list(uni_types)
+        clauses.append(f"u.type IN ({', '.join('?' * len(uni_types))})")
+        params += uni_types
+    if years is not None:
+        clauses.append("f.year BETWEEN ? AND ?")
+        params += list(years)
+    return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+
+def fetch_points(conn: sqlite3.Connection, kennzahl: Optional[str] = None,
+                 uni_codes: Optional[Iterable[str]] = None,
+                 uni_types: Optional[Iterable[str]] = None,
+                 years: Optional[Tuple[int, int]] = None) -> List[Tuple[str, str, int, Optional[float]]]:
+    """
+    Datenpunkte als (kennzahl, uniCode, year, value), sortiert nach
+    Kennzahl, Uni und Jahr. Alle Filter optional, years = (von, bis).
+    """
+    where, params = _where(kennzahl, uni_codes, uni_types, years)
+    join = " JOIN universities u ON u.code = f.uniCode" if uni_types is not None else ""
+    sql = (f"SELECT f.kennzahl, f.uniCode, f.year, f.value FROM facts f{join}{where}"
+           " ORDER BY f.kennzahl, f.uniCode, f.year")
+    return conn.execute(sql, params).fetchall()
+
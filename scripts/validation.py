@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Validierung - Spaltenweise Pruefung konvertierter Kennzahl-Dateien.
+
+Die Datenpunkte einer Datei werden in Spalten (uniCode, year, value)
+zerlegt und pro Regel als Ganzes geprueft:
+
+- uniCode:   Code ist ein gueltiger Uni-Code
+- year:      Jahr ist eine ganze Zahl im gueltigen Bereich
+- value:     Wert ist eine Zahl oder null
+- duplicate: (uniCode, year) kommt mehrfach vor (erstes Vorkommen gilt)
+
+Ergebnis sind Verletzungs-Masken pro Regel (True = verletzt) und die
+zugehoerigen Zeilen-Positionen. Mit NumPy laufen die Pruefungen
+vektorisiert, ohne NumPy als Python-Schleife mit identischem Ergebnis:
+jede Spalte wird als typisiertes Array angelegt (Texte, Zahlen) und
+ueber searchsorted gegen die gueltigen Werte geprueft. Nur Spalten mit
+fremden Typen (null-Codes, Text als Jahr oder Wert) fallen auf
+Vergleiche im Objekt-Array bzw. eine Typpruefung je Eintrag zurueck.
+"""
+
+from collections.abc import Hashable
+from itertools import repeat
+from typing import Dict, Iterable, List, Optional
+
+try:
+    import numpy as np  # optional: vektorisierte Pruefung
+except ImportError:
+    np = None
+
+
+# ============================================================
+# KONFIGURATION
+# ============================================================
+
+VALIDATION_RULES = ["uniCode", "year", "value", "duplicate"]
+
+# Erlaubte Wert-Typen (JSON: Zahl oder null); bool zaehlt wie in
+# validate_data_point als int
+VALUE_TYPES = frozenset({int, float, bool, type(None)})
+
+
+# ============================================================
+# SPALTEN
+# ============================================================
+
+def extract_columns(data: List) -> Dict[str, List]:
+    """Zerlegt Datenpunkte in Spalten; Eintraege ohne Objekt werden zu leeren Punkten."""
+    if set(map(type, data)) - {dict}:
+        data = [point if isinstance(point, dict) else {} for point in data]
+    return {field: list(map(dict.get, data, repeat(field))) for field in ("uniCode", "year", "value")}
+
+
+# ============================================================
+# VALIDIERUNG
+# ============================================================
+
+def _typed_column(values: List, kinds: str) -> Optional["np.ndarray"]:
+    """Spalte als typisiertes Array, falls NumPy einen der dtype-kinds ableitet (sonst None)."""
+    try:
+        column = np.array(values)
+    except (ValueError, TypeError):
+        return None
+    return column if column.ndim == 1 and column.dtype.kind in kinds else None
+
+
+def _positions(values: List, keys: "np.ndarray", kinds: str) -> "np.ndarray":
+    """
+    Position jedes Werts in keys (aufsteigend sortiert; -1 = nicht
+    enthalten) als int64-Spalte. Typisierte Spalten per searchsorted,
+    gemischte als Objekt-Array mit einem Vergleich je gueltigem Wert.
+    """
+    n = len(values)
+    column = _typed_column(values, kinds)
+    if column is not None and len(keys):
+        pos = np.minimum(np.searchsorted(keys, column), len(keys) - 1)
+        return np.where(keys[pos] == column, pos, -1).astype(np.int64)
+
+    column = np.fromiter(values, dtype=object, count=n)
+    idx = np.full(n, -1, dtype=np.int64)
+    for i, key in enumerate(keys.tolist()):
+        idx[column == key] = i
+    return idx
+
+
+def _values_ok(values: List) -> "np.ndarray":
+    """Maske: Wert ist eine Zahl oder null (Zahl-Spalten ohne Blick auf einzelne Eintraege)."""
+    n = len(values)
+    if _typed_column(values, "biuf") is not None:
+        return np.ones(n, dtype=bool)
+    column = np.fromiter(values, dtype=object, count=n)
+    null = np.equal(column, None)
+    if _typed_column(column[~null].tolist(), "biuf") is not None:
+        return np.ones(n, dtype=bool)
+    # Fremde Typen in der Spalte: Typ je Eintrag pruefen
+    return np.fromiter((type(v) in VALUE_TYPES for v in values), dtype=bool, count=n)
+
+
+def _validate_numpy(columns: Dict[str, List], valid_codes: Iterable[str],
+                    valid_years: range) -> Dict[str, "np.ndarray"]:
+    """Vektorisierte Regeln ueber NumPy-Spalten."""
+    n = len(columns["uniCode"])
+
+    # uniCode/year: Faktorisierung ueber die sortierten gueltigen Werte. Ein
+    # float wie 2020.0 trifft 2020 (wie "year in range"), Texte nie ein Jahr
+    code_keys = np.array(sorted(valid_codes), dtype=str)
+    year_keys = np.array(sorted(valid_years), dtype=np.int64)
+    code_idx = _positions(columns["uniCode"], code_keys, "U")
+    year_idx = _positions(columns["year"], year_keys, "iuf")
+    code_ok = code_idx >= 0
+    year_ok = year_idx >= 0
+
+    # value: Zahl oder null
+    value_ok = _values_ok(columns["value"])
+
+    # duplicate: Schluessel (Code, Jahr) nur fuer Zeilen mit gueltigem Code und Jahr
+    duplicate = np.zeros(n, dtype=bool)
+    keyed = np.flatnonzero(code_ok & year_ok)
+    if len(keyed):
+        keys = code_idx[keyed] * len(year_keys) + year_idx[keyed]
+        # Schneller Pfad: Zaehlen statt Sortieren, wenn kein Schluessel doppelt ist
+        if np.bincount(keys).max() <= 1:
+            return {"uniCode": ~code_ok, "year": ~year_ok, "value": ~value_ok, "duplicate": duplicate}
+        _, first = np.unique(keys, return_index=True)
+        is_dup = np.ones(len(keyed), dtype=bool)
+        is_dup[first] = False
+        duplicate[keyed[is_dup]] = True
+
+    return {"uniCode": ~code_ok, "year": ~year_ok, "value": ~value_ok, "duplicate": duplicate}
+
+
+def _validate_python(columns: Dict[str, List], valid_codes: Iterable[str],
+                     valid_years: range) -> Dict[str, List[bool]]:
+    """Gleiche Regeln als Python-Schleife (ohne NumPy)."""
+    valid_codes = set(valid_codes)
+    masks = {rule: [] for rule in VALIDATION_RULES}
+    seen = set()
+
+    for code, year, value in zip(columns["uniCode"], columns["year"], columns["value"]):
+        code_ok = isinstance(code, Hashable) and code in valid_codes
+        year_ok = type(year) in (int, float) and year in valid_years
+        masks["uniCode"].append(not code_ok)
+        masks["year"].append(not year_ok)
+        masks["value"].append(type(value) not in VALUE_TYPES)
+
+        duplicate = False
+        if code_ok and year_ok:
+            key = (code, int(year))
+            duplicate = key in seen
+            seen.add(key)
+        masks["duplicate"].append(duplicate)
+
+    return masks
+
+
+def validate_points(data: List, valid_codes: Iterable[str], valid_years: range) -> dict:
+    """
+    Prueft alle Datenpunkte einer Datei regelweise.
+
+    Returns: {
+        rows: Anzahl Zeilen,
+        masks: {regel: Maske (True = verletzt)},
+        positions: {regel: [Zeilen-Positionen]},
+        invalid: [Zeilen mit mindestens einer Verletzung]
+    }
+    """
+    columns = extract_columns(data)
+    n = len(data)
+
+    if np is not None:
+        masks = _validate_numpy(columns, valid_codes, valid_years)
+        positions = {rule: np.flatnonzero(mask).tolist() for rule, mask in masks.items()}
+        any_mask = np.zeros(n, dtype=bool)
+        for mask in masks.values():
+            any_mask |= mask
+        invalid = np.flatnonzero(any_mask).tolist()
+    else:
+        masks = _validate_python(columns, valid_codes, valid_years)
+        positions = {rule: [i for i, bad in enumerate(mask) if bad] for rule, mask in masks.items()}
+        invalid = sorted(set().union(*positions.values()))
+
+    return {"rows": n, "masks": masks, "positions": positions, "invalid": invalid}
+
+
+def summarize_violations(report: dict, max_positions: int = 5) -> str:
+    """Kurzbeschreibung der Verletzungen, z.B. "year: 2 (Index 3, 17)"."""
+    parts = []
+    for rule in VALIDATION_RULES:
+        positions = report["positions"][rule]
+        if positions:
+            shown = ", ".join(str(i) for i in positions[:max_positions])
+            more = ", ..." if len(positions) > max_positions else ""
+            parts.append(f"{rule}: {len(positions)} (Index {shown}{more})")
+    return "; ".join(parts)
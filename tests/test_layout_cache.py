@@ -0,0 +1,49 @@
+"""Regression: Layout-Cache darf geaenderte Jahres-Header nicht uebersehen."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+openpyxl = pytest.importorskip("openpyxl")
+import convert  # noqa: E402
+
+
+def make_workbook(path: Path, years):
+    """Standard-Layout mit Jahreszahlen als Zahl-Zellen im Header."""
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Tab"
+    ws.cell(1, 1, "Wissensbilanz Kennzahl")
+    for col, value in enumerate(["Universitaet", "Universitaet (Codex)"] + list(years), 1):
+        ws.cell(5, col, value)
+    ws.cell(6, 1, "Universitaet Wien")
+    ws.cell(6, 2, "UA")
+    for i, year in enumerate(years):
+        ws.cell(6, 3 + i, year * 10)
+    wb.save(path)
+
+
+def test_header_years_swapped(tmp_path):
+    data_dir = tmp_path / "data"
+    output_dir = tmp_path / "json"
+    data_dir.mkdir()
+    output_dir.mkdir()
+    source = data_dir / "2-A-5 Anzahl Studierenden.xlsx"
+
+    make_workbook(source, [2020, 2021, 2022, 2023])
+    first = convert.convert_file(source, output_dir, "2-A-5")
+    assert first["years"] == [2020, 2021, 2022, 2023]
+
+    make_workbook(source, [2021, 2022, 2023, 2024])
+    second = convert.convert_file(source, output_dir, "2-A-5")
+    assert second["years"] == [2021, 2022, 2023, 2024]
+    assert not second.get("layout_cached")
+
+    with open(output_dir / "2-A-5.json", encoding="utf-8") as f:
+        points = json.load(f)
+    assert {(p["year"], p["value"]) for p in points if p["uniCode"] == "UA"} == \
+        {(year, year * 10) for year in [2021, 2022, 2023, 2024]}